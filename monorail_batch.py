@@ -0,0 +1,326 @@
+import argparse
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
+import numpy as np
+import pandas as pd
+import monorail_beam_app_module as mba_mod
+from monorail_beam import disk_cache, material_prop, sections_db
+from monorail_beam.utils import code_sha256
+
+
+CHECKS = ("Bending", "Shear", "Deflection", "Flange", "Web")
+RESULTS_COLUMNS = [
+    "Entry", "Project No", "Project Name", "Beam Name", "Section Size", "Steel Grade", "Status",
+    "Max Utilisation", "Governing", "Governing At", *CHECKS, "Error", "Fingerprint"
+]
+# App inputs that do not affect the checks, so are left out of the fingerprints
+UNCHECKED_INPUTS = ("Project Details", "Load Position", "Supports", "Total Length")
+# CSV register columns that hold text which could otherwise be read as numbers
+TEXT_COLUMNS = (
+    "Project Details.Project No", "Project Details.Project Name", "Project Details.Beam Name",
+    "Steel Data.Section Size", "Steel Data.Steel Grade"
+)
+
+
+def verify_register(
+        register: list[dict],
+        cf_bf: float=0.9,
+        K_L: float=1.3,
+        wheel_stress: bool=False,
+        max_workers: Optional[int]=None,
+        previous: Optional[pd.DataFrame]=None
+) -> pd.DataFrame:
+    """
+    Returns a DataFrame of the design check results of every monorail in
+    'register', with one row per monorail in register order (see
+    'verify_monorail' for the columns). The monorails are verified in
+    parallel in a process pool.
+
+    Each row holds the fingerprint of the monorail (see
+    'monorail_fingerprint'). Monorails with the same fingerprint as a row of
+    the 'previous' results reuse its results and only the others are
+    verified, so a register is re-verified after a change to the sections
+    catalog, the material properties or the design rules by recalculating the
+    monorails the change affects. Previous errors are always recalculated.
+
+    Args:
+        register: List of the app inputs of each monorail, in the schema of
+            the 'inputs' dict of the app (see 'read_register').
+        cf_bf: Ratio of C_F / B_F of the wheel loading on the flange.
+        K_L: Load position factor.
+        wheel_stress: If True, the local checks adopt the DLS bending stress
+            under the wheels for each hoist position.
+        max_workers: The number of worker processes. Defaults to the number of
+            processors.
+        previous: Optional DataFrame of earlier results of 'verify_register',
+            e.g. as read by 'read_results'.
+
+    """
+    fingerprints = [monorail_fingerprint(app_inputs, cf_bf, K_L, wheel_stress) for app_inputs in register]
+    reusable = {}
+    if previous is not None and "Fingerprint" in previous:
+        previous = previous.loc[previous["Status"] != "ERROR"]
+        reusable = {row["Fingerprint"]: row for row in previous.to_dict(orient="records")}
+    rows = [None] * len(register)
+    for entry, (app_inputs, fingerprint) in enumerate(zip(register, fingerprints)):
+        if fingerprint in reusable:
+            rows[entry] = _reused_row(reusable[fingerprint], app_inputs, entry)
+    entries = [entry for entry, row in enumerate(rows) if row is None]
+
+    if len(entries) != 0:
+        max_workers = min(max_workers or os.cpu_count() or 1, len(entries))
+        # Each worker is sent a few monorails at a time to limit the overhead of
+        # the pool, while keeping the workers busy to the end of the register
+        chunksize = max(1, math.ceil(len(entries) / (4 * max_workers)))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                verify_monorail,
+                [register[entry] for entry in entries],
+                [cf_bf] * len(entries),
+                [K_L] * len(entries),
+                [wheel_stress] * len(entries),
+                entries,
+                chunksize=chunksize
+            )
+            for entry, row in zip(entries, results):
+                rows[entry] = row
+    for row, fingerprint in zip(rows, fingerprints):
+        row["Fingerprint"] = fingerprint
+    return pd.DataFrame(rows, columns=RESULTS_COLUMNS)
+
+
+def monorail_fingerprint(app_inputs: dict, cf_bf: float=0.9, K_L: float=1.3, wheel_stress: bool=False) -> str:
+    """
+    Returns the SHA-256 fingerprint of everything the checks of the monorail
+    'app_inputs' depend on: the inputs (other than UNCHECKED_INPUTS), the
+    check options, the sections catalog row of the section and the versions
+    of the material properties and the design rules (see 'rule_versions').
+
+    Only the catalog row of the section is fingerprinted, so a change to the
+    catalog only changes the fingerprints of the monorails of the sections
+    that changed.
+    """
+    app_inputs = _complete_inputs(app_inputs, 0)
+    checked_inputs = {key: val for key, val in app_inputs.items() if key not in UNCHECKED_INPUTS}
+    designation = app_inputs.get("Steel Data", {}).get("Section Size")
+    return disk_cache.cache_key(
+        "monorail_batch",
+        (checked_inputs, [cf_bf, K_L, wheel_stress], _catalog_row(designation), rule_versions())
+    )
+
+
+@lru_cache(maxsize=None)
+def rule_versions() -> dict:
+    """
+    Returns a dict of the SHA-256 hashes of the code of the material
+    properties and of the design rules and checks (see
+    'mba_mod.check_rules_sha256'). Changes to comments and docstrings do not
+    change the hashes.
+    """
+    return {
+        "material_prop": code_sha256(material_prop),
+        "design_rules": mba_mod.check_rules_sha256()
+    }
+
+
+def verify_monorail(
+        app_inputs: dict,
+        cf_bf: float=0.9,
+        K_L: float=1.3,
+        wheel_stress: bool=False,
+        entry: int=0
+) -> dict:
+    """
+    Returns a dict of the results of the bending, shear, deflection and local
+    flange/web checks of the monorail 'app_inputs' (see
+    'mba_mod.utilisation_envelope'). Any error raised by the checks (e.g. an
+    unknown section) is recorded in the results rather than raised, so one bad
+    entry does not stop the verification of a register.
+
+    The dict is keyed in the following format:
+        {
+            "Entry": , "Project No": , "Project Name": , "Beam Name": ,
+            "Section Size": , "Steel Grade": ,
+            "Status": "PASS" | "FAIL" | "ERROR",
+            "Max Utilisation": , "Governing": , "Governing At": (m),
+            "Bending": , "Shear": , "Deflection": , "Flange": , "Web": ,
+            "Error": None | str
+        }
+    """
+    app_inputs = _complete_inputs(app_inputs, entry)
+    project = app_inputs["Project Details"]
+    steel_data = app_inputs.get("Steel Data", {})
+    row = {
+        "Entry": entry,
+        "Project No": project.get("Project No", ""),
+        "Project Name": project.get("Project Name", ""),
+        "Beam Name": project["Beam Name"],
+        "Section Size": steel_data.get("Section Size"),
+        "Steel Grade": steel_data.get("Steel Grade"),
+        "Error": None
+    }
+    try:
+        static_results, env_results, sb_data = mba_mod.run_analysis(app_inputs)
+        envelope = mba_mod.utilisation_envelope(app_inputs, sb_data, env_results, cf_bf, K_L, wheel_stress)
+    except Exception as err:
+        return dict(row, **{"Status": "ERROR", "Error": f"{type(err).__name__}: {err}"})
+    governing = envelope["Governing"]
+    row.update({check: float(governing[check]["val"]) for check in CHECKS})
+    check = max(CHECKS, key=lambda name: row[name])
+    row.update({
+        "Status": "PASS" if row[check] <= 1.0 else "FAIL",
+        "Max Utilisation": row[check],
+        "Governing": check,
+        "Governing At": float(governing[check]["at"])
+    })
+    return row
+
+
+def read_register(register_path: str) -> list[dict]:
+    """
+    Returns the list of the app inputs of each monorail in the register file
+    'register_path'.
+
+    A '.json' register is a list of dicts in the schema of the 'inputs' dict
+    of the app. Each row of a '.csv' register is one monorail, with the nested
+    keys of the inputs joined by '.' in the column names (e.g.
+    'Steel Data.Section Size' or 'Geometry.Span 1.Restraint'). Empty cells are
+    omitted, so monorails with fewer segments leave the columns of the other
+    segments empty.
+    """
+    register_path = Path(register_path)
+    if register_path.suffix == ".json":
+        register = json.loads(register_path.read_text())
+        if not isinstance(register, list):
+            raise ValueError(f"The register '{register_path}' must be a list of monorail inputs.")
+        return register
+
+    df = pd.read_csv(register_path, dtype={column: str for column in TEXT_COLUMNS}, float_precision="round_trip")
+    register = []
+    for record in df.to_dict(orient="records"):
+        app_inputs = {}
+        for column, value in record.items():
+            if pd.isna(value):
+                continue
+            *parents, key = column.split(".")
+            node = app_inputs
+            for parent in parents:
+                node = node.setdefault(parent, {})
+            node[key] = _python_value(value)
+        register.append(app_inputs)
+    return register
+
+
+def read_results(results_path: str) -> Optional[pd.DataFrame]:
+    """
+    Returns the DataFrame of the results written by 'write_results' to
+    'results_path', or None if the file does not exist.
+    """
+    results_path = Path(results_path)
+    if not results_path.exists():
+        return None
+    text_columns = dict({column.split(".")[-1]: str for column in TEXT_COLUMNS}, Fingerprint=str)
+    if results_path.suffix == ".json":
+        return pd.read_json(results_path, orient="records", dtype=text_columns)
+    return pd.read_csv(results_path, dtype=text_columns, float_precision="round_trip")
+
+
+def write_results(results: pd.DataFrame, output_path: str) -> Path:
+    """
+    Writes the 'results' of 'verify_register' to 'output_path' as JSON records
+    if it ends with '.json', otherwise as CSV. Returns the path.
+    """
+    output_path = Path(output_path)
+    if output_path.suffix == ".json":
+        results.to_json(output_path, orient="records", indent=2, double_precision=15)
+    else:
+        results.to_csv(output_path, index=False)
+    return output_path
+
+
+def _complete_inputs(app_inputs: dict, entry: int) -> dict:
+    """
+    Returns a copy of 'app_inputs' with the defaults of the inputs that do not
+    affect the checks: the project details, the hoist position of the static
+    analysis and the cantilever flags.
+    """
+    app_inputs = dict(app_inputs)
+    app_inputs["Project Details"] = dict(
+        {"Project No": "", "Project Name": "", "Beam Name": f"Entry {entry}"},
+        **app_inputs.get("Project Details", {})
+    )
+    app_inputs.setdefault("Load Position", 0.0)
+    app_inputs.setdefault("Cantilever", False)
+    app_inputs.setdefault("Left Cantilever", False)
+    return app_inputs
+
+
+def _reused_row(previous_row: dict, app_inputs: dict, entry: int) -> dict:
+    """
+    Returns the results row of a monorail from its 'previous_row', with the
+    entry number and project details of the current register.
+    """
+    project = _complete_inputs(app_inputs, entry)["Project Details"]
+    row = {column: _python_value(val) for column, val in previous_row.items() if column in RESULTS_COLUMNS}
+    row.update({
+        "Entry": entry,
+        "Project No": project.get("Project No", ""),
+        "Project Name": project.get("Project Name", ""),
+        "Beam Name": project["Beam Name"],
+        "Error": None
+    })
+    return row
+
+
+@lru_cache(maxsize=None)
+def _catalog_row(designation: Optional[str]) -> Optional[dict]:
+    """
+    Returns the sections catalog row of the section 'designation', or None if
+    it is not in the catalog.
+    """
+    catalog = sections_db.sections_catalog()
+    if designation not in catalog.index:
+        return None
+    return {key: _python_value(val) for key, val in catalog.section(designation).items()}
+
+
+def _python_value(value: Any) -> Any:
+    """
+    Returns the Python value of a NumPy scalar read from a CSV register.
+    """
+    return value.item() if isinstance(value, np.generic) else value
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Verifies every monorail beam of a register.")
+    parser.add_argument("register_path", help="The '.csv' or '.json' register of monorail inputs.")
+    parser.add_argument("output_path", help="The '.csv' or '.json' file the results are written to.")
+    parser.add_argument("--cf-bf", type=float, default=0.9, help="Ratio of C_F / B_F of the wheel loading.")
+    parser.add_argument("--K-L", type=float, default=1.3, help="Load position factor.")
+    parser.add_argument("--wheel-stress", action="store_true", help="Adopt the bending stress under the wheels.")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument(
+        "--recompute-all", action="store_true",
+        help="Verify every monorail, rather than reusing the unchanged results of an existing output file."
+    )
+    args = parser.parse_args()
+    previous = None if args.recompute_all else read_results(args.output_path)
+    results = verify_register(
+        read_register(args.register_path),
+        cf_bf=args.cf_bf,
+        K_L=args.K_L,
+        wheel_stress=args.wheel_stress,
+        max_workers=args.workers,
+        previous=previous
+    )
+    write_results(results, args.output_path)
+    counts = results["Status"].value_counts()
+    print(", ".join(f"{counts.get(status, 0)} {status}" for status in ("PASS", "FAIL", "ERROR")))
+    if previous is not None:
+        reused = results["Fingerprint"].isin(previous.loc[previous["Status"] != "ERROR", "Fingerprint"]).sum()
+        print(f"{len(results) - reused} verified, {reused} unchanged")
@@ -2,7 +2,9 @@
 Package for the structural verification of a monorail beam.
 """
 
-from .beam_design import (SteelBeam, bending_eff_length, create_steelbeam, 
-                          eff_section_modulus, element_slenderness, 
-                          member_moment_cap, moment_mod_factor,  
-                          section_moment_cap, section_slenderness)
\ No newline at end of file
+from .beam_design import (SteelBeam, bending_eff_length, catalog_capacities,
+                          create_steelbeam, eff_section_modulus,
+                          elastic_buckling_moment, element_slenderness,
+                          member_moment_cap, moment_mod_factor,
+                          section_moment_cap, section_slenderness,
+                          slenderness_reduction_factor)
\ No newline at end of file
@@ -1,7 +1,7 @@
 import math
 import pycba as cba
 import numpy as np
-from monorail_beam import utils
+from monorail_beam.influence_lines import InfluenceLines, load_increment, locate_load_pos, span_ends
 
 
 def find_load_pos_for_PyCBA(load_pos: float, spans: list) -> int:
@@ -17,27 +17,9 @@ def find_load_pos_for_PyCBA(load_pos: float, spans: list) -> int:
         Span index
 
     """
-    list_len = len(spans)
-    rnd_load_pos = utils.round_down(load_pos, 4)
-    for idx, seg in enumerate(spans):
-        if idx == 0:
-            if (seg - rnd_load_pos) >= 0:
-                span_idx = 1
-                break
-            else:
-                cum_sum = seg
-                continue
-        elif idx == (list_len - 1):
-            span_idx = list_len
-            break
-        else:
-            if (seg + cum_sum - rnd_load_pos) >= 0:
-                span_idx = 1 + idx
-                print(f"idx {idx}")
-                break
-            else:
-                cum_sum = seg + cum_sum
-    return span_idx
+    span_idx, _ = locate_load_pos(load_pos, span_ends(spans))
+    return int(span_idx)
+
 
 def static_beam_model(beam_model_data: dict, G_load: float, Q_load: float, Q_load_pos: float, n_points: int=1000) -> list:
     """
@@ -77,12 +59,11 @@ def static_beam_model(beam_model_data: dict, G_load: float, Q_load: float, Q_loa
     R = beam_model_data['R']
 
     # Determines the load position index to be compatible with PyCBA
-    span_idx = find_load_pos_for_PyCBA(Q_load_pos, L)
-    a_dist = Q_load_pos - sum(L[:(span_idx - 1)])
+    span_idx, a_dist = locate_load_pos(Q_load_pos, span_ends(L))
 
     # Applies loads and runs the analysis
     LM_G = G_load
-    LM_Q = [[span_idx,2,Q_load,a_dist,0]]
+    LM_Q = [[int(span_idx),2,Q_load,float(a_dist),0]]
     LM_C = LM_G + LM_Q
     beam_model = cba.BeamAnalysis(L, EI, R, LM_C)
     beam_model.analyze(n_points)
@@ -153,11 +134,7 @@ def env_beam_model(beam_model_data: dict, G_load: float, Q_load: float, n_points
     beam_model = cba.BeamAnalysis(L, EI, R, LM_G)
     beam_model.analyze(n_points)
 
-    # Adjusts the load incrementing if the cantilever length is less than 100mm
-    if L[-1] <= 0.1:
-        inc = 0.01
-    else:
-        inc = 0.05
+    inc = load_increment(L)
 
     load_spacing = [] # Empty list for hoist loads
     axle_loads = [Q_load]
@@ -179,4 +156,73 @@ def env_beam_model(beam_model_data: dict, G_load: float, Q_load: float, n_points
             "Critical Values": bridge_model.critical_values(results_env)
         }
     )
-    return results_output    
\ No newline at end of file
+    return results_output
+
+
+def create_influence_lines(beam_model_data: dict, n_points: int=1000) -> InfluenceLines:
+    """
+    Returns an InfluenceLines object holding the unit hoist load responses
+    for the beam geometry and stiffness in 'beam_model_data'. The object may be
+    reused for any number of load cases on the same beam.
+
+    Args:
+        beam_model_data: A dict containing the relevant information required
+            by PyCBA to build an analysis model.
+        n_points: The number of evaluation points along a member for load 
+            effects.
+
+    Returns:
+        InfluenceLines
+
+    """
+    L = beam_model_data['L']
+    il = InfluenceLines(L, beam_model_data['EI'], beam_model_data['R'], n_points, load_increment(L))
+    return il
+
+
+def il_env_beam_model(
+        beam_model_data: dict, 
+        G_load: float, 
+        Q_load: float, 
+        n_points: int=1000, 
+        il: InfluenceLines=None
+) -> dict:
+    """
+    Returns a dictionary of matrixes and critical values from an enveloped
+    moving load analysis, built by superposition of unit hoist load influence
+    lines rather than by re-analysing the beam at every load position.
+
+    Args:
+        beam_model_data: A dict containing the relevant information required
+            by PyCBA to build an analysis model.
+        G_load: Dead load (kN)
+        Q_load: Live load (kN)
+        n_points: The number of evaluation points along a member for load 
+            effects.
+        il: Pre-computed influence lines for the same beam. If not provided,
+            the influence lines are created from 'beam_model_data'.
+
+    Returns:
+        A dict of matrixes and critical values results in the same format as
+        env_beam_model, with the addition of the deflection envelopes. For
+        example:
+        {
+            "Matrixes": {
+                "Mmax": np.array,
+                "Mmin": np.array,
+                "Vmax": np.array,
+                "Vmin": np.array,
+                "Dmax": np.array,
+                "Dmin": np.array,
+                "x_dist": np.array
+            },
+            "Critical Values": {
+
+            }
+        }
+
+    """
+    if il is None:
+        il = create_influence_lines(beam_model_data, n_points)
+    results_output = il.envelope(G_load, Q_load)
+    return results_output
@@ -1,12 +1,14 @@
-from typing import Optional
+from typing import Callable, Iterable, Optional
+import numpy as np
 import pandas as pd
-from dataclasses import dataclass
-from math import pi, sqrt
+from dataclasses import dataclass, field
+from math import pi
 from .material_prop import plate_yield_stress, plate_tensile_strength
+from . import tracing
 from .utils import str_to_float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Beam:
     """
     A data type to represent the geometric, plastic, and warping
@@ -26,15 +28,19 @@ class Beam:
     I_w: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SteelBeam(Beam):
     """
     A data type to represent a steel I-Section beam with capacities
-    calculated in accordance with AS 4100:2020(+A1).
+    calculated in accordance with AS 4100:2020(+A1). The beam is immutable and
+    each derived property that does not depend on the effective length (e.g.
+    yield stresses, section slenderness, section moment capacities) is only
+    calculated on its first use.
 
     Attributes:
-        beam_tag: a unique identifier representing the name of the beam
-            on a drawing or in structural calculations.
+        beam_tag: an identifier of the beam, e.g. the name of the beam on
+            a drawing or in structural calculations, or the section
+            designation of a beam shared between designs.
         d: depth of section (mm)
         b_f: flange width (mm)
         t_f: flange thickness (mm)
@@ -55,10 +61,22 @@ class SteelBeam(Beam):
     r_1: float
     mass: float
     steel_grade: str
-    phi: float=0.9,
+    phi: float=0.9
     resi_stress_cat: str="HR"
     E: float=200000
     G: float=80000
+    _cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def _cached(self, key, calc: Callable):
+        """
+        Returns the derived property 'key', calculating it with 'calc' on the
+        first call.
+        """
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = calc()
+            return value
 
     def yield_stress_flg(self):
         """
@@ -66,12 +84,10 @@ class SteelBeam(Beam):
         Table 2.1 with respect to the steel grade, plate thickness, and 
         residual stress category.
         """
-        f_yf = plate_yield_stress(
-            self.steel_grade, 
-            self.t_f,
-            self.resi_stress_cat
+        return self._cached(
+            "f_yf",
+            lambda: plate_yield_stress(self.steel_grade, self.t_f, self.resi_stress_cat)
         )
-        return f_yf
 
     def yield_stress_web(self):
         """
@@ -79,12 +95,10 @@ class SteelBeam(Beam):
         Table 2.1 with respect to the steel grade, plate thickness, and 
         residual stress category.
         """
-        f_yw = plate_yield_stress(
-            self.steel_grade, 
-            self.t_w,
-            self.resi_stress_cat
+        return self._cached(
+            "f_yw",
+            lambda: plate_yield_stress(self.steel_grade, self.t_w, self.resi_stress_cat)
         )
-        return f_yw
 
     def tensile_strength(self):
         """
@@ -92,66 +106,102 @@ class SteelBeam(Beam):
         AS 4100:2020(+A1) Table 2.1 with respect to the steel grade and 
         residual stress category.
         """
-        f_u = plate_tensile_strength(
-            self.steel_grade, 
-            self.resi_stress_cat
+        return self._cached(
+            "f_u",
+            lambda: plate_tensile_strength(self.steel_grade, self.resi_stress_cat)
+        )
+
+    def section_slenderness(self, axis: str='x') -> tuple[float, float, float]:
+        """
+        Returns the section slenderness (lamb_s, lamb_sy, lamb_sp) for bending
+        about the local 'axis' ('x' or 'y').
+        """
+        return self._cached(
+            ("lamb_s", axis),
+            lambda: section_slenderness(
+                (self.b_f - self.t_w) / 2,
+                self.t_f,
+                self.yield_stress_flg(),
+                self.d - 2 * self.t_f,
+                self.t_w,
+                self.yield_stress_web(),
+                self.resi_stress_cat,
+                axis
+            )
+        )
+
+    def eff_section_modulus(self, axis: str='x') -> float:
+        """
+        Returns the effective section modulus for bending about the local
+        'axis' ('x' or 'y').
+        """
+        S, Z = (self.S_x, self.Z_x) if axis == 'x' else (self.S_y, self.Z_y)
+        return self._cached(
+            ("Z_e", axis),
+            lambda: eff_section_modulus(S, Z, *self.section_slenderness(axis))
         )
-        return f_u
 
     def section_moment_capacity_x(self):
         """
-        Returns the nominal section moment capacity for bending about
+        Returns the factored section moment capacity for bending about
         the local x-axis (strong axis).
 
         """
-        flg_outstand_width = (self.b_f - self.t_w) / 2
-        web_clear_depth = (self.d - 2 * self.t_f)
-
-        lamb_s, lamb_sy, lamb_sp = section_slenderness(
-            flg_outstand_width,
-            self.t_f,
-            self.yield_stress_flg(),
-            web_clear_depth,
-            self.t_w,
-            self.yield_stress_web(),
-            self.resi_stress_cat,
-            'x'
-        )
-        f_y = min(self.yield_stress_flg(), self.yield_stress_web())
-        print(f"f_y = {f_y}")
-        Z_ex = eff_section_modulus(self.S_x, self.Z_x, lamb_s, lamb_sy, lamb_sp)
-        print(f"Z_ex = {Z_ex}")
-        M_sx = section_moment_cap(Z_e=Z_ex, f_y=f_y)
-        return M_sx
+        return self._cached("M_sx", lambda: self._section_moment_capacity('x'))
     
     def section_moment_capacity_y(self):
         """
-        Returns the nominal section moment capacity for bending about
+        Returns the factored section moment capacity for bending about
         the local y-axis (weak axis).
 
         """
-        flg_outstand_width = (self.b_f - self.t_w) / 2
-        web_clear_depth = (self.d - 2 * self.t_f)
-
-        print(f"Flange Outstand Width {flg_outstand_width}")
-        print(f"Web Clear Depth {web_clear_depth}")
-
-        lamb_s, lamb_sy, lamb_sp = section_slenderness(
-            flg_outstand_width,
-            self.t_f,
-            self.yield_stress_flg(),
-            web_clear_depth,
-            self.t_w,
-            self.yield_stress_web(),
-            self.resi_stress_cat,
-            'y'
-        )
+        return self._cached("M_sy", lambda: self._section_moment_capacity('y'))
 
+    def _section_moment_capacity(self, axis: str) -> float:
+        """
+        Returns the factored section moment capacity for bending about the
+        local 'axis'.
+        """
+        tracing.record("flg_outstand_width", (self.b_f - self.t_w) / 2)
+        tracing.record("web_clear_depth", self.d - 2 * self.t_f)
         f_y = min(self.yield_stress_flg(), self.yield_stress_web())
-        Z_ey = eff_section_modulus(self.S_y, self.Z_y, lamb_s, lamb_sy, lamb_sp)
-        print(f"Z_ey = {Z_ey}")
-        M_sy = section_moment_cap(Z_e=Z_ey, f_y=f_y)
-        return M_sy
+        tracing.record("f_y", f_y)
+        Z_e = self.eff_section_modulus(axis)
+        tracing.record(f"Z_e{axis}", Z_e)
+        M_s = section_moment_cap(Z_e=Z_e, f_y=f_y, phi=self.phi)
+        return M_s
+
+    def elastic_buckling_moment(self, l_e: float) -> float:
+        """
+        Returns the elastic buckling moment M_o for a bending effective length
+        'l_e' (mm). M_o is not cached, as it is cheap to calculate and the
+        effective lengths of a shared beam are unbounded.
+        """
+        return elastic_buckling_moment(l_e, self.I_y, self.I_w, self.J, self.E, self.G)
+
+    def member_moment_capacity_x(self, l_e: float, alpha_m: float=1.0) -> float:
+        """
+        Returns the factored member moment capacity for bending about the
+        local x-axis for a bending effective length 'l_e' (mm) and moment
+        modification factor 'alpha_m', which may be an array.
+        """
+        M_sx = self.section_moment_capacity_x() / self.phi
+        alpha_s = slenderness_reduction_factor(M_sx, self.elastic_buckling_moment(l_e))
+        M_bx = self.phi * np.minimum(alpha_m * alpha_s * M_sx, M_sx)
+        return M_bx
+
+    def shear_capacity(self) -> float:
+        """
+        Returns the factored shear capacity of the unstiffened web. The web
+        area is the full section depth for hot-rolled sections and the clear
+        depth between flanges for welded sections.
+        """
+        d_1 = self.d - 2 * self.t_f
+        A_w = (self.d if self.resi_stress_cat == "HR" else d_1) * self.t_w
+        return self._cached(
+            "V_v",
+            lambda: web_shear_cap(d_1, self.t_w, self.yield_stress_web(), A_w, self.phi)
+        )
 
 
 def element_slenderness(b: float, t:float, f_y: float) -> float:
@@ -171,7 +221,7 @@ def element_slenderness(b: float, t:float, f_y: float) -> float:
 
     """
     lamb_e = b / t * (f_y / 250) ** 0.5
-    print(f"lambda_e = {lamb_e}")
+    tracing.record("lambda_e", lamb_e)
     return lamb_e
 
 
@@ -236,12 +286,12 @@ def section_slenderness(
 
     lamb_e_flg = element_slenderness(flg_outstand_width, flg_thickness, flg_yield)
     flg_ratio = lamb_e_flg / lamb_ey_flg
-    print(f"Flange lambda_e Ratio = {flg_ratio}")
+    tracing.record("flg_ratio", flg_ratio)
 
     if axis == 'x':
         lamb_e_web = element_slenderness(web_clear_depth, web_thickness, web_yield)
         web_ratio = lamb_e_web / lamb_ey_web 
-        print(f"Web lambda_e Ratio = {web_ratio}")
+        tracing.record("web_ratio", web_ratio)
         if flg_ratio >= web_ratio:
             lamb_s = lamb_e_flg
             lamb_sy = lamb_ey_flg
@@ -274,7 +324,9 @@ def eff_section_modulus(S: float, Z: float, lamb_s: float, lamb_sy: float, lamb_
         float
 
     """
-    print(f"lambda_s = {lamb_s}, lambda_sp = {lamb_sp}, lambda_sy = {lamb_sy}")
+    tracing.record("lambda_s", lamb_s)
+    tracing.record("lambda_sp", lamb_sp)
+    tracing.record("lambda_sy", lamb_sy)
     if lamb_s <= lamb_sp:
         Z_e = min(S, 1.5 * Z)
     elif lamb_s <= lamb_sy:
@@ -309,6 +361,34 @@ def section_moment_cap(Z_e: float, f_y: float, phi: float=0.9) -> float:
     return M_s
 
 
+def web_shear_cap(d_p: float, t_w: float, f_y: float, A_w: float, phi: float=0.9) -> float:
+    """
+    Calculates the factored shear capacity of an unstiffened web with a
+    uniform shear stress distribution, calculated in accordance with
+    AS 4100:2020(+A1) Clause 5.11.2, 5.11.4 and 5.11.5.1.
+
+    Args:
+        d_p: Clear depth of the web panel.
+        t_w: Web thickness.
+        f_y: Yield stress of the web.
+        A_w: Gross sectional area of the web.
+        phi: Material resistance factor (the default=0.9).
+
+    Returns:
+        Factored shear capacity.
+
+    Notes:
+      * Shear yielding governs for a web slenderness of up to 82, otherwise
+        the shear buckling capacity of Clause 5.11.5.1 is adopted.
+
+    """
+    web_slenderness = d_p / t_w * np.sqrt(f_y / 250)
+    V_w = 0.6 * f_y * A_w
+    alpha_v = np.minimum((82 / web_slenderness) ** 2, 1.0)
+    V_v = phi * alpha_v * V_w
+    return V_v
+
+
 def bending_eff_length(
         l_seg: float, 
         d_1: float, 
@@ -389,8 +469,11 @@ def moment_mod_factor(M_m: float, M_2: float, M_3: float, M_4: float)-> float:
     Returns:
         Moment modification factor
 
+    Notes:
+      * The inputs may be NumPy arrays (e.g. one value per hoist position),
+        in which case an array of moment modification factors is returned.
     """
-    alpha_m = min(1.7 * M_m / (M_2 ** 2 + M_3 **2 + M_4 **2), 2.5)
+    alpha_m = np.minimum(1.7 * np.abs(M_m) / np.sqrt(M_2 ** 2 + M_3 ** 2 + M_4 ** 2), 2.5)
     return alpha_m
 
 
@@ -411,7 +494,8 @@ def member_moment_cap(M_sx: float, l_e: float, I_y: float, I_w: float, J: float,
         phi: Material resistance factor (the default=0.9).
 
     Returns:
-        Factored member moment capacity.
+        Factored member moment capacity, limited to the factored section
+        moment capacity.
 
     Notes:
       * It is assumed that the input nominal section moment capacity has not 
@@ -419,13 +503,53 @@ def member_moment_cap(M_sx: float, l_e: float, I_y: float, I_w: float, J: float,
       * This function does not assume units. The user is responsible for
         ensuring that consistent units are being used for the results to be
         valid.
+      * All of the inputs may be NumPy arrays of a common shape, in which
+        case the member moment capacity of each element is returned.
     """
-    M_o = sqrt(((pi ** 2 * E * I_y) / l_e ** 2) * (G * J + ((pi ** 2 * E * I_w) / l_e ** 2)))
-    alpha_s = 0.6 * (sqrt((M_sx / M_o) ** 2 + 3) - M_sx / M_o)
-    M_bx = phi * alpha_m * alpha_s * M_sx
+    M_o = elastic_buckling_moment(l_e, I_y, I_w, J, E, G)
+    alpha_s = slenderness_reduction_factor(M_sx, M_o)
+    M_bx = phi * np.minimum(alpha_m * alpha_s * M_sx, M_sx)
     return M_bx
 
 
+def elastic_buckling_moment(l_e: float, I_y: float, I_w: float, J: float, E: float, G: float) -> float:
+    """
+    Calculates the elastic buckling moment 'M_o' of a segment, calculated in
+    accordance with AS4100:2020(+A1) Clause 5.6.1.1.
+
+    Args:
+        l_e: Bending effective length for the segment under consideration.
+        I_y: Second moment of area about the minor principal y-axis.
+        I_w: Warping constant.
+        J: Torsion constant.
+        E: Modulus of elasticity.
+        G: Shear modulus of elasticity.
+
+    Returns:
+        Elastic buckling moment.
+
+    """
+    M_o = np.sqrt(((pi ** 2 * E * I_y) / l_e ** 2) * (G * J + ((pi ** 2 * E * I_w) / l_e ** 2)))
+    return M_o
+
+
+def slenderness_reduction_factor(M_s: float, M_o: float) -> float:
+    """
+    Calculates the slenderness reduction factor 'alpha_s', calculated in
+    accordance with AS4100:2020(+A1) Clause 5.6.1.1.
+
+    Args:
+        M_s: Nominal section moment capacity.
+        M_o: Elastic buckling moment.
+
+    Returns:
+        Slenderness reduction factor.
+
+    """
+    alpha_s = 0.6 * (np.sqrt((M_s / M_o) ** 2 + 3) - M_s / M_o)
+    return alpha_s
+
+
 def create_steelbeam(
         beam_prop: pd.Series,
         steel_grade: str,
@@ -433,7 +557,8 @@ def create_steelbeam(
 ) -> SteelBeam:
     """
     Returns a Steel_I_Beam dataclass, populated with the data stored in
-    a Pandas series 'beam_prop'.
+    a Pandas series 'beam_prop'. A ValueError is raised if the section is not
+    produced in 'steel_grade'.
     """
     pd.to_numeric(beam_prop, 'ignore')
     sb = SteelBeam(
@@ -458,6 +583,159 @@ def create_steelbeam(
         steel_grade=steel_grade,
         resi_stress_cat=beam_prop['Class']
     )
+    # The yield stresses are NaN where the steel grade is not produced for the
+    # residual stress category or the plate thicknesses of the section
+    if np.isnan(sb.yield_stress_flg()) or np.isnan(sb.yield_stress_web()):
+        raise ValueError(
+            f"The steel grade '{steel_grade}' is not produced for the section '{beam_prop['Designation']}'!"
+        )
     return sb
 
 
+# Slenderness limits (lamb_ey_flg, lamb_ep_flg, lamb_ey_web, lamb_ep_web) of
+# AS 4100:2020(+A1) Table 5.2, keyed on the residual stress category and axis
+SLENDERNESS_LIMITS = {
+    ("HR", "x"): (16, 9, 115, 82),
+    ("HR", "y"): (25, 9, np.nan, np.nan),
+    ("HW", "x"): (14, 8, 115, 82),
+    ("HW", "y"): (22, 8, np.nan, np.nan),
+    ("LW", "x"): (15, 8, 115, 82),
+    ("LW", "y"): (22, 8, np.nan, np.nan),
+}
+
+
+def catalog_capacities(
+        sections_df: pd.DataFrame,
+        steel_grades: Iterable[str]=("300",),
+        l_e: Iterable[float]=(),
+        alpha_m: float=1.0,
+        phi: float=0.9,
+        E: float=200000,
+        G: float=80000
+) -> pd.DataFrame:
+    """
+    Calculates the factored section and member moment capacities of every
+    section in 'sections_df' for each steel grade in 'steel_grades', in
+    accordance with AS 4100:2020(+A1) Clause 5.2 and 5.6.1.1. Each capacity
+    is evaluated for the whole table at once as NumPy array operations and
+    agrees with the values calculated for a single SteelBeam.
+
+    Args:
+        sections_df: Pandas DataFrame of section properties with the same
+            columns as the sections database (e.g. 'import_sections_db').
+        steel_grades: The steel grades to evaluate (the default is ('300',)).
+        l_e: Bending effective lengths (mm) to calculate the member moment
+            capacity for (the default is no effective lengths).
+        alpha_m: Moment modification factor (the default=1.0).
+        phi: Material resistance factor (the default=0.9).
+        E: Modulus of elasticity (MPa).
+        G: Shear modulus of elasticity (MPa).
+
+    Returns:
+        Pandas DataFrame with one row per section and steel grade, with the
+        columns 'Designation', 'Class', 'Mass', 'Steel Grade', 'f_y', 'Z_ex',
+        'M_sx', 'Z_ey', 'M_sy' and one 'M_bx_<l_e>' column per effective
+        length. Capacities are in Nmm. Sections that are not produced in a
+        steel grade (e.g. grade '350' welded sections) have NaN capacities.
+
+    """
+    resi_stress_cat = sections_df['Class'].to_numpy()
+    d = sections_df['d'].to_numpy(dtype=float)
+    b_f = sections_df['bf'].to_numpy(dtype=float)
+    t_f = sections_df['tf'].to_numpy(dtype=float)
+    t_w = sections_df['tw'].to_numpy(dtype=float)
+    flg_outstand_width = (b_f - t_w) / 2
+    web_clear_depth = d - 2 * t_f
+
+    tables = []
+    for steel_grade in steel_grades:
+        f_yf = plate_yield_stress(steel_grade, t_f, resi_stress_cat)
+        f_yw = plate_yield_stress(steel_grade, t_w, resi_stress_cat)
+        f_y = np.minimum(f_yf, f_yw)
+
+        table = sections_df[['Designation', 'Class', 'Mass']].reset_index(drop=True)
+        table['Steel Grade'] = steel_grade
+        table['f_y'] = f_y
+        for axis, S, Z in (('x', 'Sx', 'Zx'), ('y', 'Sy', 'Zy')):
+            lamb_s, lamb_sy, lamb_sp = _catalog_slenderness(
+                flg_outstand_width, t_f, f_yf,
+                web_clear_depth, t_w, f_yw,
+                resi_stress_cat, axis
+            )
+            Z_e = _catalog_eff_section_modulus(
+                sections_df[S].to_numpy(dtype=float),
+                sections_df[Z].to_numpy(dtype=float),
+                lamb_s, lamb_sy, lamb_sp
+            )
+            table[f'Z_e{axis}'] = Z_e
+            table[f'M_s{axis}'] = section_moment_cap(Z_e=Z_e, f_y=f_y, phi=phi)
+
+        unfact_M_sx = table['Z_ex'].to_numpy() * f_y
+        member_caps = {}
+        for length in l_e:
+            member_caps[f'M_bx_{length:g}'] = member_moment_cap(
+                M_sx=unfact_M_sx,
+                l_e=length,
+                I_y=sections_df['Iy'].to_numpy(dtype=float),
+                I_w=sections_df['Iw'].to_numpy(dtype=float),
+                J=sections_df['J'].to_numpy(dtype=float),
+                E=E,
+                G=G,
+                alpha_m=alpha_m,
+                phi=phi
+            )
+        tables.append(pd.concat([table, pd.DataFrame(member_caps, index=table.index)], axis=1))
+    return pd.concat(tables, ignore_index=True)
+
+
+def _catalog_slenderness(
+        flg_outstand_width: np.ndarray,
+        flg_thickness: np.ndarray,
+        flg_yield: np.ndarray,
+        web_clear_depth: np.ndarray,
+        web_thickness: np.ndarray,
+        web_yield: np.ndarray,
+        resi_stress_cat: np.ndarray,
+        axis: str
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the section slenderness arrays (lamb_s, lamb_sy, lamb_sp) of a
+    table of I-Sections, as calculated for a single section by
+    'section_slenderness'.
+    """
+    try:
+        limits = np.array([SLENDERNESS_LIMITS[(cat, axis)] for cat in resi_stress_cat]).reshape(-1, 4)
+    except KeyError:
+        raise KeyError("The residual stress classification shall be either 'HR', 'LW, or 'HW' and the axis either 'x' or 'y'")
+    lamb_ey_flg, lamb_ep_flg, lamb_ey_web, lamb_ep_web = limits.T
+
+    lamb_e_flg = flg_outstand_width / flg_thickness * np.sqrt(flg_yield / 250)
+    if axis == 'y':
+        return lamb_e_flg, lamb_ey_flg, lamb_ep_flg
+
+    lamb_e_web = web_clear_depth / web_thickness * np.sqrt(web_yield / 250)
+    flg_governs = lamb_e_flg / lamb_ey_flg >= lamb_e_web / lamb_ey_web
+    lamb_s = np.where(flg_governs, lamb_e_flg, lamb_e_web)
+    lamb_sy = np.where(flg_governs, lamb_ey_flg, lamb_ey_web)
+    lamb_sp = np.where(flg_governs, lamb_ep_flg, lamb_ep_web)
+    return lamb_s, lamb_sy, lamb_sp
+
+
+def _catalog_eff_section_modulus(
+        S: np.ndarray,
+        Z: np.ndarray,
+        lamb_s: np.ndarray,
+        lamb_sy: np.ndarray,
+        lamb_sp: np.ndarray
+    ) -> np.ndarray:
+    """
+    Returns the effective section modulus array of a table of I-Sections, as
+    calculated for a single section by 'eff_section_modulus'.
+    """
+    Z_c = np.minimum(S, 1.5 * Z)
+    Z_e = np.select(
+        [lamb_s <= lamb_sp, lamb_s <= lamb_sy],
+        [Z_c, Z + (lamb_sy - lamb_s) / (lamb_sy - lamb_sp) * (Z_c - Z)],
+        default=Z * (lamb_sy / lamb_s)
+    )
+    return Z_e
@@ -0,0 +1,468 @@
+import sys
+import numpy as np
+from functools import lru_cache
+from scipy.linalg import cho_solve_banded, cholesky_banded
+from monorail_beam import disk_cache, influence_lines
+from monorail_beam.influence_lines import InfluenceLines, load_increment, select_static_results
+
+
+class ClosedFormInfluenceLines(InfluenceLines):
+    """
+    Influence-line engine for the monorail configurations created by the app,
+    i.e. any number of continuous spans on pinned supports with optional left
+    and right-hand cantilevers. Support moments are found from the three-moment
+    equations, which are tridiagonal and solved with a banded Cholesky
+    factorization so the cost grows linearly with the number of spans. The load
+    effects are evaluated in closed form, vectorized over stations and load
+    cases. PyCBA is not required.
+    """
+    def _assemble(self):
+        """
+        Checks that the restraints describe a supported configuration, sets up
+        the support data and factorizes the three-moment equations.
+        """
+        verticals = self.R[0::2]
+        rotations = self.R[1::2]
+        if any(rot != 0 for rot in rotations):
+            raise ValueError("The closed-form solver only supports rotationally free supports!")
+        if any(vert != -1 for vert in verticals[1:-1]) or any(vert not in (-1, 0) for vert in verticals):
+            raise ValueError(
+                "The closed-form solver only supports pinned supports with optional end cantilevers!"
+            )
+        self.cantilever_left = verticals[0] == 0
+        self.cantilever_right = verticals[-1] == 0
+        self.first_sup = int(self.cantilever_left)
+        self.last_sup = len(self.L) - int(self.cantilever_right)
+        if self.last_sup - self.first_sup < 1:
+            raise ValueError("A cantilever requires at least one supported span!")
+        self.fixed = np.flatnonzero(np.asarray(self.R) == -1)
+
+        # Banded (upper) storage of the flexibility coefficients of the
+        # internal support moments
+        self.flex = np.array(self.L) / self.EI
+        flex = self.flex[self.first_sup:self.last_sup]
+        n_unknown = len(flex) - 1
+        self.A_factor = None
+        if n_unknown > 0:
+            A_banded = np.zeros((2, n_unknown))
+            A_banded[0, 1:] = flex[1:-1] / 6
+            A_banded[1] = (flex[:-1] + flex[1:]) / 3
+            self.A_factor = cholesky_banded(A_banded)
+
+    def _end_forces(
+            self,
+            q: np.ndarray,
+            P: np.ndarray,
+            span_idx: np.ndarray,
+            a_dist: np.ndarray
+    ) -> tuple[list, np.ndarray]:
+        """
+        Returns the member end forces and support reactions for a set of load
+        cases, each comprising a UDL on every span plus a single point load.
+
+        Args:
+            q: Array of shape (n_spans, n_cases) of UDL magnitudes (kN/m).
+            P: Array of point load magnitudes, one per load case (kN).
+            span_idx: Array of 0-based span indexes of the point loads.
+            a_dist: Array of point load positions from the span start (m).
+
+        Returns:
+            tuple(members, R) where 'members' is a list with one tuple of
+            (f, w_ends, q, P, a) per member, as used by 'member_fields', and R
+            has shape (n_cases, n_sup).
+
+        """
+        P = np.asarray(P, dtype=float)
+        n_cases = P.shape[0]
+        n_spans = len(self.L)
+        first, last = self.first_sup, self.last_sup
+
+        # Point loads acting on each member
+        on_span = np.asarray(span_idx)[None, :] == np.arange(n_spans)[:, None]
+        P_mbr = np.where(on_span, P, 0.0)
+        a_mbr = np.where(on_span, a_dist, 0.0)
+        L = np.array(self.L)[:, None]
+        EI = self.EI[:, None]
+        b_mbr = L - a_mbr
+
+        # Simply supported end rotations of the supported spans
+        theta_a = (
+            -P_mbr * b_mbr * (L ** 2 - b_mbr ** 2) / (6 * L * EI)
+            - q * L ** 3 / (24 * EI)
+        )
+        theta_b = (
+            P_mbr * a_mbr * (L ** 2 - a_mbr ** 2) / (6 * L * EI)
+            + q * L ** 3 / (24 * EI)
+        )
+
+        # Support moments, with the cantilever moments known from statics
+        M_sup = np.zeros((n_spans + 1, n_cases))
+        if self.cantilever_left:
+            M_sup[first] = -(P_mbr[0] * b_mbr[0] + q[0] * L[0] ** 2 / 2)
+        if self.cantilever_right:
+            M_sup[last] = -(P_mbr[-1] * a_mbr[-1] + q[-1] * L[-1] ** 2 / 2)
+
+        # Three-moment equations for the internal supports
+        if self.A_factor is not None:
+            rhs = theta_a[first + 1:last] - theta_b[first:last - 1]
+            rhs[0] -= M_sup[first] * self.flex[first] / 6
+            rhs[-1] -= M_sup[last] * self.flex[last - 1] / 6
+            M_sup[first + 1:last] = cho_solve_banded((self.A_factor, False), rhs)
+
+        # Member end forces and end deflections
+        V_a = (M_sup[1:] - M_sup[:-1]) / L + P_mbr * b_mbr / L + q * L / 2
+        V_b = V_a - q * L - P_mbr
+        w_ends = np.zeros((n_spans, 2, n_cases))
+        if self.cantilever_left:
+            theta_sup = (
+                theta_a[first]
+                - M_sup[first] * L[first] / (3 * EI[first])
+                - M_sup[first + 1] * L[first] / (6 * EI[first])
+            )
+            w_ends[0, 0] = (
+                -theta_sup * L[0]
+                - P_mbr[0] * b_mbr[0] ** 2 * (3 * L[0] - b_mbr[0]) / (6 * EI[0])
+                - q[0] * L[0] ** 4 / (8 * EI[0])
+            )
+        if self.cantilever_right:
+            k = last - 1
+            theta_sup = (
+                M_sup[k] * L[k] / (6 * EI[k])
+                + M_sup[k + 1] * L[k] / (3 * EI[k])
+                + theta_b[k]
+            )
+            w_ends[-1, 1] = (
+                theta_sup * L[-1]
+                - P_mbr[-1] * a_mbr[-1] ** 2 * (3 * L[-1] - a_mbr[-1]) / (6 * EI[-1])
+                - q[-1] * L[-1] ** 4 / (8 * EI[-1])
+            )
+
+        members = []
+        for idx in range(n_spans):
+            f = np.array([V_a[idx], -M_sup[idx], np.zeros(n_cases), M_sup[idx + 1]])
+            members.append((f, w_ends[idx], q[idx], P_mbr[idx], a_mbr[idx]))
+
+        # Support reactions from the change in shear across each support
+        V_left = np.vstack([np.zeros(n_cases), V_b])
+        V_right = np.vstack([V_a, np.zeros(n_cases)])
+        Rxn = (V_right - V_left)[first:last + 1].T
+        return members, Rxn
+
+
+def create_influence_lines(beam_model_data: dict, n_points: int=1000) -> ClosedFormInfluenceLines:
+    """
+    Returns a ClosedFormInfluenceLines object holding the unit hoist load
+    responses for the beam geometry and stiffness in 'beam_model_data'.
+
+    Args:
+        beam_model_data: A dict containing the span lengths 'L', flexural
+            rigidity 'EI' and PyCBA restraints 'R' of the beam.
+        n_points: The number of evaluation points along a member for load
+            effects.
+
+    Returns:
+        ClosedFormInfluenceLines
+
+    """
+    L = beam_model_data['L']
+    il = ClosedFormInfluenceLines(L, beam_model_data['EI'], beam_model_data['R'], n_points, load_increment(L))
+    return il
+
+
+def analysis_session(beam_model_data: dict, n_points: int=1000) -> ClosedFormInfluenceLines:
+    """
+    Returns a solver for the beam in 'beam_model_data', keyed on the span
+    lengths, flexural rigidity and restraints. A solver created by a previous
+    call for the same beam is reused, along with its factorized equations and
+    unit hoist load responses, so only the loads are solved on later calls
+    (e.g. for other limit states or hoist positions). The solvers are shared
+    and must not be modified.
+
+    Args:
+        beam_model_data: A dict containing the span lengths 'L', flexural
+            rigidity 'EI' and PyCBA restraints 'R' of the beam.
+        n_points: The number of evaluation points along a member for load
+            effects.
+
+    Returns:
+        ClosedFormInfluenceLines
+
+    """
+    L = tuple(float(span) for span in beam_model_data['L'])
+    EI = tuple(np.broadcast_to(np.asarray(beam_model_data['EI'], dtype=float), (len(L),)))
+    R = tuple(beam_model_data['R'])
+    return _cached_session(L, EI, R, n_points)
+
+
+@lru_cache(maxsize=8)
+def _cached_session(L: tuple, EI: tuple, R: tuple, n_points: int) -> ClosedFormInfluenceLines:
+    """
+    Returns a new solver for the hashable beam definition. See
+    'analysis_session'.
+    """
+    return ClosedFormInfluenceLines(list(L), np.array(EI), list(R), n_points, load_increment(L))
+
+
+def _beam_key(beam_model_data: dict, n_points: int) -> tuple:
+    """
+    Returns the beam definition part of the on-disk cache keys: the span
+    lengths, flexural rigidity, restraints, 'n_points', the moving load
+    increment and the hash of the code of the solver and influence lines.
+    """
+    L = beam_model_data['L']
+    code = disk_cache.code_version(sys.modules[__name__], influence_lines)
+    return (L, beam_model_data['EI'], beam_model_data['R'], n_points, load_increment(L), code)
+
+
+def static_beam_model(
+        beam_model_data: dict,
+        G_load: list,
+        Q_load: float,
+        Q_load_pos: float,
+        n_points: int=1000,
+        il: ClosedFormInfluenceLines=None,
+        exact: bool=False
+) -> dict:
+    """
+    Returns a dictionary of matrixes and critical values from a static
+    analysis of a continuous beam, solved with the closed-form solver. This is
+    a drop-in replacement for 'beam_analysis.static_beam_model'. The results
+    are read from the on-disk cache if it is enabled (see 'disk_cache').
+
+    Args:
+        beam_model_data: A dict containing the span lengths 'L', flexural
+            rigidity 'EI' and PyCBA restraints 'R' of the beam.
+        G_load: Dead load (kN)
+        Q_load: Live load (kN)
+        Q_load_pos: 'x' distance of the applied point load on the beam.
+        n_points: The number of evaluation points along a member for load
+            effects.
+        il: An existing solver for the same beam. If not provided, the session
+            for 'beam_model_data' is used (see 'analysis_session').
+        exact: If True, the critical moments, shears and deflections are the
+            exact extrema of the piecewise polynomial results rather than those
+            of the sampled arrays, so 'n_points' only affects the plotted
+            matrixes.
+
+    Returns:
+        A dict of matrixes and critical values results, in the same format as
+        'beam_analysis.static_beam_model'.
+
+    """
+    def calc():
+        solver = analysis_session(beam_model_data, n_points) if il is None else il
+        span_idx, a_dist = solver.locate(Q_load_pos)
+        LM = G_load + [[span_idx, 2, Q_load, a_dist, 0]]
+        M, V, D, Rxn = solver.static(LM)
+        polys = solver.static_polynomials(LM) if exact else None
+        return solver.static_results(M, V, D, Rxn, polys=polys)
+
+    key_parts = (_beam_key(beam_model_data, n_points), G_load, Q_load, Q_load_pos, exact)
+    results_output = disk_cache.cached("static_beam_model", key_parts, calc)
+    return results_output
+
+
+def batch_static_beam_model(
+        beam_model_data: dict,
+        G_load: list,
+        Q_load: float,
+        Q_load_pos: np.ndarray=None,
+        n_points: int=1000,
+        il: ClosedFormInfluenceLines=None
+) -> dict:
+    """
+    Returns a dictionary of matrixes and critical values from static analyses
+    with the hoist at each of an array of positions. The matrixes have one row
+    per hoist position, so results for any position are an array lookup (see
+    'select_static_results').
+
+    Args:
+        beam_model_data: A dict containing the span lengths 'L', flexural
+            rigidity 'EI' and PyCBA restraints 'R' of the beam.
+        G_load: Dead load (kN)
+        Q_load: Live load (kN)
+        Q_load_pos: Array of 'x' distances of the applied point load on the
+            beam. If None, the moving load positions of the enveloped analysis
+            are used.
+        n_points: The number of evaluation points along a member for load
+            effects.
+        il: Pre-computed influence lines for the same beam. If not provided,
+            the session for 'beam_model_data' is used (see 'analysis_session').
+
+    Returns:
+        A dict of (n_positions, n_points) matrixes and per position critical
+        values, as returned by 'InfluenceLines.batch_static'.
+
+    """
+    if il is None:
+        il = analysis_session(beam_model_data, n_points)
+    results_output = il.batch_static(G_load, Q_load, Q_load_pos)
+    return results_output
+
+
+def env_beam_model(
+        beam_model_data: dict,
+        G_load: list,
+        Q_load: float,
+        n_points: int=1000,
+        il: ClosedFormInfluenceLines=None,
+        exact: bool=False
+) -> dict:
+    """
+    Returns a dictionary of matrixes and critical values from an enveloped
+    moving load analysis, solved with the closed-form solver. This is a drop-in
+    replacement for 'beam_analysis.env_beam_model'. The results are read from
+    the on-disk cache if it is enabled (see 'disk_cache').
+
+    Args:
+        beam_model_data: A dict containing the span lengths 'L', flexural
+            rigidity 'EI' and PyCBA restraints 'R' of the beam.
+        G_load: Dead load (kN)
+        Q_load: Live load (kN)
+        n_points: The number of evaluation points along a member for load
+            effects.
+        il: Pre-computed influence lines for the same beam. If not provided,
+            the session for 'beam_model_data' is used (see 'analysis_session').
+        exact: If True, the critical moments, shears and deflections are the
+            exact extrema of the piecewise polynomial results rather than those
+            of the sampled arrays, so 'n_points' only affects the plotted
+            matrixes.
+
+    Returns:
+        A dict of matrixes and critical values results, in the same format as
+        'beam_analysis.il_env_beam_model'.
+
+    """
+    def calc():
+        solver = analysis_session(beam_model_data, n_points) if il is None else il
+        return solver.envelope(G_load, Q_load, exact)
+
+    key_parts = (_beam_key(beam_model_data, n_points), G_load, Q_load, exact)
+    results_output = disk_cache.cached("env_beam_model", key_parts, calc)
+    return results_output
+
+
+def combo_beam_models(
+        beam_model_data: dict,
+        G_load: list,
+        load_cases: dict,
+        Q_load_pos: float=None,
+        n_points: int=1000,
+        il: ClosedFormInfluenceLines=None,
+        exact: bool=False,
+        envelopes: bool=True
+) -> tuple[dict, dict]:
+    """
+    Returns the static and enveloped results for every load case in a
+    combination table from a single analysis of the unfactored static loads and
+    a unit hoist load. Each load case is a linear combination of those results.
+    The results are read from the on-disk cache if it is enabled (see
+    'disk_cache').
+
+    Args:
+        beam_model_data: A dict containing the span lengths 'L', flexural
+            rigidity 'EI' and PyCBA restraints 'R' of the beam.
+        G_load: PyCBA load matrix of the unfactored static (dead) loads.
+        load_cases: Dict of load cases, each with a factor 'G' applied to
+            'G_load' and the factored hoist point load 'Q' (kN).
+        Q_load_pos: 'x' distance of the hoist for the static results. If None,
+            only the enveloped results are created.
+        n_points: The number of evaluation points along a member for load
+            effects.
+        il: Pre-computed influence lines for the same beam. If not provided,
+            the session for 'beam_model_data' is used (see 'analysis_session').
+        exact: If True, the critical moments, shears and deflections are the
+            exact extrema of the piecewise polynomial results rather than those
+            of the sampled arrays, so 'n_points' only affects the plotted
+            matrixes.
+        envelopes: If False, only the static results are created.
+
+    Returns:
+        tuple(static_results, env_results) of dicts keyed by load case name,
+        in the same format as 'static_beam_model' and 'env_beam_model'.
+
+    """
+    def calc():
+        solver = analysis_session(beam_model_data, n_points) if il is None else il
+        return solver.combinations(G_load, load_cases, Q_load_pos, exact, envelopes)
+
+    key_parts = (_beam_key(beam_model_data, n_points), G_load, load_cases, Q_load_pos, exact, envelopes)
+    static_results, env_results = disk_cache.cached("combo_beam_models", key_parts, calc)
+    return static_results, env_results
+
+
+def hoist_moments(
+        beam_model_data: dict,
+        G_load: list,
+        Q_load: float,
+        n_points: int=1000,
+        il: ClosedFormInfluenceLines=None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the exact bending moment directly under the hoist for each of the
+    moving load positions of the enveloped analysis.
+
+    Args:
+        beam_model_data: A dict containing the span lengths 'L', flexural
+            rigidity 'EI' and PyCBA restraints 'R' of the beam.
+        G_load: Dead load (kN). Only UDLs are supported.
+        Q_load: Live load (kN)
+        n_points: The number of evaluation points along a member for load
+            effects.
+        il: An existing solver for the same beam. If not provided, the session
+            for 'beam_model_data' is used (see 'analysis_session').
+
+    Returns:
+        tuple(load_pos, M) of arrays with one value per hoist position.
+
+    """
+    if il is None:
+        il = analysis_session(beam_model_data, n_points)
+    M_poly, _, _ = il.hoist_polynomials(G_load, Q_load, il.pos)
+    return il.pos, M_poly.at_cases(il.pos)
+
+
+def adaptive_env_beam_model(
+        beam_model_data: dict,
+        G_load: list,
+        Q_load: float,
+        n_points: int=1000,
+        coarse_step: float=1.0,
+        tol: float=1e-4,
+        il: ClosedFormInfluenceLines=None,
+        exact: bool=False
+) -> dict:
+    """
+    Returns a dictionary of matrixes and critical values from an enveloped
+    moving load analysis in which the hoist positions are refined adaptively
+    around the critical values instead of solving every load increment. See
+    'InfluenceLines.adaptive_envelope'.
+
+    Args:
+        beam_model_data: A dict containing the span lengths 'L', flexural
+            rigidity 'EI' and PyCBA restraints 'R' of the beam.
+        G_load: Dead load (kN)
+        Q_load: Live load (kN)
+        n_points: The number of evaluation points along a member for load
+            effects.
+        coarse_step: Maximum spacing of the initial hoist positions (m).
+        tol: Relative change in the critical values at which to stop refining.
+        il: An existing solver for the same beam. If not provided, a solver is
+            created from 'beam_model_data'.
+        exact: If True, the critical moments, shears and deflections are the
+            exact extrema of the piecewise polynomial results rather than those
+            of the sampled arrays, so 'n_points' only affects the plotted
+            matrixes.
+
+    Returns:
+        A dict of matrixes and critical values results, in the same format as
+        'env_beam_model', plus the number of hoist positions evaluated under
+        "Evaluations".
+
+    """
+    if il is None:
+        il = ClosedFormInfluenceLines(
+            beam_model_data['L'], beam_model_data['EI'], beam_model_data['R'], n_points, step=None
+        )
+    results_output = il.adaptive_envelope(G_load, Q_load, coarse_step, tol, exact=exact)
+    return results_output
@@ -0,0 +1,243 @@
+import hashlib
+import json
+import os
+import uuid
+import zipfile
+import numpy as np
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Optional
+from monorail_beam.utils import code_sha256
+
+
+# The cache is disabled unless a directory is configured, either with
+# 'configure' or with this environment variable.
+CACHE_DIR_ENV = "MONORAIL_BEAM_CACHE_DIR"
+CACHE_SIZE_ENV = "MONORAIL_BEAM_CACHE_MAX_MB"
+DEFAULT_MAX_BYTES = 500 * 2 ** 20
+
+_UNCONFIGURED = object()
+_DISK_CACHE = _UNCONFIGURED
+
+
+@dataclass
+class DiskCache:
+    """
+    A content-addressed cache of analysis results, stored as one compressed
+    '.npz' file per entry in 'directory'. The cache may be shared by any
+    number of processes: entries are written to a temporary file and renamed
+    into place, so readers only ever see complete entries, and an entry that
+    is evicted or replaced while it is read is treated as a miss.
+
+    Attributes:
+        directory: The directory the entries are stored in.
+        max_bytes: The maximum total size of the entries. The least recently
+            used entries are evicted when it is exceeded.
+        hits: The number of entries read by this process.
+        misses: The number of entries calculated by this process.
+
+    """
+    directory: Path
+    max_bytes: int = DEFAULT_MAX_BYTES
+    hits: int = 0
+    misses: int = 0
+
+    def __post_init__(self):
+        self.directory = Path(self.directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Returns the results stored under 'key', or None if there are none.
+        """
+        path = self.directory / f"{key}.npz"
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            # Unreadable entries are recalculated and replaced
+            _remove(path)
+            return None
+        tree = json.loads(str(arrays.pop("__tree__")))
+        return _decode(tree, arrays)
+
+    def put(self, key: str, results: Any) -> None:
+        """
+        Stores 'results' under 'key' and evicts the least recently used
+        entries if the cache is larger than 'max_bytes'. 'results' may be a
+        nested structure of dicts, lists, tuples, NumPy arrays and scalars.
+        """
+        arrays = {}
+        tree = _encode(results, arrays)
+        tmp_path = self.directory / f"{key}.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, "wb") as tmp_file:
+                np.savez_compressed(tmp_file, __tree__=json.dumps(tree), **arrays)
+            os.replace(tmp_path, self.directory / f"{key}.npz")
+        finally:
+            _remove(tmp_path)
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Removes the least recently used entries until the cache is within 90%
+        of 'max_bytes'.
+        """
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".npz"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+        for _, size, path in sorted(entries):
+            _remove(Path(path))
+            total -= size
+            if total <= 0.9 * self.max_bytes:
+                break
+
+    def clear(self) -> None:
+        """
+        Removes every entry of the cache.
+        """
+        for path in self.directory.glob("*.npz"):
+            _remove(path)
+
+
+def configure(directory: Optional[str]=None, max_bytes: int=DEFAULT_MAX_BYTES) -> Optional[DiskCache]:
+    """
+    Sets the directory of the on-disk analysis cache shared by 'cached' and
+    returns the DiskCache. The cache is disabled if 'directory' is None.
+
+    If 'configure' is not called, the directory is read from the
+    MONORAIL_BEAM_CACHE_DIR environment variable and the size limit (MB) from
+    MONORAIL_BEAM_CACHE_MAX_MB.
+    """
+    global _DISK_CACHE
+    _DISK_CACHE = None if directory is None else DiskCache(directory, max_bytes)
+    return _DISK_CACHE
+
+
+def active_cache() -> Optional[DiskCache]:
+    """
+    Returns the configured DiskCache, or None if the cache is disabled.
+    """
+    if _DISK_CACHE is _UNCONFIGURED:
+        max_bytes = os.environ.get(CACHE_SIZE_ENV)
+        configure(
+            os.environ.get(CACHE_DIR_ENV) or None,
+            DEFAULT_MAX_BYTES if max_bytes is None else int(float(max_bytes) * 2 ** 20)
+        )
+    return _DISK_CACHE
+
+
+def cached(name: str, key_parts: tuple, calc: Callable[[], Any]) -> Any:
+    """
+    Returns the results of 'calc' from the on-disk cache, keyed on 'name' and
+    'key_parts'. The results are calculated and stored if they are not in the
+    cache, or calculated directly if the cache is disabled.
+
+    Args:
+        name: The name of the cached calculation.
+        key_parts: Every input the results depend on, including the
+            'code_version' of the code that calculates them. The parts may be
+            nested lists, tuples and dicts of numbers, strings and NumPy
+            arrays.
+        calc: Callable with no arguments returning the results.
+
+    """
+    cache = active_cache()
+    if cache is None:
+        return calc()
+    # The entries are also keyed on the code of the cache file layout
+    key = cache_key(name, (code_version(_encode, _decode), key_parts))
+    results = cache.get(key)
+    if results is not None:
+        cache.hits += 1
+        return results
+    cache.misses += 1
+    results = calc()
+    cache.put(key, results)
+    return results
+
+
+def cache_key(name: str, key_parts: tuple) -> str:
+    """
+    Returns the SHA-256 hash of the canonical JSON form of 'name' and
+    'key_parts'. Equal inputs give the same key in any process, whether they
+    are lists, tuples or NumPy arrays.
+    """
+    canonical = json.dumps([name, key_parts], sort_keys=True, default=_canonical)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def code_version(*modules) -> str:
+    """
+    Returns the SHA-256 hash of the code of 'modules' (or functions) for the
+    'key_parts' of 'cached', so the cached results are recalculated after a
+    change to the code they depend on (see 'utils.code_sha256'). The hash is
+    only calculated once per process.
+    """
+    return code_sha256(*modules)
+
+
+def _canonical(value: Any) -> Any:
+    """
+    Returns the JSON serializable form of NumPy values for 'cache_key'.
+    """
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    raise TypeError(f"The cache key part {value!r} of type '{type(value).__name__}' is not supported!")
+
+
+def _encode(value: Any, arrays: dict) -> Any:
+    """
+    Returns the JSON serializable tree of 'value', with the NumPy arrays and
+    scalars moved to 'arrays' and replaced by references.
+    """
+    if isinstance(value, dict):
+        return {"__dict__": [[key, _encode(val, arrays)] for key, val in value.items()]}
+    if isinstance(value, tuple):
+        return {"__tuple__": [_encode(val, arrays) for val in value]}
+    if isinstance(value, list):
+        return [_encode(val, arrays) for val in value]
+    if isinstance(value, (np.ndarray, np.generic)):
+        name = f"a{len(arrays)}"
+        arrays[name] = np.asarray(value)
+        return {"__array__": name}
+    return value
+
+
+def _decode(tree: Any, arrays: dict) -> Any:
+    """
+    Returns the value of the tree created by '_encode'.
+    """
+    if isinstance(tree, list):
+        return [_decode(val, arrays) for val in tree]
+    if isinstance(tree, dict):
+        if "__dict__" in tree:
+            return {key: _decode(val, arrays) for key, val in tree["__dict__"]}
+        if "__tuple__" in tree:
+            return tuple(_decode(val, arrays) for val in tree["__tuple__"])
+        array = arrays[tree["__array__"]]
+        return array[()] if array.ndim == 0 else array
+    return tree
+
+
+def _remove(path: Path) -> None:
+    """
+    Removes 'path' if it exists. Another process may have removed it first.
+    """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,1160 @@
+import numpy as np
+from dataclasses import dataclass
+from scipy.linalg import cho_solve_banded, cholesky_banded
+from . import tracing
+
+
+def element_stiffness(L: float, EI: float) -> np.ndarray:
+    """
+    Returns the 4x4 Euler-Bernoulli stiffness matrix of a beam element with
+    degrees of freedom ordered [v_i, theta_i, v_j, theta_j].
+
+    Args:
+        L: Length of the element (m).
+        EI: Flexural rigidity of the element (kNm^2).
+
+    Returns:
+        Element stiffness matrix.
+
+    """
+    k = np.array([
+        [12.0, 6.0 * L, -12.0, 6.0 * L],
+        [6.0 * L, 4.0 * L ** 2, -6.0 * L, 2.0 * L ** 2],
+        [-12.0, -6.0 * L, 12.0, -6.0 * L],
+        [6.0 * L, 2.0 * L ** 2, -6.0 * L, 4.0 * L ** 2]
+    ])
+    return k * EI / L ** 3
+
+
+def point_load_fef(L: float, a: np.ndarray, P: np.ndarray) -> np.ndarray:
+    """
+    Returns the fixed-end forces of a fixed-fixed element subject to downward
+    point loads 'P' applied at local distances 'a'. Forces are upwards positive
+    and moments are counter-clockwise positive, matching the element DOFs.
+
+    Args:
+        L: Length of the element (m).
+        a: Array of load positions measured from the element start (m).
+        P: Array of point load magnitudes (kN), the same shape as 'a'.
+
+    Returns:
+        Array of shape (4, n) of fixed-end forces.
+
+    """
+    a = np.asarray(a, dtype=float)
+    P = np.asarray(P, dtype=float)
+    b = L - a
+    return np.array([
+        P * b ** 2 * (3 * a + b) / L ** 3,
+        P * a * b ** 2 / L ** 2,
+        P * a ** 2 * (a + 3 * b) / L ** 3,
+        -P * a ** 2 * b / L ** 2
+    ])
+
+
+def udl_fef(L: float, q: np.ndarray) -> np.ndarray:
+    """
+    Returns the fixed-end forces of a fixed-fixed element subject to a full
+    length downward uniformly distributed load 'q'.
+
+    Args:
+        L: Length of the element (m).
+        q: Array of UDL magnitudes (kN/m).
+
+    Returns:
+        Array of shape (4, n) of fixed-end forces.
+
+    """
+    q = np.asarray(q, dtype=float)
+    return np.array([q * L / 2, q * L ** 2 / 12, q * L / 2, -q * L ** 2 / 12])
+
+
+def load_increment(spans: list) -> float:
+    """
+    Returns the moving load increment (m) for an enveloped analysis. The
+    increment is refined if the cantilever length is less than 100mm.
+    """
+    if spans[-1] <= 0.1:
+        inc = 0.01
+    else:
+        inc = 0.05
+    return inc
+
+
+def span_ends(spans: list) -> np.ndarray:
+    """
+    Returns the cumulative distance to the end of each span (m).
+    """
+    return np.cumsum(np.asarray(spans, dtype=float))
+
+
+def locate_load_pos(load_pos, ends: np.ndarray, decimals: int=4, side: str='left') -> tuple:
+    """
+    Returns the span index and the distance from the start of that span for
+    one or more load positions provided with respect to the total continuous
+    beam length. Loads beyond the end of the beam are assigned to the last
+    span.
+
+    Args:
+        load_pos: 'x' distance of the applied point load on the beam, either a
+            scalar or an array of distances.
+        ends: Cumulative span end distances, as returned by 'span_ends'.
+        decimals: Number of decimal places the load positions are rounded down
+            to when determining the span, to avoid floating point noise placing
+            a load at a support into the next span (the default is 4).
+        side: Span assigned to a load positioned exactly at an internal
+            support. 'left' assigns it to the span on the left of the support
+            (the default), and 'right' assigns it to the span on the right, as
+            PyCBA does for moving loads.
+
+    Returns:
+        tuple(span_idx, a_dist) where 'span_idx' is the 1-based span index
+        compatible with PyCBA and 'a_dist' is the distance from the start of
+        the span. Both match the shape of 'load_pos'.
+
+    """
+    load_pos = np.asarray(load_pos, dtype=float)
+    multiplier = 10 ** decimals
+    rnd_load_pos = np.floor(load_pos * multiplier) / multiplier
+    span_idx = np.minimum(np.searchsorted(ends, rnd_load_pos, side=side), len(ends) - 1) + 1
+    starts = np.concatenate([[0.0], ends[:-1]])
+    a_dist = load_pos - starts[span_idx - 1]
+    return span_idx, a_dist
+
+
+def member_stations(L: float, n_points: int) -> np.ndarray:
+    """
+    Returns the local evaluation stations of a member in the PyCBA layout, i.e.
+    'n_points' equal divisions with the end stations duplicated so that the
+    moment and shear diagrams close to zero at each member end.
+    """
+    s = np.linspace(0.0, L, n_points + 1)
+    return np.concatenate([[0.0], s, [L]])
+
+
+def member_fields(
+        L: float,
+        EI: float,
+        s: np.ndarray,
+        f: np.ndarray,
+        w_ends: np.ndarray,
+        q: np.ndarray,
+        P: np.ndarray,
+        a: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the bending moment, shear force and deflection along a member for
+    a number of load cases, evaluated in closed form from the member end forces.
+
+    Sign conventions follow PyCBA: sagging moments, upward deflections and
+    shear equal to the sum of the upward forces to the left of a station are
+    positive.
+
+    Args:
+        L: Length of the member (m).
+        EI: Flexural rigidity of the member (kNm^2).
+        s: Local stations in the PyCBA padded layout (m).
+        f: Array of shape (4, n_cases) of member end forces, including the
+            fixed-end forces of any loads applied to the member.
+        w_ends: Array of shape (2, n_cases) of end deflections (m).
+        q: Array of UDL magnitudes on the member, one per load case (kN/m).
+        P: Array of point load magnitudes on the member, one per load case (kN).
+        a: Array of point load positions from the member start (m).
+
+    Returns:
+        tuple(M, V, D) of arrays of shape (n_cases, n_stations).
+
+    """
+    M_a = -f[1][:, None]
+    M_b = f[3][:, None]
+    V_a = f[0][:, None]
+    q = np.asarray(q, dtype=float)[:, None]
+    P = np.asarray(P, dtype=float)[:, None]
+    a = np.asarray(a, dtype=float)[:, None]
+    b = L - a
+    x = s[None, :]
+    past = x > a
+
+    M = M_a + V_a * x - q * x ** 2 / 2 - P * np.where(past, x - a, 0.0)
+    V = V_a - q * x - P * past
+
+    # Simply supported deflection shapes superimposed on the end effects
+    D_P = np.where(
+        past,
+        -P * a * (L - x) * (L ** 2 - a ** 2 - (L - x) ** 2),
+        -P * b * x * (L ** 2 - b ** 2 - x ** 2)
+    ) / (6 * L * EI)
+    D_q = -q * x * (L ** 3 - 2 * L * x ** 2 + x ** 3) / (24 * EI)
+    D_Ma = M_a / EI * (x ** 2 / 2 - x ** 3 / (6 * L) - L * x / 3)
+    D_Mb = M_b / EI * (x ** 3 / (6 * L) - L * x / 6)
+    D_w = w_ends[0][:, None] * (1 - x / L) + w_ends[1][:, None] * x / L
+    D = D_w + D_Ma + D_Mb + D_q + D_P
+
+    # Padding stations close the M and V diagrams to zero
+    M[:, [0, -1]] = 0.0
+    V[:, [0, -1]] = 0.0
+    return M, V, D
+
+
+def member_polynomials(
+        L: float,
+        EI: float,
+        f: np.ndarray,
+        w_ends: np.ndarray,
+        q: np.ndarray,
+        P: np.ndarray,
+        a: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the exact polynomial coefficients of the bending moment, shear
+    force and deflection along a member for a number of load cases. The member
+    is split into two pieces at the point load, [0, a] and [a, L], and the
+    coefficients are in ascending powers of the distance from the member start.
+    The sign conventions are those of 'member_fields'.
+
+    Args:
+        L: Length of the member (m).
+        EI: Flexural rigidity of the member (kNm^2).
+        f: Array of shape (4, n_cases) of member end forces, including the
+            fixed-end forces of any loads applied to the member.
+        w_ends: Array of shape (2, n_cases) of end deflections (m).
+        q: Array of UDL magnitudes on the member, one per load case (kN/m).
+        P: Array of point load magnitudes on the member, one per load case (kN).
+        a: Array of point load positions from the member start (m).
+
+    Returns:
+        tuple(M, V, D) of coefficient arrays of shape (n_cases, 2, 3),
+        (n_cases, 2, 2) and (n_cases, 2, 5) respectively.
+
+    """
+    M_a, V_a = -f[1], f[0]
+    q = np.asarray(q, dtype=float)
+    P = np.asarray(P, dtype=float)
+    a = np.asarray(a, dtype=float)
+    zero = np.zeros_like(V_a)
+
+    M_1 = np.stack([M_a, V_a, -q / 2], axis=-1)
+    M_2 = M_1 + np.stack([P * a, -P, zero], axis=-1)
+    V_1 = np.stack([V_a, -q], axis=-1)
+    V_2 = V_1 + np.stack([-P, zero], axis=-1)
+
+    # EI w'' = M, integrated with the end deflections as boundary conditions.
+    # Past the point load the deflection gains the term -P (x - a)^3 / 6EI.
+    curvature_L = M_a * L ** 2 / 2 + V_a * L ** 3 / 6 - q * L ** 4 / 24 - P * (L - a) ** 3 / 6
+    c_1 = (w_ends[1] - w_ends[0] - curvature_L / EI) / L
+    D_1 = np.stack([w_ends[0], c_1, M_a / (2 * EI), V_a / (6 * EI), -q / (24 * EI)], axis=-1)
+    D_2 = D_1 + np.stack([P * a ** 3, -3 * P * a ** 2, 3 * P * a, -P, zero], axis=-1) / (6 * EI)
+
+    # A point load at the member end leaves no second piece (x > a is empty),
+    # so the first piece is repeated in its place
+    at_end = (a >= L)[:, None]
+    M_2, V_2, D_2 = [np.where(at_end, first, second) for first, second in [(M_1, M_2), (V_1, V_2), (D_1, D_2)]]
+    return tuple(np.stack(pieces, axis=1) for pieces in [(M_1, M_2), (V_1, V_2), (D_1, D_2)])
+
+
+def poly_real_roots(coeffs: np.ndarray) -> np.ndarray:
+    """
+    Returns the real roots of polynomials of up to third degree, with
+    coefficients in ascending powers. The roots are found in closed form and
+    polished with Newton iterations. Missing roots (complex roots, or those of
+    lower degree polynomials) are returned as NaN.
+
+    Args:
+        coeffs: Array of shape (..., deg + 1) of polynomial coefficients.
+
+    Returns:
+        Array of shape (..., deg) of roots.
+
+    """
+    coeffs = np.asarray(coeffs, dtype=float)
+    deg = coeffs.shape[-1] - 1
+    roots = np.full(coeffs.shape[:-1] + (deg,), np.nan)
+    scale = np.abs(coeffs).max(axis=-1)
+    significant = np.abs(coeffs) > 1e-12 * scale[..., None]
+    eff_deg = np.where(significant.any(axis=-1), deg - np.argmax(significant[..., ::-1], axis=-1), 0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for d in range(1, min(deg, 3) + 1):
+            mask = eff_deg == d
+            if not mask.any():
+                continue
+            c = coeffs[mask][:, :d + 1]
+            r = np.full((len(c), deg), np.nan)
+            if d == 1:
+                r[:, 0] = -c[:, 0] / c[:, 1]
+            elif d == 2:
+                sqrt_disc = np.sqrt(c[:, 1] ** 2 - 4 * c[:, 2] * c[:, 0])
+                r[:, 0] = (-c[:, 1] + sqrt_disc) / (2 * c[:, 2])
+                r[:, 1] = (-c[:, 1] - sqrt_disc) / (2 * c[:, 2])
+            else:
+                # Cardano's method on the depressed cubic t^3 + p t + q = 0
+                b_2, b_1, b_0 = (c[:, :3] / c[:, 3:]).T[::-1]
+                p = b_1 - b_2 ** 2 / 3
+                q = 2 * b_2 ** 3 / 27 - b_2 * b_1 / 3 + b_0
+                disc = (q / 2) ** 2 + (p / 3) ** 3
+                one_root = disc >= 0
+                sqrt_disc = np.sqrt(np.where(one_root, disc, 0.0))
+                r[:, 0] = np.where(
+                    one_root,
+                    np.cbrt(-q / 2 + sqrt_disc) + np.cbrt(-q / 2 - sqrt_disc),
+                    np.nan
+                )
+                m = 2 * np.sqrt(np.where(one_root, 0.0, -p / 3))
+                phi = np.arccos(np.clip(np.where(one_root, 0.0, 3 * q / (p * m)), -1.0, 1.0)) / 3
+                for k in range(3):
+                    r[:, k] = np.where(one_root, r[:, k], m * np.cos(phi - 2 * np.pi * k / 3))
+                r[:, :3] -= b_2[:, None] / 3
+
+            # Newton polishing against the original coefficients
+            deriv = c[:, 1:] * np.arange(1, d + 1)
+            for _ in range(2):
+                f_val = poly_eval(c[:, None, :], r[:, :d])
+                df_val = poly_eval(deriv[:, None, :], r[:, :d])
+                r[:, :d] -= np.where(df_val != 0.0, f_val / df_val, 0.0)
+            roots[mask] = r
+    return roots
+
+
+def poly_eval(coeffs: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """
+    Returns the value of polynomials with coefficients in ascending powers
+    (last axis) at 't', which broadcasts against the leading axes.
+    """
+    val = np.zeros(np.broadcast_shapes(coeffs.shape[:-1], np.shape(t)))
+    for c in np.moveaxis(coeffs, -1, 0)[::-1]:
+        val = val * t + c
+    return val
+
+
+@dataclass
+class PiecewisePolynomial:
+    """
+    Exact representation of a load effect along the whole beam for a number
+    of load cases, as polynomials over contiguous pieces of the beam.
+
+    Attributes:
+        lo: Array of shape (n_cases, n_pieces) of piece start distances (m).
+        hi: Array of shape (n_cases, n_pieces) of piece end distances (m).
+        origin: Array of shape (n_cases, n_pieces) of the distance from which
+            the polynomial variable of each piece is measured (m).
+        coeffs: Array of shape (n_cases, n_pieces, deg + 1) of coefficients in
+            ascending powers.
+
+    """
+    lo: np.ndarray
+    hi: np.ndarray
+    origin: np.ndarray
+    coeffs: np.ndarray
+
+    def __call__(self, x) -> np.ndarray:
+        """
+        Returns the values at the global distances 'x' as an array of shape
+        (n_cases, n_x). Where pieces meet, the value of the left piece is
+        returned.
+        """
+        x = np.atleast_1d(np.asarray(x, dtype=float))[None, :]
+        val = np.zeros((self.coeffs.shape[0], x.shape[1]))
+        for idx in reversed(range(self.coeffs.shape[1])):
+            lo, hi = self.lo[:, idx, None], self.hi[:, idx, None]
+            on_piece = (x >= lo) & (x <= hi)
+            piece_val = poly_eval(self.coeffs[:, idx, None, :], x - self.origin[:, idx, None])
+            val = np.where(on_piece, piece_val, val)
+        return val
+
+    def at_cases(self, x) -> np.ndarray:
+        """
+        Returns the value of each load case at its own global distance, where
+        'x' is an array of shape (n_cases,) (e.g. the value under the hoist
+        for each hoist position). Where pieces meet, the value of the left
+        piece is returned.
+        """
+        x = np.asarray(x, dtype=float)
+        val = np.zeros(self.coeffs.shape[0])
+        for idx in reversed(range(self.coeffs.shape[1])):
+            on_piece = (x >= self.lo[:, idx]) & (x <= self.hi[:, idx])
+            piece_val = poly_eval(self.coeffs[:, idx, :], x - self.origin[:, idx])
+            val = np.where(on_piece, piece_val, val)
+        return val
+
+    def extrema(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the exact maximum and minimum of each load case and where they
+        occur, found from the piece ends and the stationary points.
+
+        Returns:
+            tuple(max_val, max_at, min_val, min_at) of arrays of shape (n_cases,).
+
+        """
+        deriv = self.coeffs[..., 1:] * np.arange(1, self.coeffs.shape[-1])
+        stationary = self.origin[..., None] + poly_real_roots(deriv)
+        lo, hi = self.lo[..., None], self.hi[..., None]
+        stationary = np.clip(np.where(np.isnan(stationary), lo, stationary), lo, hi)
+        x = np.concatenate([lo, hi, stationary], axis=-1)
+        val = poly_eval(self.coeffs[..., None, :], x - self.origin[..., None])
+
+        n_cases = val.shape[0]
+        flat_val, flat_x = val.reshape(n_cases, -1), x.reshape(n_cases, -1)
+        cases = np.arange(n_cases)
+        idx_max, idx_min = flat_val.argmax(axis=1), flat_val.argmin(axis=1)
+        return (
+            flat_val[cases, idx_max], flat_x[cases, idx_max],
+            flat_val[cases, idx_min], flat_x[cases, idx_min]
+        )
+
+
+class InfluenceLines:
+    """
+    Influence-line engine for a continuous beam with the PyCBA (L, EI, R)
+    definition. The global stiffness matrix is assembled and factorized once,
+    and any number of load cases are then solved against the factorization.
+    The responses to a unit hoist load at every load position are obtained from
+    a single multiple right-hand side solve, and results for any hoist load are
+    built by superposition.
+
+    Attributes:
+        L: List of span lengths (m).
+        EI: Array of span flexural rigidities (kNm^2).
+        R: List of PyCBA restraints, two per node (-1 fixed, 0 free, >0 spring).
+        x: Global stations in the PyCBA padded layout (m).
+        pos: Hoist load positions (m).
+        M, V, D: Arrays of shape (n_pos, n_x) of unit load responses.
+        Rxn: Array of shape (n_pos, n_sup) of unit load support reactions.
+
+    If 'step' is None, the unit load responses are not created and the object
+    may only be used for static analyses.
+
+    """
+    def __init__(self, L: list, EI, R: list, n_points: int=1000, step: float=0.05):
+        self.L = [float(span) for span in L]
+        self.EI = np.broadcast_to(np.asarray(EI, dtype=float), (len(self.L),)).copy()
+        self.R = list(R)
+        self.n_points = n_points
+        self.step = step
+        if len(self.R) != 2 * (len(self.L) + 1):
+            raise ValueError(f"Expected {2 * (len(self.L) + 1)} restraints, not {len(self.R)}!")
+
+        self.nodes = np.concatenate([[0.0], np.cumsum(self.L)])
+        self.length = self.nodes[-1]
+        self.stations = [member_stations(span, n_points) for span in self.L]
+        self.x = np.concatenate([s + x0 for s, x0 in zip(self.stations, self.nodes)])
+        self._assemble()
+
+        if step is None:
+            return
+        n_pos = round(self.length / step) + 1
+        self.pos = np.minimum(np.arange(n_pos) * step, self.length)
+        self.M, self.V, self.D, self.Rxn = self.unit_responses(self.pos)
+
+    def _assemble(self):
+        """
+        Assembles the global stiffness matrix, partitions the restrained and
+        free degrees of freedom and factorizes the free stiffness matrix. The
+        free stiffness matrix has a half-bandwidth of three, so it is factorized
+        in banded form and solves grow linearly with the number of spans.
+        """
+        n_dof = 2 * len(self.nodes)
+        K = np.zeros((n_dof, n_dof))
+        for idx, (span, EI) in enumerate(zip(self.L, self.EI)):
+            dofs = slice(2 * idx, 2 * idx + 4)
+            K[dofs, dofs] += element_stiffness(span, EI)
+        restraints = np.asarray(self.R, dtype=float)
+        K[np.diag_indices(n_dof)] += np.where(restraints > 0, restraints, 0.0)
+        self.K = K
+        self.free = restraints != -1
+        self.fixed = np.flatnonzero(restraints == -1)
+        K_ff = K[np.ix_(self.free, self.free)]
+        K_ff_banded = np.zeros((4, K_ff.shape[0]))
+        for offset in range(4):
+            K_ff_banded[3 - offset, offset:] = np.diagonal(K_ff, offset)
+        try:
+            self.K_ff_factor = cholesky_banded(K_ff_banded)
+        except np.linalg.LinAlgError:
+            raise ValueError("The beam is unstable with the restraints provided!")
+
+    def _end_forces(
+            self,
+            q: np.ndarray,
+            P: np.ndarray,
+            span_idx: np.ndarray,
+            a_dist: np.ndarray
+    ) -> tuple[list, np.ndarray]:
+        """
+        Returns the member end forces and support reactions for a set of load
+        cases, each comprising a UDL on every span plus a single point load.
+
+        Args:
+            q: Array of shape (n_spans, n_cases) of UDL magnitudes (kN/m).
+            P: Array of point load magnitudes, one per load case (kN).
+            span_idx: Array of 0-based span indexes of the point loads.
+            a_dist: Array of point load positions from the span start (m).
+
+        Returns:
+            tuple(members, R) where 'members' is a list with one tuple of
+            (f, w_ends, q, P, a) per member, as used by 'member_fields', and R
+            has shape (n_cases, n_sup).
+
+        """
+        P = np.asarray(P, dtype=float)
+        n_cases = P.shape[0]
+        n_dof = self.K.shape[0]
+
+        # Fixed-end forces of every load case, per member
+        fef = []
+        for idx, span in enumerate(self.L):
+            on_span = span_idx == idx
+            fef_mbr = udl_fef(span, q[idx])
+            fef_mbr += point_load_fef(span, np.where(on_span, a_dist, 0.0), np.where(on_span, P, 0.0))
+            fef.append(fef_mbr)
+
+        F = np.zeros((n_dof, n_cases))
+        for idx, fef_mbr in enumerate(fef):
+            F[2 * idx:2 * idx + 4] -= fef_mbr
+
+        d = np.zeros((n_dof, n_cases))
+        d[self.free] = cho_solve_banded((self.K_ff_factor, False), F[self.free])
+
+        members = []
+        for idx, (span, EI) in enumerate(zip(self.L, self.EI)):
+            dofs = slice(2 * idx, 2 * idx + 4)
+            f = element_stiffness(span, EI) @ d[dofs] + fef[idx]
+            on_span = span_idx == idx
+            members.append((
+                f, d[[2 * idx, 2 * idx + 2]], q[idx],
+                np.where(on_span, P, 0.0), np.where(on_span, a_dist, 0.0)
+            ))
+
+        # Reactions are the sum of the member end forces at the restrained DOFs
+        Rxn = (self.K[self.fixed] @ d - F[self.fixed]).T
+        return members, Rxn
+
+    def solve(
+            self,
+            q: np.ndarray,
+            P: np.ndarray,
+            span_idx: np.ndarray,
+            a_dist: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the moment, shear, deflection and reaction results for a set
+        of load cases, each comprising a UDL on every span plus a single point
+        load.
+
+        Args:
+            q: Array of shape (n_spans, n_cases) of UDL magnitudes (kN/m).
+            P: Array of point load magnitudes, one per load case (kN).
+            span_idx: Array of 0-based span indexes of the point loads.
+            a_dist: Array of point load positions from the span start (m).
+
+        Returns:
+            tuple(M, V, D, R) where M, V and D have shape (n_cases, n_x) and R
+            has shape (n_cases, n_sup).
+
+        """
+        members, Rxn = self._end_forces(q, P, span_idx, a_dist)
+        M, V, D = zip(*[
+            member_fields(span, EI, s, *member)
+            for span, EI, s, member in zip(self.L, self.EI, self.stations, members)
+        ])
+        return np.hstack(M), np.hstack(V), np.hstack(D), Rxn
+
+    def polynomials(
+            self,
+            q: np.ndarray,
+            P: np.ndarray,
+            span_idx: np.ndarray,
+            a_dist: np.ndarray
+    ) -> tuple[PiecewisePolynomial, PiecewisePolynomial, PiecewisePolynomial]:
+        """
+        Returns the exact piecewise polynomial moment, shear and deflection for
+        a set of load cases, with the same arguments as 'solve'. Each member is
+        split into two pieces at its point load.
+
+        Returns:
+            tuple(M, V, D) of PiecewisePolynomial.
+
+        """
+        members, _ = self._end_forces(q, P, span_idx, a_dist)
+        lo, hi, origin, coeffs = [], [], [], []
+        for span, EI, x0, member in zip(self.L, self.EI, self.nodes, members):
+            a = x0 + member[4]
+            lo.append(np.stack([np.full_like(a, x0), a], axis=1))
+            hi.append(np.stack([a, np.full_like(a, x0 + span)], axis=1))
+            origin.append(np.full((len(a), 2), x0))
+            coeffs.append(member_polynomials(span, EI, *member))
+        lo, hi, origin = np.hstack(lo), np.hstack(hi), np.hstack(origin)
+        return tuple(
+            PiecewisePolynomial(lo, hi, origin, np.concatenate(field, axis=1))
+            for field in zip(*coeffs)
+        )
+
+    def unit_responses(self, load_pos: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the moment, shear, deflection and reaction results for a unit
+        hoist load at each of an array of positions. A load exactly at a node is
+        placed on the span to the right, consistent with PyCBA's moving loads.
+        """
+        load_pos = np.atleast_1d(np.asarray(load_pos, dtype=float))
+        span_idx, a_dist = self.locate(load_pos, side='right')
+        return self.solve(
+            q=np.zeros((len(self.L), len(load_pos))),
+            P=np.ones(len(load_pos)),
+            span_idx=span_idx - 1,
+            a_dist=a_dist
+        )
+
+    def static(self, LM: list) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the moment, shear, deflection and reaction results for a
+        PyCBA load matrix containing UDLs (type 1) and point loads (type 2).
+
+        Args:
+            LM: PyCBA load matrix, e.g. [[span, type, value, a, c], ...] with
+                1-based span numbers.
+
+        Returns:
+            tuple(M, V, D, R) of 1-D arrays.
+
+        """
+        q, point_loads = self._split_loads(LM)
+        M = V = D = Rxn = 0.0
+        for span, value, a in point_loads:
+            M_P, V_P, D_P, R_P = self.solve(
+                q=np.zeros((len(self.L), 1)),
+                P=np.array([value]),
+                span_idx=np.array([span - 1]),
+                a_dist=np.array([a])
+            )
+            M, V, D, Rxn = M + M_P, V + V_P, D + D_P, Rxn + R_P
+        M_q, V_q, D_q, R_q = self.solve(q=q[:, None], P=np.zeros(1), span_idx=np.zeros(1), a_dist=np.zeros(1))
+        return (M + M_q)[0], (V + V_q)[0], (D + D_q)[0], (Rxn + R_q)[0]
+
+    def _split_loads(self, LM: list) -> tuple[np.ndarray, list]:
+        """
+        Returns the total UDL on each span and a list of (span, value, a) point
+        loads from a PyCBA load matrix.
+        """
+        q = np.zeros(len(self.L))
+        point_loads = []
+        for span, load_type, value, a, _ in LM:
+            if load_type == 1:
+                q[span - 1] += value
+            elif load_type == 2:
+                point_loads.append((span, value, a))
+            else:
+                raise ValueError(f"Load type {load_type} is not supported by the influence line engine!")
+        return q, point_loads
+
+    def static_polynomials(self, LM: list) -> tuple[PiecewisePolynomial, PiecewisePolynomial, PiecewisePolynomial]:
+        """
+        Returns the exact piecewise polynomial moment, shear and deflection for
+        a PyCBA load matrix of UDLs and at most one point load.
+
+        Args:
+            LM: PyCBA load matrix, e.g. [[span, type, value, a, c], ...] with
+                1-based span numbers.
+
+        Returns:
+            tuple(M, V, D) of PiecewisePolynomial with a single load case.
+
+        """
+        q, point_loads = self._split_loads(LM)
+        if len(point_loads) > 1:
+            raise ValueError("Exact results are only available for a single point load!")
+        span, value, a = point_loads[0] if point_loads else (1, 0.0, 0.0)
+        return self.polynomials(q[:, None], np.array([value]), np.array([span - 1]), np.array([a]))
+
+    def hoist_polynomials(
+            self,
+            G_load: list,
+            Q_load: float,
+            load_pos: np.ndarray
+    ) -> tuple[PiecewisePolynomial, PiecewisePolynomial, PiecewisePolynomial]:
+        """
+        Returns the exact piecewise polynomial moment, shear and deflection for
+        the hoist load at each of an array of positions, with the static loads
+        applied. The static loads must be UDLs.
+
+        Args:
+            G_load: PyCBA load matrix of the static (dead) UDLs.
+            Q_load: Hoist point load (kN).
+            load_pos: Array of 'x' distances of the hoist.
+
+        Returns:
+            tuple(M, V, D) of PiecewisePolynomial with one load case per
+            position.
+
+        """
+        q, point_loads = self._split_loads(G_load)
+        if point_loads:
+            raise ValueError("Exact envelopes are only available for UDL static loads!")
+        span_idx, a_dist = self.locate(load_pos, side='right')
+        return self.polynomials(
+            q=np.repeat(q[:, None], len(load_pos), axis=1),
+            P=np.full(len(load_pos), float(Q_load)),
+            span_idx=span_idx - 1,
+            a_dist=a_dist
+        )
+
+    def locate(self, load_pos, side: str='left'):
+        """
+        Returns the 1-based span number and the distance from the start of
+        that span for a load position (or an array of positions) measured along
+        the whole beam. See 'locate_load_pos'.
+        """
+        return locate_load_pos(load_pos, self.nodes[1:], side=side)
+
+    def static_results(
+            self,
+            M: np.ndarray,
+            V: np.ndarray,
+            D: np.ndarray,
+            Rxn: np.ndarray,
+            polys: tuple=None
+    ) -> dict:
+        """
+        Returns static analysis results arranged in the same format as
+        'beam_analysis.static_beam_model'. If the exact piecewise polynomial
+        results 'polys' (M, V, D) are provided, the critical values are their
+        exact extrema rather than those of the sampled arrays.
+        """
+        if polys is not None:
+            (M_max, _, M_min, _), (V_max, _, V_min, _), (D_max, _, D_min, _) = [
+                poly.extrema() for poly in polys
+            ]
+            crit_M, crit_V, crit_D = [M_max[0], M_min[0]], [V_max[0], V_min[0]], [D_max[0], D_min[0]]
+        else:
+            crit_M, crit_V, crit_D = [M.max(), M.min()], [V.max(), V.min()], [D.max(), D.min()]
+        results_output = {
+            "Matrixes": {
+                "Deflections": D,
+                "Moment": M,
+                "Shear": V,
+                "x_dist": self.x
+            },
+            "Critical Values": {
+                "Deflections": [crit_D[0] * 1000, crit_D[1] * 1000], # Converts to mm
+                "Moment": crit_M,
+                "Shear": crit_V,
+                "Reactions": Rxn
+            }
+        }
+        return results_output
+
+    def combinations(
+            self,
+            G_load: list,
+            load_cases: dict,
+            Q_load_pos: float=None,
+            exact: bool=False,
+            envelopes: bool=True
+    ) -> tuple[dict, dict]:
+        """
+        Returns static and enveloped results for every load case in a
+        combination table. The beam is only solved for the unfactored static
+        loads and a unit hoist load; each load case is then a linear combination
+        of those results, so additional load cases are cheap.
+
+        Args:
+            G_load: PyCBA load matrix of the unfactored static (dead) loads.
+            load_cases: Dict of load cases, each with a factor 'G' applied to
+                'G_load' and the hoist point load 'Q' (kN). For example:
+                {"SLS": {"G": 1.0, "Q": 22.6}, "ULS": {"G": 1.34, "Q": 38.0}}
+            Q_load_pos: 'x' distance of the hoist for the static results. If
+                None, only the enveloped results are created.
+            exact: If True, the critical moments, shears and deflections are
+                the exact extrema of the piecewise polynomial results rather
+                than those of the sampled arrays.
+            envelopes: If False, only the static results are created.
+
+        Returns:
+            tuple(static_results, env_results) of dicts keyed by load case name.
+            The static results are empty if 'Q_load_pos' is None and the
+            enveloped results are empty if 'envelopes' is False.
+
+        """
+        with tracing.stage("unit solve"):
+            unit_G = self.static(G_load)
+        unit_Q = None
+        pos_idx = self.position_index(Q_load_pos) if envelopes else None
+
+        static_results = {}
+        env_results = {}
+        for lc_name, factors in load_cases.items():
+            with tracing.stage(lc_name):
+                G_res = [factors["G"] * res for res in unit_G]
+                G_factored = [[span, load_type, factors["G"] * value, a, c] for span, load_type, value, a, c in G_load]
+                if envelopes and self.step is not None:
+                    with tracing.stage("envelope"):
+                        batch = self._batch(*G_res, factors["Q"])
+                        env_results.update({lc_name: self._envelope(*batch)})
+                        if exact:
+                            self._exact_critical_values(
+                                env_results[lc_name]["Critical Values"],
+                                self.hoist_polynomials(G_factored, factors["Q"], self.pos),
+                                self.pos
+                            )
+                if Q_load_pos is None:
+                    continue
+                with tracing.stage("static"):
+                    if pos_idx is not None:
+                        # Hoist is on the envelope grid, so the results are a lookup
+                        static_acc = [res[pos_idx] for res in batch]
+                    else:
+                        if unit_Q is None:
+                            span_idx, a_dist = self.locate(Q_load_pos)
+                            unit_Q = self.static([[span_idx, 2, 1.0, a_dist, 0]])
+                        static_acc = [G + factors["Q"] * Q for G, Q in zip(G_res, unit_Q)]
+                    polys = None
+                    if exact:
+                        span_idx, a_dist = self.locate(Q_load_pos)
+                        polys = self.static_polynomials(G_factored + [[int(span_idx), 2, factors["Q"], float(a_dist), 0]])
+                    static_results.update({lc_name: self.static_results(*static_acc, polys=polys)})
+        return static_results, env_results
+
+    def position_index(self, load_pos: float):
+        """
+        Returns the index of 'load_pos' within the hoist load positions of the
+        influence lines, or None if it is not one of the positions.
+        """
+        if load_pos is None or self.step is None:
+            return None
+        pos_idx = int(np.abs(self.pos - load_pos).argmin())
+        if not np.isclose(self.pos[pos_idx], load_pos, rtol=0.0, atol=1e-9):
+            return None
+        return pos_idx
+
+    def batch_static(self, G_load: list, Q_load: float, load_pos: np.ndarray=None) -> dict:
+        """
+        Returns static analysis results for the hoist load placed at each of
+        an array of positions, as 2-D arrays with one row per hoist position.
+
+        Args:
+            G_load: PyCBA load matrix of the static (dead) loads.
+            Q_load: Hoist point load (kN).
+            load_pos: Array of 'x' distances of the hoist. If None, the hoist
+                load positions of the influence lines are used and no further
+                solves are required.
+
+        Returns:
+            A dict of matrixes and critical values results. For example:
+            {
+                "Matrixes": {
+                    "Deflections": np.array (n_positions, n_points),
+                    "Moment": np.array (n_positions, n_points),
+                    "Shear": np.array (n_positions, n_points),
+                    "x_dist": np.array (n_points),
+                    "Load Position": np.array (n_positions)
+                },
+                "Critical Values": {
+                    "Deflections": [D_max, D_min],
+                    "Moment": [M_max, M_min],
+                    "Shear": [V_max, V_min],
+                    "Reactions": np.array (n_positions, n_sup)
+                }
+            }
+            where each critical value is an array with one value per position.
+
+        """
+        static_G = self.static(G_load)
+        if load_pos is None:
+            load_pos = self.pos
+            M, V, D, Rxn = self._batch(*static_G, Q_load)
+        else:
+            load_pos = np.atleast_1d(np.asarray(load_pos, dtype=float))
+            span_idx, a_dist = self.locate(load_pos)
+            unit_Q = self.solve(
+                q=np.zeros((len(self.L), len(load_pos))),
+                P=np.ones(len(load_pos)),
+                span_idx=span_idx - 1,
+                a_dist=a_dist
+            )
+            M, V, D, Rxn = [G + Q_load * Q for G, Q in zip(static_G, unit_Q)]
+
+        results_output = {
+            "Matrixes": {
+                "Deflections": D,
+                "Moment": M,
+                "Shear": V,
+                "x_dist": self.x,
+                "Load Position": load_pos
+            },
+            "Critical Values": {
+                "Deflections": [D.max(axis=1) * 1000, D.min(axis=1) * 1000], # Converts to mm
+                "Moment": [M.max(axis=1), M.min(axis=1)],
+                "Shear": [V.max(axis=1), V.min(axis=1)],
+                "Reactions": Rxn
+            }
+        }
+        return results_output
+
+    def envelope(self, G_load: list, Q_load: float, exact: bool=False) -> dict:
+        """
+        Returns the moment, shear, deflection and reaction envelopes for a
+        hoist load 'Q_load' moving across the beam with the static load matrix
+        'G_load' applied, built by superposition of the unit load responses.
+
+        Args:
+            G_load: PyCBA load matrix of the static (dead) loads.
+            Q_load: Hoist point load (kN).
+            exact: If True, the critical moments, shears and deflections are
+                the exact extrema over the beam for each hoist position rather
+                than those of the sampled arrays.
+
+        Returns:
+            A dict of envelope arrays and critical values, in the same format
+            as 'beam_analysis.env_beam_model'.
+
+        """
+        results_output = self._envelope(*self._batch(*self.static(G_load), Q_load))
+        if exact:
+            self._exact_critical_values(
+                results_output["Critical Values"], self.hoist_polynomials(G_load, Q_load, self.pos), self.pos
+            )
+        return results_output
+
+    def adaptive_envelope(
+            self,
+            G_load: list,
+            Q_load: float,
+            coarse_step: float=1.0,
+            tol: float=1e-4,
+            min_step: float=None,
+            exact: bool=False
+    ) -> dict:
+        """
+        Returns the moment, shear, deflection and reaction envelopes for a
+        moving hoist load, found adaptively rather than by solving every load
+        increment. The hoist is first placed on a coarse grid and further
+        positions are then only added either side of the candidate extrema of
+        the critical moments, shears and deflections, halving the spacing on
+        each pass. Refinement stops once no candidate could change a critical
+        value by more than 'tol' (relative) or the spacing reaches 'min_step'.
+
+        All positions lie on the 'min_step' grid, so with a tolerance of zero
+        the critical values are those of a uniform sweep at 'min_step'.
+
+        Args:
+            G_load: PyCBA load matrix of the static (dead) loads.
+            Q_load: Hoist point load (kN).
+            coarse_step: Maximum spacing of the initial hoist positions (m).
+            tol: Relative change in the critical values at which to stop.
+            min_step: Finest spacing of the hoist positions (m). If None, the
+                moving load increment from 'load_increment' is used.
+            exact: If True, the critical moments, shears and deflections are
+                the exact extrema over the beam for each hoist position.
+
+        Returns:
+            A dict of envelope arrays and critical values in the same format as
+            'envelope', plus an "Evaluations" dict reporting the number of hoist
+            positions solved and refinement passes used.
+
+        """
+        if min_step is None:
+            min_step = load_increment(self.L)
+        n_grid = round(self.length / min_step) + 1
+        stride = 2 ** max(int(np.floor(np.log2(coarse_step / min_step))), 0)
+        grid_idx = np.unique(np.append(np.arange(0, n_grid, stride), n_grid - 1))
+
+        static_G = self.static(G_load)
+
+        def hoist_results(idx: np.ndarray) -> list:
+            unit_Q = self.unit_responses(np.minimum(idx * min_step, self.length))
+            return [G + Q_load * Q for G, Q in zip(static_G, unit_Q)]
+
+        M, V, D, Rxn = hoist_results(grid_idx)
+        n_iter = 0
+        while True:
+            order = np.argsort(grid_idx)
+            grid_idx, M, V, D, Rxn = [arr[order] for arr in (grid_idx, M, V, D, Rxn)]
+            per_pos = np.vstack([
+                M.max(axis=1), -M.min(axis=1),
+                V.max(axis=1), -V.min(axis=1),
+                D.max(axis=1), -D.min(axis=1),
+                Rxn.T, -Rxn.T
+            ])
+            crit = per_pos.max(axis=1, keepdims=True)
+
+            # Candidate extrema are the discrete local maxima of each critical
+            # value (minima are negated above), with plateaus counted once. A
+            # candidate is refined while its value plus the larger drop to its
+            # neighbours could still exceed the critical value by 'tol'.
+            left = np.pad(per_pos, ((0, 0), (1, 0)), mode='edge')[:, :-1]
+            right = np.pad(per_pos, ((0, 0), (0, 1)), mode='edge')[:, 1:]
+            left[:, 0] = right[:, 0]
+            right[:, -1] = left[:, -1]
+            is_peak = (per_pos > np.where(np.arange(len(grid_idx)) == 0, -np.inf, left)) & (per_pos >= right)
+            bound = 2 * per_pos - np.minimum(left, right)
+            active = is_peak & (bound > crit + tol * np.abs(crit))
+            if not active.any() or stride == 1:
+                break
+            stride //= 2
+
+            candidates = grid_idx[active.any(axis=0)]
+            new_idx = np.unique(np.concatenate([candidates - stride, candidates + stride]))
+            new_idx = new_idx[(new_idx >= 0) & (new_idx < n_grid) & ~np.isin(new_idx, grid_idx)]
+            if len(new_idx) == 0:
+                continue
+            n_iter += 1
+            new_res = hoist_results(new_idx)
+            grid_idx = np.concatenate([grid_idx, new_idx])
+            M, V, D, Rxn = [np.vstack([old, new]) for old, new in zip((M, V, D, Rxn), new_res)]
+
+        pos = np.minimum(grid_idx * min_step, self.length)
+        results_output = self._envelope(M, V, D, Rxn, pos)
+        if exact:
+            self._exact_critical_values(
+                results_output["Critical Values"], self.hoist_polynomials(G_load, Q_load, pos), pos
+            )
+        results_output["Evaluations"] = {"positions": len(pos), "iterations": n_iter}
+        return results_output
+
+    def _batch(
+            self,
+            M_G: np.ndarray,
+            V_G: np.ndarray,
+            D_G: np.ndarray,
+            R_G: np.ndarray,
+            Q_load: float
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the moment, shear, deflection and reaction arrays, with one
+        row per hoist load position, for a hoist load 'Q_load' superimposed on
+        pre-computed static load results.
+        """
+        M = M_G + Q_load * self.M
+        V = V_G + Q_load * self.V
+        D = D_G + Q_load * self.D
+        Rxn = R_G + Q_load * self.Rxn
+        return M, V, D, Rxn
+
+    def _envelope(
+            self,
+            M: np.ndarray,
+            V: np.ndarray,
+            D: np.ndarray,
+            Rxn: np.ndarray,
+            pos: np.ndarray=None
+    ) -> dict:
+        """
+        Returns the envelope results dict from moment, shear, deflection and
+        reaction arrays with one row per hoist load position in 'pos'. If 'pos'
+        is None, the hoist load positions of the influence lines are used.
+        """
+        if pos is None:
+            pos = self.pos
+
+        # Envelopes are bounded by zero and reactions are split into their
+        # positive and negative parts, consistent with PyCBA's Envelopes
+        cols = np.arange(len(self.x))
+        idx_Mmax, idx_Mmin = M.argmax(axis=0), M.argmin(axis=0)
+        idx_Vmax, idx_Vmin = V.argmax(axis=0), V.argmin(axis=0)
+        env = {
+            "Mmax": np.maximum(M[idx_Mmax, cols], 0.0),
+            "Mmin": np.minimum(M[idx_Mmin, cols], 0.0),
+            "Vmax": np.maximum(V[idx_Vmax, cols], 0.0),
+            "Vmin": np.minimum(V[idx_Vmin, cols], 0.0),
+            "Dmax": D.max(axis=0),
+            "Dmin": D.min(axis=0),
+            "x_dist": self.x
+        }
+
+        crit_values = {}
+        for key, vals, co_name, co_vals, idx in [
+            ("Mmax", M, "Vco", V, idx_Mmax),
+            ("Mmin", M, "Vco", V, idx_Mmin),
+            ("Vmax", V, "Mco", M, idx_Vmax),
+            ("Vmin", V, "Mco", M, idx_Vmin),
+        ]:
+            if key.endswith("max"):
+                col = env[key].argmax()
+                per_pos = vals.max(axis=1)
+            else:
+                col = env[key].argmin()
+                per_pos = vals.min(axis=1)
+            crit = env[key][col]
+            co_val = co_vals[idx[col], col] if crit != 0.0 else 0.0
+            crit_values[key] = {
+                "val": crit,
+                "at": self.x[col],
+                "pos": list(pos[np.isclose(per_pos, crit)]),
+                co_name: co_val
+            }
+        for key, func in [("Dmax", np.argmax), ("Dmin", np.argmin)]:
+            pos_idx, col = np.unravel_index(func(D), D.shape)
+            crit_values[key] = {"val": D[pos_idx, col], "at": self.x[col], "pos": pos[pos_idx]}
+        crit_values["nsup"] = Rxn.shape[1]
+        R_max = np.maximum(Rxn, 0.0)
+        R_min = np.minimum(Rxn, 0.0)
+        for i in range(Rxn.shape[1]):
+            crit_values[f"Rmax{i}"] = {"val": R_max[:, i].max(), "pos": pos[R_max[:, i].argmax()]}
+            crit_values[f"Rmin{i}"] = {"val": R_min[:, i].min(), "pos": pos[R_min[:, i].argmin()]}
+
+        results_output = {"Matrixes": env, "Critical Values": crit_values}
+        return results_output
+
+    def _exact_critical_values(self, crit_values: dict, polys: tuple, pos: np.ndarray):
+        """
+        Replaces the sampled critical moments, shears and deflections of an
+        envelope with the exact extrema of the piecewise polynomial results
+        'polys' (M, V, D), which have one load case per hoist position in 'pos'.
+        Envelope values clipped at zero are left unchanged.
+        """
+        fields = dict(zip(["M", "V", "D"], polys))
+        extrema = {name: poly.extrema() for name, poly in fields.items()}
+        for key, co_name, co_field in [
+            ("Mmax", "Vco", "V"), ("Mmin", "Vco", "V"),
+            ("Vmax", "Mco", "M"), ("Vmin", "Mco", "M"),
+            ("Dmax", None, None), ("Dmin", None, None)
+        ]:
+            max_val, max_at, min_val, min_at = extrema[key[0]]
+            if key.endswith("max"):
+                per_pos, at = max_val, max_at
+                pos_idx = per_pos.argmax()
+            else:
+                per_pos, at = min_val, min_at
+                pos_idx = per_pos.argmin()
+            crit = per_pos[pos_idx]
+            if co_name is None:
+                crit_values[key] = {"val": crit, "at": at[pos_idx], "pos": pos[pos_idx]}
+                continue
+            if (crit <= 0.0) if key.endswith("max") else (crit >= 0.0):
+                continue
+            crit_values[key] = {
+                "val": crit,
+                "at": at[pos_idx],
+                "pos": list(pos[np.isclose(per_pos, crit)]),
+                co_name: fields[co_field](at[pos_idx])[pos_idx, 0]
+            }
+
+
+def select_static_results(batch_results: dict, load_pos: float) -> dict:
+    """
+    Returns the static results for the hoist position in a set of batched
+    static results that is closest to 'load_pos', arranged in the same format
+    as 'beam_analysis.static_beam_model'.
+
+    Args:
+        batch_results: Results dict from 'InfluenceLines.batch_static'.
+        load_pos: 'x' distance of the hoist.
+
+    Returns:
+        A dict of matrixes and critical values results.
+
+    """
+    matrixes = batch_results["Matrixes"]
+    crit_values = batch_results["Critical Values"]
+    pos_idx = int(np.abs(matrixes["Load Position"] - load_pos).argmin())
+    results_output = {
+        "Matrixes": {
+            "Deflections": matrixes["Deflections"][pos_idx],
+            "Moment": matrixes["Moment"][pos_idx],
+            "Shear": matrixes["Shear"][pos_idx],
+            "x_dist": matrixes["x_dist"]
+        },
+        "Critical Values": {
+            "Deflections": [val[pos_idx] for val in crit_values["Deflections"]],
+            "Moment": [val[pos_idx] for val in crit_values["Moment"]],
+            "Shear": [val[pos_idx] for val in crit_values["Shear"]],
+            "Reactions": crit_values["Reactions"][pos_idx]
+        }
+    }
+    return results_output
@@ -0,0 +1,265 @@
+import hashlib
+import json
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from scipy.interpolate import PchipInterpolator
+from monorail_beam import beam_design, material_prop, sections_db
+from monorail_beam.beam_design import catalog_capacities
+from monorail_beam.sections_db import DB_PATH, sections_catalog
+from monorail_beam.utils import code_sha256, str_to_float
+
+
+# The version of the lookup table layout. Tables built with a different
+# version, from a different sections catalog or with different capacity rules
+# (see 'capacity_rules_sha256') are rejected on loading.
+LOOKUP_VERSION = 3
+LOOKUP_PATH = DB_PATH / "capacity_lookup_AU.npz"
+CATALOG_PATH = DB_PATH / "steel_section_sizes_AU.csv"
+
+# Effective lengths (mm) the member moment capacities are tabulated at. The
+# capacities vary smoothly with log(l_e), so the lengths are spaced evenly in
+# log(l_e).
+LOOKUP_EFF_LENGTHS = np.geomspace(250.0, 30000.0, 60)
+# The code the capacities of the tables are calculated with
+CAPACITY_RULES = (beam_design, material_prop, sections_db, str_to_float)
+
+
+@dataclass(frozen=True, eq=False)
+class LookupTables:
+    """
+    Precomputed capacities and span limits of every section in the sections
+    catalog, for screening sections without building and analysing a beam.
+    The values are interpolated from the tables and are approximate, so the
+    final section should be verified in full.
+
+    Attributes:
+        designations: Array of the section designations, in catalog order.
+        steel_grades: Array of the tabulated steel grades.
+        l_e: Array of the tabulated effective lengths (mm).
+        M_sx: Array of the factored section moment capacities (Nmm) of each
+            section and steel grade, NaN where the section is not produced in
+            the steel grade.
+        M_bx: Array of the factored member moment capacities (Nmm) of each
+            section, steel grade and effective length, for alpha_m = 1.0.
+        hoisting_classes: Array of the hoisting classes of the span limits.
+        capacities: Array of the maximum rated capacities (t) of the span
+            limits.
+        max_span: Array of the maximum permissible simply supported span (mm)
+            of each section, steel grade, hoisting class and capacity, NaN if
+            no span passes or the span limits were not tabulated.
+        span_inputs: Dict of the hoist inputs and search options the span
+            limits were found with.
+
+    """
+    designations: np.ndarray
+    steel_grades: np.ndarray
+    l_e: np.ndarray
+    M_sx: np.ndarray
+    M_bx: np.ndarray
+    hoisting_classes: np.ndarray
+    capacities: np.ndarray
+    max_span: np.ndarray
+    span_inputs: dict
+
+    def __post_init__(self):
+        # The cubic coefficients of every section and steel grade are found
+        # once and each query only evaluates the row it needs. The capacities of
+        # the grades that are not produced are NaN and are restored on querying.
+        n_lengths = self.M_bx.shape[-1]
+        M_bx_interp = PchipInterpolator(np.log(self.l_e), np.nan_to_num(self.M_bx.reshape(-1, n_lengths)), axis=1)
+        object.__setattr__(self, "_M_bx_coeffs", np.moveaxis(M_bx_interp.c, -1, 0))
+        object.__setattr__(self, "_section_index", {name: idx for idx, name in enumerate(self.designations)})
+        object.__setattr__(self, "_grade_index", {grade: idx for idx, grade in enumerate(self.steel_grades)})
+
+    def member_moment_capacity_x(self, designation: str, steel_grade: str, l_e) -> float:
+        """
+        Returns the factored member moment capacity (Nmm) of the section
+        'designation' in 'steel_grade' for the effective length 'l_e' (mm),
+        for alpha_m = 1.0. The capacity is interpolated monotonically in
+        log(l_e). 'l_e' may be an array. Effective lengths shorter than the
+        table use the shortest tabulated length and longer lengths are NaN.
+        """
+        row = self._row(designation, steel_grade)
+        l_e = np.clip(np.asarray(l_e, dtype=float), self.l_e[0], None)
+        log_l_e = np.log(self.l_e)
+        idx = np.clip(np.searchsorted(log_l_e, np.log(l_e), side='right') - 1, 0, len(log_l_e) - 2)
+        dx = np.log(l_e) - log_l_e[idx]
+        c = self._M_bx_coeffs[row][:, idx]
+        M_bx = ((c[0] * dx + c[1]) * dx + c[2]) * dx + c[3]
+        M_bx = np.where((l_e > self.l_e[-1]) | np.isnan(self.M_sx.flat[row]), np.nan, M_bx)
+        return M_bx.item() if M_bx.ndim == 0 else M_bx
+
+    def section_moment_capacity_x(self, designation: str, steel_grade: str) -> float:
+        """
+        Returns the factored section moment capacity (Nmm) of the section
+        'designation' in 'steel_grade'.
+        """
+        return self.M_sx.flat[self._row(designation, steel_grade)].item()
+
+    def max_simple_span(self, designation: str, steel_grade: str, hoisting_class: str, mrc: float) -> float:
+        """
+        Returns the maximum permissible simply supported span (mm) of the
+        section 'designation' in 'steel_grade' for the 'hoisting_class' and
+        maximum rated capacity 'mrc' (t). The span is interpolated linearly,
+        and so monotonically, between the tabulated capacities. NaN is
+        returned if 'mrc' is outside of the tabulated capacities or either of
+        the tabulated capacities either side of it has no permissible span.
+        """
+        section_idx, grade_idx = divmod(self._row(designation, steel_grade), len(self.steel_grades))
+        hc_idx = np.flatnonzero(self.hoisting_classes == hoisting_class)
+        if len(hc_idx) == 0:
+            raise KeyError(f"The hoisting class '{hoisting_class}' is not within the span limits!")
+        spans = self.max_span[section_idx, grade_idx, hc_idx[0]]
+        if not (self.capacities[0] <= mrc <= self.capacities[-1]):
+            return np.nan
+        upper = min(np.searchsorted(self.capacities, mrc, side='left'), len(self.capacities) - 1)
+        lower = upper - 1 if self.capacities[upper] > mrc else upper
+        if np.isnan(spans[[lower, upper]]).any():
+            return np.nan
+        return float(np.interp(mrc, self.capacities, spans))
+
+    def _row(self, designation: str, steel_grade: str) -> int:
+        """
+        Returns the row of the flattened section and steel grade tables.
+        """
+        try:
+            section_idx = self._section_index[designation]
+        except KeyError:
+            raise KeyError(f"The section '{designation}' is not within the lookup tables!")
+        try:
+            grade_idx = self._grade_index[steel_grade]
+        except KeyError:
+            raise KeyError(f"The steel grade '{steel_grade}' is not within the lookup tables!")
+        return section_idx * len(self.steel_grades) + grade_idx
+
+
+@lru_cache(maxsize=None)
+def lookup_tables(path: Path=LOOKUP_PATH) -> LookupTables:
+    """
+    Returns the LookupTables read from 'path'. The tables are read from file on
+    the first call and shared by all later calls.
+
+    A ValueError is raised if the tables were built with a different
+    LOOKUP_VERSION, from a different sections catalog or with different
+    capacity rules, in which case they should be rebuilt with
+    'build_lookup_tables'. Span limits found with different design checks
+    (see 'span_rules_sha256') are out of date and are dropped, as if they
+    were not tabulated.
+    """
+    with np.load(path, allow_pickle=False) as data:
+        tables = {key: data[key] for key in data.files}
+    if int(tables.pop("version")) != LOOKUP_VERSION:
+        raise ValueError(f"The lookup tables '{path}' are out of date and must be rebuilt.")
+    if str(tables.pop("catalog_sha256")) != catalog_sha256():
+        raise ValueError(f"The lookup tables '{path}' do not match the sections catalog and must be rebuilt.")
+    if str(tables.pop("capacity_rules_sha256")) != capacity_rules_sha256():
+        raise ValueError(f"The lookup tables '{path}' do not match the capacity rules and must be rebuilt.")
+    if str(tables.pop("span_rules_sha256")) != span_rules_sha256():
+        tables.update({
+            "hoisting_classes": np.array([], dtype=str),
+            "capacities": np.array([], dtype=float),
+            "max_span": np.empty(tables["max_span"].shape[:2] + (0, 0))
+        })
+    tables["span_inputs"] = json.loads(str(tables["span_inputs"]))
+    return LookupTables(**tables)
+
+
+def build_lookup_tables(
+        path: Path=LOOKUP_PATH,
+        steel_grades: tuple=("250", "300", "350", "400"),
+        l_e: np.ndarray=LOOKUP_EFF_LENGTHS,
+        span_table: pd.DataFrame=None,
+        span_inputs: dict=None
+) -> Path:
+    """
+    Calculates the lookup tables of every section in the sections catalog and
+    writes them to 'path'. Returns the path.
+
+    Args:
+        path: The '.npz' file the tables are written to.
+        steel_grades: The steel grades to tabulate.
+        l_e: The effective lengths (mm) to tabulate the member moment
+            capacities at, in ascending order.
+        span_table: Optional span table of simply supported spans, with the
+            columns written by 'monorail_span_tables.span_table'. If not
+            provided, no span limits are tabulated.
+        span_inputs: Optional dict of the inputs 'span_table' was generated
+            with, stored with the tables for reference.
+
+    """
+    catalog = sections_catalog()
+    designations = np.array(catalog.df['Designation'], dtype=str)
+    steel_grades = np.array(steel_grades, dtype=str)
+    l_e = np.asarray(l_e, dtype=float)
+    capacities_df = catalog_capacities(catalog.df, steel_grades, l_e=l_e)
+    M_bx_columns = [f'M_bx_{length:g}' for length in l_e]
+    # catalog_capacities stacks the sections of each steel grade in turn
+    M_sx = capacities_df['M_sx'].to_numpy().reshape(len(steel_grades), -1).T
+    M_bx = capacities_df[M_bx_columns].to_numpy().reshape(len(steel_grades), len(designations), -1).transpose(1, 0, 2)
+
+    if span_table is None:
+        hoisting_classes = np.array([], dtype=str)
+        mrc = np.array([], dtype=float)
+        max_span = np.empty((len(designations), len(steel_grades), 0, 0))
+    else:
+        span_table = span_table.loc[span_table['Arrangement'] == 'span']
+        hoisting_classes = np.array(sorted(span_table['Hoisting Class'].unique()), dtype=str)
+        mrc = np.array(sorted(span_table['MRC'].unique()), dtype=float)
+        max_span = np.full((len(designations), len(steel_grades), len(hoisting_classes), len(mrc)), np.nan)
+        index = [
+            pd.Index(designations).get_indexer(span_table['Designation']),
+            pd.Index(steel_grades).get_indexer(span_table['Steel Grade'].astype(str)),
+            pd.Index(hoisting_classes).get_indexer(span_table['Hoisting Class']),
+            pd.Index(mrc).get_indexer(span_table['MRC'])
+        ]
+        in_tables = np.all([idx >= 0 for idx in index], axis=0)
+        max_span[tuple(idx[in_tables] for idx in index)] = span_table['Span'].to_numpy(dtype=float)[in_tables]
+
+    np.savez_compressed(
+        path,
+        version=LOOKUP_VERSION,
+        catalog_sha256=catalog_sha256(),
+        capacity_rules_sha256=capacity_rules_sha256(),
+        span_rules_sha256=span_rules_sha256(),
+        designations=designations,
+        steel_grades=steel_grades,
+        l_e=l_e,
+        M_sx=M_sx,
+        M_bx=M_bx,
+        hoisting_classes=hoisting_classes,
+        capacities=mrc,
+        max_span=max_span,
+        span_inputs=json.dumps(span_inputs or {})
+    )
+    lookup_tables.cache_clear()
+    return Path(path)
+
+
+def catalog_sha256() -> str:
+    """
+    Returns the SHA-256 hash of the sections catalog file, used to detect
+    lookup tables built from a different catalog.
+    """
+    return hashlib.sha256(CATALOG_PATH.read_bytes()).hexdigest()
+
+
+def capacity_rules_sha256() -> str:
+    """
+    Returns the SHA-256 hash of the code of CAPACITY_RULES, used to detect
+    lookup tables built with different capacity rules.
+    """
+    return code_sha256(*CAPACITY_RULES)
+
+
+def span_rules_sha256() -> str:
+    """
+    Returns the SHA-256 hash of the design rules and checks the span limits
+    are found with (see 'monorail_beam_app_module.check_rules_sha256'), used
+    to detect out of date span limits.
+    """
+    # The app module builds on this package, so is only imported when needed
+    import monorail_beam_app_module as mba_mod
+    return mba_mod.check_rules_sha256()
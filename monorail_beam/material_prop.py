@@ -1,3 +1,33 @@
+import numpy as np
+
+
+# Plate yield stresses (MPa) of AS 4100:2020(+A1) Table 2.1, keyed on the steel
+# grade and residual stress category. Each entry is a tuple of the inclusive
+# maximum thicknesses (mm) and the corresponding yield stresses. Thickness
+# limits given as 'less than' in Table 2.1 are held as the next float below the
+# limit.
+YIELD_STRESS = {
+    ("250", "HR"): ((12.0, np.nextafter(40.0, 0.0), np.inf), (260.0, 250.0, 230.0)),
+    ("300", "HR"): ((np.nextafter(11.0, 0.0), 17.0, np.inf), (320.0, 300.0, 280.0)),
+    ("350", "HR"): ((11.0, np.nextafter(40.0, 0.0), np.inf), (360.0, 340.0, 330.0)),
+    ("250", "HW"): ((8.0, 12.0, 50.0, 80.0), (280.0, 260.0, 250.0, 240.0)),
+    ("300", "HW"): ((8.0, 12.0, 20.0, 50.0, 80.0), (320.0, 310.0, 300.0, 280.0, 270.0)),
+    ("400", "HW"): ((12.0, 20.0, 80.0), (400.0, 380.0, 360.0)),
+}
+# Welded sections are made from the same plate whatever the residual stress
+YIELD_STRESS.update({(grade, "LW"): values for (grade, cat), values in list(YIELD_STRESS.items()) if cat == "HW"})
+
+# Tensile strengths (MPa) of AS 4100:2020(+A1) Table 2.1, keyed on the steel
+# grade and residual stress category.
+TENSILE_STRENGTH = {
+    ("250", "HR"): 410.0,
+    ("300", "HR"): 440.0,
+    ("350", "HR"): 480.0,
+    ("250", "HW"): 410.0,
+    ("300", "HW"): 430.0,
+    ("400", "HW"): 480.0,
+}
+TENSILE_STRENGTH.update({(grade, "LW"): f_u for (grade, cat), f_u in list(TENSILE_STRENGTH.items()) if cat == "HW"})
 
 
 def plate_yield_stress(steel_grade: str, t: float, resi_stress_cat: str) -> float:
@@ -10,83 +40,50 @@ def plate_yield_stress(steel_grade: str, t: float, resi_stress_cat: str) -> floa
     resi_stress_cat: Residual Stress Category for the plate. Used to
         determine categorise the steel element in accordance with
         AS 4100:2020(+A1) Table 2.1.
+
+    Each of the inputs may be a single value or an array, which are broadcast
+    against each other. A float is returned for single values, otherwise an
+    array. The yield stress is NaN where the steel grade is not produced for
+    the residual stress category or the plate is thicker than Table 2.1 allows.
     """
-    if resi_stress_cat == "HR":
-        if steel_grade == '250':
-            if t <= 12.0:
-                f_y = 260.0
-            elif t < 40.0:
-                f_y = 250.0
-            else:
-                f_y = 230.0
-        elif steel_grade == '300':
-            if t < 11.0:
-                f_y = 320.0
-            elif t <= 17.0:
-                f_y = 300.0
-            else:
-                f_y = 280.0
-        elif steel_grade == '350':
-            if t <= 11.0:
-                f_y = 360.0
-            elif t < 40.0:
-                f_y = 340.0
-            else:
-                f_y = 330.0
-    else:
-        if steel_grade == '250':
-            if t <= 8.0:
-                f_y_plate = 280.0
-            elif t <= 12.0:
-                f_y = 260.0
-            elif t <= 50.0:
-                f_y = 250.0
-            elif t <= 80.0:
-                f_y = 240.0
-        elif steel_grade == '300':
-            if t <= 8.0:
-                f_y = 320.0
-            elif t <= 12.0:
-                f_y = 310.0
-            elif t <= 20.0:
-                f_y = 300.0
-            elif t <= 50.0:
-                f_y = 280.0
-            elif t <= 80.0:
-                f_y = 270.0
-        elif steel_grade == '400':
-            if t <= 12.0:
-                f_y = 400.0
-            elif t <= 20.0:
-                f_y = 380.0
-            elif t <= 80.0:
-                f_y = 360.0
-    return f_y
+    steel_grade, t, resi_stress_cat = _broadcast_inputs(steel_grade, t, resi_stress_cat)
+    f_y = np.full(t.shape, np.nan)
+    for (grade, cat), (t_max, f_y_table) in YIELD_STRESS.items():
+        mask = (steel_grade == grade) & (resi_stress_cat == cat)
+        if mask.any():
+            f_y_table = np.append(f_y_table, np.nan)
+            f_y[mask] = f_y_table[np.searchsorted(t_max, t[mask], side='left')]
+    return f_y.item() if f_y.ndim == 0 else f_y
 
 
 def plate_tensile_strength(steel_grade: str, resi_stress_cat: str) -> float:
     """
     Returns the steel plate element tensile strength 'fu' based on the
-    input 'steel grade' and plate thickness.
+    input 'steel grade' and residual stress category.
 
     steel_grade: Steel grade in accordance with AS/NZS 3678 or AS/NZS 3679.1.
-    t: Plate thickness (mm)
     resi_stress_cat: Residual Stress Category for the plate. Used to
         determine categorise the steel element in accordance with
         AS 4100:2020(+A1) Table 2.1.
+
+    Either input may be an array, as for 'plate_yield_stress'. The tensile
+    strength is NaN where the steel grade is not produced for the residual
+    stress category.
+    """
+    steel_grade, _, resi_stress_cat = _broadcast_inputs(steel_grade, 0.0, resi_stress_cat)
+    f_u = np.full(steel_grade.shape, np.nan)
+    for (grade, cat), f_u_table in TENSILE_STRENGTH.items():
+        f_u[(steel_grade == grade) & (resi_stress_cat == cat)] = f_u_table
+    return f_u.item() if f_u.ndim == 0 else f_u
+
+
+def _broadcast_inputs(steel_grade, t, resi_stress_cat) -> tuple:
+    """
+    Returns the steel grades and residual stress categories as string arrays,
+    and the thicknesses as a float array, broadcast to a common shape.
     """
-    if resi_stress_cat == "HR":
-        if steel_grade == '250':
-            f_u = 410.0
-        elif steel_grade == '300':
-            f_u = 440.0
-        elif steel_grade == '350':
-            f_u = 480.0
-    else:
-        if steel_grade == '250':
-            f_u = 410.0
-        elif steel_grade == '300':
-            f_u = 430.0
-        elif steel_grade == '400':
-            f_u = 480.0
-    return f_u
+    return np.broadcast_arrays(
+        np.asarray(steel_grade).astype(str),
+        np.asarray(t, dtype=float),
+        np.asarray(resi_stress_cat).astype(str)
+    )
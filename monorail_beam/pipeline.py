@@ -0,0 +1,154 @@
+import copy
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Optional
+from . import tracing
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    A named calculation of a Pipeline.
+
+    Attributes:
+        name: The name of the stage, by which later stages refer to its result.
+        func: Callable returning the result of the stage. It is called with
+            the values of 'inputs' as positional arguments.
+        inputs: The names of the pipeline inputs and earlier stages the
+            stage depends on.
+
+    """
+    name: str
+    func: Callable
+    inputs: tuple
+
+
+@dataclass
+class StageStats:
+    """
+    The number of runs of a stage that reused the previous result ('hits')
+    and that were recalculated ('misses').
+    """
+    hits: int = 0
+    misses: int = 0
+
+
+@dataclass
+class Pipeline:
+    """
+    A dependency graph of Stages that only recalculates the stages whose
+    inputs have changed since the previous run.
+
+    Each stage keeps its last inputs and result. The pipeline inputs are kept
+    as deep copies, so inputs that are modified in place between runs are
+    detected. A stage is recalculated if any of its pipeline inputs does not
+    compare equal to the copy, or any of the results of the earlier stages it
+    depends on is not the same object as before and does not compare equal to
+    it (values that can not be compared, such as NumPy arrays, are taken as
+    changed). A recalculated stage that gives an equal result (e.g. the beam
+    model of another steel grade of the same section) therefore does not cause
+    the later stages to be recalculated.
+
+    Attributes:
+        stages: The stages, in any order. Inputs that are not the name of a
+            stage are pipeline inputs, provided to 'run'.
+        stats: Dict of the StageStats of each stage, keyed by stage name.
+
+    """
+    stages: Iterable[Stage]
+    stats: dict = field(init=False)
+    _order: list = field(init=False, repr=False)
+    _memo: dict = field(init=False, repr=False, default_factory=dict)
+
+    def __post_init__(self):
+        self.stages = {stage.name: stage for stage in self.stages}
+        self.stats = {name: StageStats() for name in self.stages}
+        self._order = []
+        visiting = set()
+
+        def visit(name: str) -> None:
+            if name not in self.stages or name in self._order:
+                return
+            if name in visiting:
+                raise ValueError(f"The pipeline stage '{name}' depends on itself!")
+            visiting.add(name)
+            for input_name in self.stages[name].inputs:
+                visit(input_name)
+            visiting.discard(name)
+            self._order.append(name)
+
+        for name in self.stages:
+            visit(name)
+
+    def run(self, inputs: dict, targets: Optional[Iterable[str]]=None) -> dict:
+        """
+        Returns a dict of the results of the 'targets' stages (all stages by
+        default) for the pipeline 'inputs', keyed by stage name. Only the
+        stages the targets depend on are run.
+        """
+        targets = list(self.stages) if targets is None else list(targets)
+        needed = set()
+        pending = list(targets)
+        while pending:
+            name = pending.pop()
+            if name not in self.stages:
+                raise KeyError(f"The pipeline stage '{name}' does not exist!")
+            if name not in needed:
+                needed.add(name)
+                pending.extend(input_name for input_name in self.stages[name].inputs if input_name in self.stages)
+
+        values = {}
+        snapshots = {}
+        for name in self._order:
+            if name not in needed:
+                continue
+            stage = self.stages[name]
+            args = []
+            memo_args = []
+            for input_name in stage.inputs:
+                if input_name in self.stages:
+                    args.append(values[input_name])
+                    memo_args.append(values[input_name])
+                elif input_name in inputs:
+                    if input_name not in snapshots:
+                        snapshots[input_name] = copy.deepcopy(inputs[input_name])
+                    args.append(inputs[input_name])
+                    memo_args.append(snapshots[input_name])
+                else:
+                    raise KeyError(f"The pipeline input '{input_name}' of stage '{name}' was not provided!")
+            memo = self._memo.get(name)
+            if memo is not None and all(_unchanged(old, new) for old, new in zip(memo[0], args)):
+                self.stats[name].hits += 1
+                values[name] = memo[1]
+                continue
+            self.stats[name].misses += 1
+            with tracing.stage(name):
+                values[name] = stage.func(*args)
+            self._memo[name] = (memo_args, values[name])
+        return {name: values[name] for name in targets}
+
+    def stage_stats(self) -> dict:
+        """
+        Returns a dict of the hits and misses of each stage, keyed by stage
+        name.
+        """
+        return {name: {"hits": stats.hits, "misses": stats.misses} for name, stats in self.stats.items()}
+
+    def clear(self) -> None:
+        """
+        Clears the stored results and the stage statistics.
+        """
+        self._memo.clear()
+        self.stats = {name: StageStats() for name in self.stages}
+
+
+def _unchanged(old: Any, new: Any) -> bool:
+    """
+    Returns True if the stage input 'new' is the same object as, or equal to,
+    'old'.
+    """
+    if old is new:
+        return True
+    try:
+        return bool(old == new)
+    except (ValueError, TypeError):
+        return False
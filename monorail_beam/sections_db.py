@@ -1,8 +1,11 @@
 import pandas as pd
 import math
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from monorail_beam import beam_design
 from monorail_beam.beam_design import SteelBeam
-from monorail_beam.utils import str_to_float
 
 
 MODULE_PATH = Path(__file__)
@@ -13,14 +16,73 @@ DB_PATH = MODULE_PATH.parent
 # print(f"{DB_PATH=}")
 
 
+@dataclass(frozen=True, eq=False)
+class SectionsCatalog:
+    """
+    A read-only catalog of standard Australian I-Section sizes and geometric
+    properties, indexed on 'Designation'.
+
+    Attributes:
+        df: Pandas DataFrame of the section properties. The DataFrame is
+            shared by every user of the catalog and must not be modified.
+        index: Mapping of each 'Designation' to its row position in 'df'.
+        families: Mapping of each section family (e.g. 'UB') to a tuple of
+            the designations in that family, in catalog order.
+
+    """
+    df: pd.DataFrame
+    index: MappingProxyType
+    families: MappingProxyType
+
+    def section(self, designation: str) -> pd.Series:
+        """
+        Returns the properties of the section 'designation' as a Pandas
+        Series.
+        """
+        try:
+            row = self.index[designation]
+        except KeyError:
+            raise KeyError(f"The section '{designation}' is not within the data set!")
+        return self.df.iloc[row]
+
+    def section_list(self, family: str) -> list:
+        """
+        Returns a list of the section designations in 'family' (e.g. 'UB').
+        """
+        try:
+            return list(self.families[family])
+        except KeyError:
+            raise KeyError(f"The section family '{family}' is not within the data set!")
+
+
+@lru_cache(maxsize=None)
+def sections_catalog() -> SectionsCatalog:
+    """
+    Returns the SectionsCatalog of standard Australian I-Section sizes. The
+    catalog is read from file on the first call and shared by all later calls.
+    """
+    df = pd.read_csv(DB_PATH / "steel_section_sizes_AU.csv").dropna()
+    designations = list(df['Designation'])
+    index = {designation: row for row, designation in enumerate(designations)}
+    families = {}
+    for designation in designations:
+        family = designation.split()[1]
+        families.setdefault(family, []).append(designation)
+    catalog = SectionsCatalog(
+        df=df,
+        index=MappingProxyType(index),
+        families=MappingProxyType({family: tuple(names) for family, names in families.items()})
+    )
+    return catalog
+
+
 def import_sections_db() -> pd.DataFrame:
     """
     Returns a Pandas DataFrame of standard Australian I-Section sizes
-    and geometric properties.
+    and geometric properties. The DataFrame is a copy of the one held by
+    'sections_catalog', so may be modified freely.
     """
-    df = pd.read_csv(DB_PATH / "steel_section_sizes_AU.csv")
-    df_cleaned = df.dropna()
-    return df_cleaned
+    return sections_catalog().df.copy()
 
 
 def sections_filter(sections_df: pd.DataFrame, operator: str, **kwargs) -> pd.DataFrame:
@@ -79,29 +141,7 @@ def create_steelbeam(
 ) -> SteelBeam:
     """
     Returns a Steel_I_Beam dataclass, populated with the data stored in
-    a Pandas series 'beam_prop'.
+    a Pandas series 'beam_prop'. A ValueError is raised if the section is not
+    produced in 'steel_grade' (see 'beam_design.create_steelbeam').
     """
-    pd.to_numeric(beam_prop, 'ignore')
-    sb = SteelBeam(
-        A=str_to_float(beam_prop['A']),
-        I_x=str_to_float(beam_prop['Ix']),
-        I_y=str_to_float(beam_prop['Iy']),
-        Z_x=str_to_float(beam_prop['Zx']),
-        Z_y=str_to_float(beam_prop['Zy']),
-        S_x=str_to_float(beam_prop['Sx']),
-        S_y=str_to_float(beam_prop['Sy']),
-        r_x=str_to_float(beam_prop['rx']),
-        r_y=str_to_float(beam_prop['ry']),
-        J=str_to_float(beam_prop['J']),
-        I_w=str_to_float(beam_prop['Iw']),
-        beam_tag=beam_tag,
-        d=str_to_float(beam_prop['d']),
-        b_f=str_to_float(beam_prop['bf']),
-        t_f=str_to_float(beam_prop['tf']),
-        t_w=str_to_float(beam_prop['tw']),
-        r_1=str_to_float(beam_prop['r1']),
-        mass=str_to_float(beam_prop['Mass']),
-        steel_grade=steel_grade,
-        resi_stress_cat=beam_prop['Class']
-    )
-    return sb
\ No newline at end of file
+    return beam_design.create_steelbeam(beam_prop, steel_grade, beam_tag)
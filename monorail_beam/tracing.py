@@ -0,0 +1,124 @@
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Optional
+
+
+_ACTIVE_TRACE = ContextVar("_ACTIVE_TRACE", default=None)
+_NO_STAGE = nullcontext()
+
+
+@dataclass
+class Trace:
+    """
+    A structured record of the intermediate design values and stage timings
+    collected while tracing is active (see 'tracing').
+
+    Attributes:
+        values: List of the recorded values, each a dict keyed with 'stage',
+            'name' and 'value'. 'stage' is the '/' separated path of the
+            stages the value was recorded in ('' outside of any stage).
+        timings: Dict of the wall times (s) of each completed stage, keyed by
+            the '/' separated stage path, with one entry per run of the stage.
+        hook: Optional callable, called with (stage, name, value) for every
+            recorded value (e.g. to forward the values to a logger).
+
+    """
+    values: list = field(default_factory=list)
+    timings: dict = field(default_factory=dict)
+    hook: Optional[Callable] = None
+    _stages: list = field(default_factory=list, repr=False)
+
+    def get(self, name: str, stage: Optional[str]=None) -> list:
+        """
+        Returns a list of every value recorded as 'name', in the order they
+        were recorded. If 'stage' is provided, only the values recorded within
+        that stage path are returned.
+        """
+        return [
+            record["value"] for record in self.values
+            if record["name"] == name and (stage is None or record["stage"].startswith(stage))
+        ]
+
+    def summary(self) -> dict:
+        """
+        Returns a dict of the number of runs 'calls' and the total wall time
+        'total' (s) of each stage, keyed by the stage path.
+        """
+        return {path: {"calls": len(times), "total": sum(times)} for path, times in self.timings.items()}
+
+
+@contextmanager
+def tracing(hook: Optional[Callable]=None) -> Iterator[Trace]:
+    """
+    Context manager that records the design values and stage timings of the
+    calculations run within it into the Trace it yields. Tracing is off
+    outside of the context manager and the instrumented functions then only
+    check whether tracing is active.
+
+    Args:
+        hook: Optional callable, called with (stage, name, value) for every
+            recorded value.
+
+    Example:
+        with tracing() as trace:
+            run_analysis(app_inputs)
+        trace.summary()
+
+    """
+    trace = Trace(hook=hook)
+    token = _ACTIVE_TRACE.set(trace)
+    try:
+        yield trace
+    finally:
+        _ACTIVE_TRACE.reset(token)
+
+
+def tracing_active() -> bool:
+    """
+    Returns True if tracing is active. Used to skip preparing values that are
+    only needed for recording.
+    """
+    return _ACTIVE_TRACE.get() is not None
+
+
+def record(name: str, value: Any) -> None:
+    """
+    Records the intermediate design value 'value' as 'name' in the active
+    Trace. Does nothing if tracing is not active.
+    """
+    trace = _ACTIVE_TRACE.get()
+    if trace is None:
+        return
+    stage_path = "/".join(trace._stages)
+    trace.values.append({"stage": stage_path, "name": name, "value": value})
+    if trace.hook is not None:
+        trace.hook(stage_path, name, value)
+
+
+def stage(name: str):
+    """
+    Returns a context manager that times the calculations run within it as the
+    stage 'name' of the active Trace. Stages may be nested. A shared no-op
+    context manager is returned if tracing is not active.
+    """
+    trace = _ACTIVE_TRACE.get()
+    if trace is None:
+        return _NO_STAGE
+    return _timed_stage(trace, name)
+
+
+@contextmanager
+def _timed_stage(trace: Trace, name: str) -> Iterator[None]:
+    """
+    Times the stage 'name' of 'trace'. See 'stage'.
+    """
+    trace._stages.append(name)
+    stage_path = "/".join(trace._stages)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.timings.setdefault(stage_path, []).append(time.perf_counter() - start)
+        trace._stages.pop()
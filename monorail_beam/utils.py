@@ -1,3 +1,6 @@
+import ast
+import hashlib
+import inspect
 import math
 import csv
 
@@ -53,4 +56,27 @@ def round_up(n, decimals=0) -> float:
     Returns a number rounded up to the specified number of decimal places.
     """
     multiplier = 10 ** decimals 
-    return math.ceil(n * multiplier) / multiplier
\ No newline at end of file
+    return math.ceil(n * multiplier) / multiplier
+
+
+def code_sha256(*modules) -> str:
+    """
+    Returns the SHA-256 hash of the code of 'modules' (or functions), used to
+    detect results calculated with different design rules. The comments, docstrings and
+    formatting of the source are ignored, so only changes to the code change
+    the hash.
+    """
+    sha256 = hashlib.sha256()
+    for module in modules:
+        tree = ast.parse(inspect.getsource(module))
+        for node in ast.walk(tree):
+            body = getattr(node, 'body', None)
+            if (
+                isinstance(node, (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef))
+                and isinstance(body[0], ast.Expr)
+                and isinstance(body[0].value, ast.Constant)
+                and isinstance(body[0].value.value, str)
+            ):
+                node.body = body[1:] or [ast.Pass()]
+        sha256.update(ast.dump(tree).encode())
+    return sha256.hexdigest()
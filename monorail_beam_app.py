@@ -54,8 +54,8 @@ with tab0:
     st.write(
         "This objective of this app is to provide structural engineers with a simple " +
         "tool to check a simple monorail beam with a single hoist. The user may input " +
-        "a monorail beam with either 1 or 2 spans supported at both ends, with " +
-        "the possibility of adding a cantilever on the right hand side.")
+        "a monorail beam with up to 20 spans supported at both ends, with " +
+        "the possibility of adding a cantilever on either side.")
 
     st.markdown("#### Disclaimer")
     st.write(
@@ -70,9 +70,12 @@ with tab0:
     st.write("- Only straight monorails are considered. Curved monorails are beyond the scope of this app")
     st.write("- The monorail beam is assumed to be a single beam of I-Section geometry")
     st.write("- Only Australian steel sizes and grades are currently available")
-    st.write("- Conservatively, alpha_m has been set as 1.0. Future revisions may allow the user " +
-             "to provide this manually for each span.")
+    st.write("- alpha_m is calculated from the ULS moments at the quarter points of each segment for " +
+             "every hoist position. Segments unrestrained at one end (e.g. cantilevers) conservatively " +
+             "adopt an alpha_m of 1.0.")
     st.write("- The factor K_L needs to be set manually to suit the location of input moment")
+    st.write("- By default, the local flange checks conservatively adopt the maximum bending stress at each " +
+             "location from any hoist position. The bending stress at the wheel position may be adopted instead.")
 
     st.markdown("#### Exclusions")
     st.write("- The assessment of connections at the monorail support points")
@@ -82,12 +85,6 @@ with tab0:
 
     st.markdown("#### Current 'Work in Progress' Items")
     st.write("- Ability to add bottom flange strengthening plates.")
-    st.write("- Option to automatically determine the location max/min deflections " +
-             "and pass through to deflection checks. Currently this is done manually.")
-    st.write("- Option to automatically pass the calculated moments through the design " +
-             "checks. Currently only manual input to allow flexibility with other software.")
-    st.write("- Beam shear is not currently checked, though this is rarely a governing factor " +
-             "for the design of monorail beams. Will be added for completeness.")
 
 # Setup and formatting of 'Monorail Geometry' tab
 with tab1:
@@ -95,51 +92,56 @@ with tab1:
 
     col_1_1, col_1_2 = st.columns(2)
     with col_1_1:
-        num_of_end_spans = st.number_input("Number of Internal Spans with Supports at Both Ends", value=1, min_value=1, max_value=2, step=1)
+        num_of_end_spans = st.number_input("Number of Internal Spans with Supports at Both Ends", value=1, min_value=1, max_value=20, step=1)
     with col_1_2:
+        cant_left = st.toggle("Cantilever on Left-Hand Side")
         cant_right = st.toggle("Cantilever on Right-Hand Side")
 
+    # Segments are ordered from left to right, with any cantilevers first and last
+    int_restraint_types = ["FF", "FP", "PP"]
+    cant_restraint_types = ["FU", "PU"]
+    geometry = {}
     col_1_3, col_1_4 = st.columns(2)
-    with col_1_3:
-        if num_of_end_spans == 1:
-            beam_span_1 = st.number_input("Beam Span / Backspan (mm)", value=4000, min_value=0, step=50)
-            beam_span_2 = 0
-            support_rest = {0.0: "P", beam_span_1: "R"}
-        elif num_of_end_spans == 2:
-            beam_span_1 = st.number_input("Beam Span No. 1 (mm)", value=4000, min_value=0, step=50)
-            beam_span_2 = st.number_input("Beam Span No. 2 (mm)", value=4000, min_value=0, step=50)
-            support_rest = {0.0: "P", beam_span_1: "R", beam_span_1 + beam_span_2: "R"}
-        
-        if cant_right == True:
+    if cant_left == True:
+        with col_1_3:
+            cant_span_L = st.number_input("LHS Cantilever Span (mm)", value=2000, min_value=0, step=50)
+        with col_1_4:
+            cant_L_restraint = st.selectbox("LHS Cantilever Restraint Arrangement", cant_restraint_types, placeholder="FU")
+        geometry.update({"LHS Cantilever": {"Span": cant_span_L, "Restraint": cant_L_restraint}})
+    for span_num in range(1, num_of_end_spans + 1):
+        with col_1_3:
+            beam_span = st.number_input(f"Beam Span No. {span_num} (mm)", value=4000, min_value=0, step=50)
+        with col_1_4:
+            seg_restraint = st.selectbox(f"Beam Span No. {span_num} Restraint Arrangement", int_restraint_types, placeholder="FF")
+        geometry.update({f"Span {span_num}": {"Span": beam_span, "Restraint": seg_restraint}})
+    if cant_right == True:
+        with col_1_3:
             cant_span_R = st.number_input("RHS Cantilever Span (mm)", value=2000, min_value=0, step=50)
-        else:
-            cant_span_R = 0
-        
-    with col_1_4:
-        int_restraint_types = ["FF", "FP", "PP"]
-        cant_restraint_types = ["FU", "PU"]
-        if num_of_end_spans == 1:
-            seg_1_restraint = st.selectbox("Beam Span / Backspan Restraint Arrangement", int_restraint_types, placeholder="FF")
-            seg_2_restraint = "FF"
-        elif num_of_end_spans == 2:
-            seg_1_restraint = st.selectbox("Beam Span No. 1 Restraint Arrangement", int_restraint_types, placeholder="FF")
-            seg_2_restraint = st.selectbox("Beam Span No. 2 Restraint Arrangement", int_restraint_types, placeholder="FF")
-        
-        if cant_right == True:
+        with col_1_4:
             cant_R_restraint = st.selectbox("RHS Cantilever Restraint Arrangement", cant_restraint_types, placeholder="FU")
-        else:
-            cant_R_restraint = "FU"
+        geometry.update({"RHS Cantilever": {"Span": cant_span_R, "Restraint": cant_R_restraint}})
+
+    cantilevers = [name for name in geometry if name.endswith("Cantilever")]
+    support_rest = {}
+    x_support = 0
+    for name, segment in geometry.items():
+        if name != "LHS Cantilever":
+            support_rest.update({x_support: "R" if support_rest else "P"})
+        x_support += segment["Span"]
+    if cant_right == False:
+        support_rest.update({x_support: "R"})
 
 # Create a dictionary of all the inputs and passes to the monorail beam_app_module
-total_length = beam_span_1 + beam_span_2 + cant_span_R
+total_length = sum(segment["Span"] for segment in geometry.values())
 
 # Setup and formatting of 'Results Diagrams' tab
 with tab2:
     st.markdown("#### Position of Point Load")
     st.write(
         "The slider below moves the position of the point load for the purposes of checking deflections " +
-        "at a given point as these are not solved in an envelope. The bending moment and shear force " +
-        "diagrams overlay the design action curves generated from moving the hoist along the beam.")
+        "at a given point. The bending moment and shear force diagrams overlay the design action curves " +
+        "generated from moving the hoist along the beam, and the deflection diagram overlays the " +
+        "SLS deflection envelope as dashed lines.")
     hoist_pos = st.slider("Position of Point Load",min_value=0, max_value=total_length, step=50, label_visibility='hidden')
     
     inputs = {
@@ -154,17 +156,23 @@ with tab2:
             "Wheel Load Dist": wheel_load_dist,
             "Peak Loading Cycles": n_cycles
         },
-        "Geometry": {
-            "Span 1": {"Span": beam_span_1, "Restraint": seg_1_restraint},
-            "Span 2": {"Span": beam_span_2, "Restraint": seg_2_restraint},
-            "Span 3": {"Span": cant_span_R, "Restraint": cant_R_restraint}
-        },
+        "Geometry": geometry,
         "Cantilever": cant_right,
+        "Left Cantilever": cant_left,
         "Supports": support_rest,
         "Total Length": total_length,
         "Steel Data": {"Steel Grade": steel_grade, "Section Size": section_size}
     }
-    static_results, env_results, sb_data = mba_mod.run_analysis(app_inputs=inputs)
+    # The design pipeline is kept between reruns of the app, so each rerun only
+    # recalculates the stages affected by the inputs that changed
+    if "design_pipeline" not in st.session_state:
+        st.session_state["design_pipeline"] = mba_mod.design_pipeline()
+    design_pipeline = st.session_state["design_pipeline"]
+    pipeline_inputs = mba_mod.pipeline_inputs(inputs, cf_bf=cf_bf)
+    pipeline_results = design_pipeline.run(pipeline_inputs, targets=("static", "envelopes", "section"))
+    static_results = pipeline_results["static"]
+    env_results = pipeline_results["envelopes"]
+    sb_data = pipeline_results["section"]
 
     # Extracts the max and min design actions from the envelope critical values dict
     M_max_val = utils.round_up(env_results['ULS']['Critical Values']['Mmax']['val'], 2)
@@ -233,19 +241,28 @@ with tab2:
         fig_shear.update_layout(showlegend=False)
         fig_shear
 
-    beam_cont_defl_lim_upper = max(beam_span_1, beam_span_2)  / 300
-    beam_cont_defl_lim_lower = -max(beam_span_1, beam_span_2) / 300 
-
-    beam_cant_defl_lim_upper = cant_span_R  / 500
-    beam_cant_defl_lim_lower = -cant_span_R / 500 
+    # The deflection limits of each segment are those of the deflection check
+    segments = design_pipeline.run(pipeline_inputs, targets=("segments",))["segments"]
 
     tab2_expander_3 = st.expander(label="# Deflection Diagram", expanded=False)
     with tab2_expander_3:
         # Generates deflection diagram for specific static load case
         x_val_D = static_results['SLS']['Matrixes']['x_dist']
         y_val_D = static_results['SLS']['Matrixes']['Deflections'] * 1000
+        x_val_D_env = env_results['SLS']['Matrixes']['x_dist']
+        y_val_Dmax_env = env_results['SLS']['Matrixes']['Dmax'] * 1000
+        y_val_Dmin_env = env_results['SLS']['Matrixes']['Dmin'] * 1000
         fig_defl = go.Figure()
+        fig_defl.add_trace(go.Scatter(x=x_val_D_env, y=y_val_Dmin_env, line={'color': 'rgb(128,128,128)', 'width': 1, 'dash': 'dash'}))
+        fig_defl.add_trace(go.Scatter(x=x_val_D_env, y=y_val_Dmax_env, line={'color': 'rgb(128,128,128)', 'width': 1, 'dash': 'dash'}))
         fig_defl.add_trace(go.Scatter(x=x_val_D, y=y_val_D, line={'color': 'rgb(255,0,0)', 'width': 3}))
+        for segment in segments:
+            for sign in (1, -1):
+                fig_defl.add_trace(go.Scatter(
+                    x=[segment["Start"], segment["End"]],
+                    y=[sign * segment["Deflection Limit"]] * 2,
+                    line={'color': 'rgb(255,165,0)', 'width': 1}
+                ))
         fig_defl.layout.width = 650
         fig_defl.layout.width = 650
         fig_defl.layout.height = 400
@@ -264,98 +281,87 @@ with tab2:
 
 # Setup and formatting of 'Beam Design' tab
 with tab3:
-    st.markdown("#### Bending Moment Input")
-    st.write(
-        "Instead of automatically passing through the design actions, the user is required to input " +
-        "the design actions desired to be checked. This is to provide flexibility if the design actions " +
-        "have been calculated using other software")
-    M_max_cont = st.number_input("Maximum Bending Moment in Continuous Beam / Backspan (kNm)", value=0.0, min_value=0.0)
-    if cant_span_R != 0:
-        M_max_cant = st.number_input("Maximum Bending Moment in Cantilevered Beam (kNm)", value=0.0, min_value=0.0)
-    else:
-        M_max_cant = 0
-    st.markdown("""<hr style="height:10px;border:none;color:#333;background-color:#333;" /> """, unsafe_allow_html=True)
-    
     st.markdown("#### Global Bending Capacity Checks")
-    beam_design_results = mba_mod.beam_capacity(app_inputs=inputs, sb=sb_data)
-    st.markdown("##### Span 1")
-    col_3_1, col_3_2, col_3_3 = st.columns([3,1,3])
-
-    with col_3_1:
-        st.write(f"Effective Length, le =")
-        st.write(f"Alpha_m =")
-        st.write(f"Member Bending Capacity, $phi.M_bx$ =")
-    with col_3_2:
-        st.write(f"{utils.round_up(beam_design_results['Span 1']['l_e'], 2)} mm")
-        st.write(f"{utils.round_up(beam_design_results['Span 1']['alpha_m'], 2)}")
-        st.write(f"{utils.round_down(beam_design_results['Span 1']['M_bx']* 1e-6, 2)} kNm")
-    with col_3_3:
-        st.write(".")
-        st.write(".")
-        if utils.round_down(beam_design_results['Span 1']['M_bx'] * 1e-6, 2)  < M_max_cont:
-            st.write(f":red[NOT OK: Member Bending Capacity Exceeded.]")
-        else:
-            st.write(f":green[OK: Member Bending Capacity is Adequate.]")
-
-    if beam_span_2 != 0:
-        st.markdown("##### Span 2")
-        col_3_4, col_3_5, col_3_6 = st.columns([3,1,3])
-        with col_3_4:
+    st.write(
+        "The design moments are the ULS moments with the hoist at each position along the beam. " +
+        "The moment modification factor alpha_m is calculated from the moments at the quarter points " +
+        "of each segment for each hoist position, and the results are shown for the governing hoist position.")
+    bending_results = design_pipeline.run(pipeline_inputs, targets=("bending checks",))["bending checks"]
+    for name, result in bending_results.items():
+        st.markdown(f"##### {name}")
+        col_3_1, col_3_2, col_3_3 = st.columns([3,1,3])
+        with col_3_1:
+            st.write(f"Governing Hoist Position =")
+            st.write(f"Design Bending Moment, M* =")
             st.write(f"Effective Length, le =")
             st.write(f"Alpha_m =")
             st.write(f"Member Bending Capacity, $phi.M_bx$ =")
-        with col_3_5:
-            st.write(f"{utils.round_up(beam_design_results['Span 2']['l_e'], 2)} mm")
-            st.write(f"{utils.round_up(beam_design_results['Span 2']['alpha_m'], 2)}")
-            st.write(f"{utils.round_down(beam_design_results['Span 2']['M_bx']* 1e-6, 2)} kNm")
-        with col_3_6:
+        with col_3_2:
+            st.write(f"{utils.round_up(result['Hoist Position'], 2)} m")
+            st.write(f"{utils.round_up(result['M*'], 2)} kNm")
+            st.write(f"{utils.round_up(result['l_e'], 2)} mm")
+            st.write(f"{utils.round_up(result['alpha_m'], 2)}")
+            st.write(f"{utils.round_down(result['M_bx'], 2)} kNm")
+        with col_3_3:
             st.write(".")
             st.write(".")
-            if utils.round_down(beam_design_results['Span 2']['M_bx'] * 1e-6, 2)  < M_max_cont:
-                st.write(f":red[NOT OK: Member Bending Capacity Exceeded.]")
-            else:
-                st.write(f":green[OK: Member Bending Capacity is Adequate.]")
-
-    if cant_span_R != 0:
-        st.markdown("##### Cantilever Span")
-        col_3_7, col_3_8, col_3_9 = st.columns([3,1,3])
-        with col_3_7:
-            st.write(f"Effective Length, le =")
-            st.write(f"Alpha_m =")
-            st.write(f"Member Bending Capacity, $phi.M_bx$ =")
-        with col_3_8:
-            st.write(f"{utils.round_up(beam_design_results['Span 3']['l_e'], 2)} mm")
-            st.write(f"{utils.round_up(beam_design_results['Span 3']['alpha_m'], 2)}")
-            st.write(f"{utils.round_down(beam_design_results['Span 3']['M_bx']* 1e-6, 2)} kNm")
-        with col_3_9:
             st.write(".")
             st.write(".")
-            if utils.round_down(beam_design_results['Span 3']['M_bx'] * 1e-6, 2)  < M_max_cont:
+            if result['Utilisation'] > 1.0:
                 st.write(f":red[NOT OK: Member Bending Capacity Exceeded.]")
             else:
                 st.write(f":green[OK: Member Bending Capacity is Adequate.]")
     st.markdown("""<hr style="height:10px;border:none;color:#333;background-color:#333;" /> """, unsafe_allow_html=True)
 
-    st.markdown("#### Local Checks")
-    M_max_dyn = st.number_input("Maximum Dynamically Factored Bending Moment at Location of Wheel Load (kNm)", value=0.0, min_value=0.0)
-    n_wheel = wheel_load_dist * sb_data.Q_load_dls * 1e-2
-    bending_stress = M_max_dyn * 1e6 / sb_data.Z_x
+    st.markdown("#### Shear Capacity Checks")
     load_pos_fact_list = ['1.0', '1.3']
-    K_L = st.selectbox("Load Position Factor, $K_L$", load_pos_fact_list, placeholder='1.3')
-    min_flg_thk, min_web_thk = mba_mod.calc_min_element_thickness(
-        N_W=n_wheel,
-        f_y=min(sb_data.yield_stress_flg(), sb_data.yield_stress_web()),
-        D=sb_data.d,
-        f_b=bending_stress,
-        K_L=utils.str_to_float(K_L),
-        C_F=cf_bf * sb_data.b_f * 0.5,
-        B_F=sb_data.b_f * 0.5,
-        n_cycles=n_cycles
-    )
+    K_L = st.selectbox("Load Position Factor for Local Checks, $K_L$", load_pos_fact_list, placeholder='1.3')
+    wheel_stress = st.toggle("Local Checks Use the Bending Stress at the Wheel Position")
+    pipeline_inputs.update({"K_L": utils.str_to_float(K_L), "wheel_stress": wheel_stress})
+    pipeline_results = design_pipeline.run(pipeline_inputs, targets=("utilisation", "local checks", "design loads"))
+    utilisation_results = pipeline_results["utilisation"]
+    governing = utilisation_results["Governing"]
+    V_max = governing["Shear"]["val"] * sb_data.shear_capacity() * 1e-3
+    col_3_7, col_3_8, col_3_9 = st.columns([3,1,3])
+    with col_3_7:
+        st.write(f"Design Shear Force, V* =")
+        st.write(f"Web Shear Capacity, $phi.V_v$ =")
+    with col_3_8:
+        st.write(f"{utils.round_up(V_max, 2)} kN")
+        st.write(f"{utils.round_down(sb_data.shear_capacity() * 1e-3, 2)} kN")
+    with col_3_9:
+        st.write(".")
+        if governing["Shear"]["val"] > 1.0:
+            st.write(f":red[NOT OK: Web Shear Capacity Exceeded.]")
+        else:
+            st.write(f":green[OK: Web Shear Capacity is Adequate.]")
+    st.markdown("""<hr style="height:10px;border:none;color:#333;background-color:#333;" /> """, unsafe_allow_html=True)
+
+    st.markdown("#### Local Checks")
+    if wheel_stress:
+        st.write(
+            "The bending stress for each hoist position is taken from the DLS moment at the wheel " +
+            "position. The results are shown for the governing hoist position.")
+    else:
+        st.write(
+            "The bending stress at each location is taken from the maximum DLS moment at that location " +
+            "from any hoist position. The results are shown for the governing location.")
+    design_loads = pipeline_results["design loads"]
+    n_wheel = wheel_load_dist * design_loads['DLS'] * 1e-2
+    flg_pos = governing["Flange"]["at"]
+    if wheel_stress:
+        local_results = pipeline_results["local checks"]
+        pos_idx = int(abs(local_results["Load Position"] - flg_pos).argmin())
+        bending_stress = local_results["f_b"][pos_idx]
+    else:
+        bending_stress = mba_mod.envelope_peak(env_results['DLS'], 'M', flg_pos, flg_pos) * 1e6 / sb_data.Z_x
+    min_flg_thk = governing["Flange"]["val"] * sb_data.t_f
+    min_web_thk = governing["Web"]["val"] * sb_data.t_w
 
     col_3_10, col_3_11, col_3_12 = st.columns([3,1,3])
     with col_3_10:
         st.write(f"Maximum Dynamic Wheel Load, N_w =")
+        st.write(f"Governing Location, x =")
         st.write(f"Dynamically Factored Bending Stress, f_b =")
         st.write(f"Min Flange Thickness Required, tf.min =")
         st.write(f"Monorail Beam Flange Thickness, tf =")
@@ -363,8 +369,12 @@ with tab3:
         st.write(f"Monorail Beam Web Thickness, tw =")
     with col_3_11:
         st.write(f"{utils.round_up(n_wheel, 2)} kN")
+        st.write(f"{utils.round_up(flg_pos, 2)} m")
         st.write(f"{utils.round_up(bending_stress, 2)} MPa")
-        st.write(f"{utils.round_up(min_flg_thk, 1)} mm")
+        if min_flg_thk == float("inf"):
+            st.write(f"N/A (f_b exceeds 0.67 f_y)")
+        else:
+            st.write(f"{utils.round_up(min_flg_thk, 1)} mm")
         st.write(f"{utils.round_up(sb_data.t_f, 1)} mm")
         st.write(f"{utils.round_up(min_web_thk, 1)} mm")
         st.write(f"{utils.round_up(sb_data.t_w, 1)} mm")
@@ -372,62 +382,63 @@ with tab3:
         st.write(".")
         st.write(".")
         st.write(".")
-        if min_flg_thk > sb_data.t_f:
+        if governing["Flange"]["val"] > 1.0:
             st.write(f":red[NOT OK: Increase flange thickness.]")
         else:
             st.write(f":green[OK: Flange thickness is adequate.]")
         st.write(".")
-        if min_web_thk > sb_data.t_w:
+        if governing["Web"]["val"] > 1.0:
             st.write(f":red[NOT OK: Increase web thickness.]")
         else:
             st.write(f":green[OK: Web thickness is adequate.]")
     st.markdown("""<hr style="height:10px;border:none;color:#333;background-color:#333;" /> """, unsafe_allow_html=True)
  
     st.markdown("#### Deflection Checks")
-    st.write("Deflections to be manually input in the fields below for checks against deflection limits. " +
-             "Deflections shall be input as absolute/positive values.")
-    if beam_span_2 != 0:
-        defl_max_span_1 = st.number_input("Maximum Deflection in Beam Span 1 (mm)", value=0.0, min_value=0.0)
-        defl_max_span_2 = st.number_input("Maximum Deflection in Beam Span 2 (mm)", value=0.0, min_value=0.0)
-    else:
-        defl_max_span_1 = st.number_input("Maximum Deflection in Continuous Beam / Backspan (mm)", value=0.0, min_value=0.0)
-    if cant_span_R != 0:
-        defl_max_cant = st.number_input("Maximum Deflection in Cantilevered Beam (mm)", value=0.0, min_value=0.0)
-    else:
-        defl_max_cant = 0
-
-    col_3_13, col_3_14, col_3_15 = st.columns([3,1,3])
-    with col_3_13:
-        if beam_span_2 != 0:
-            st.write(f"Beam Span 1 Deflection Limit, d.lim =")
-            st.write(f"Beam Span 2 Deflection Limit, d.lim =")
-        else:
-            st.write(f"Beam / Backspan Deflection Limit, d.lim =")
-        if cant_span_R != 0:
-            st.write(f"Cantilever Deflection Limit, d =")
-    with col_3_14:
-        if beam_span_2 != 0:
-            st.write(f"{beam_span_1 / 500} mm")
-            st.write(f"{beam_span_2 / 500} mm")
-        else:
-            st.write(f"{beam_span_1 / 500} mm")
-        if cant_span_R != 0:
-            st.write(f"{cant_span_R / 300} mm")
-    with col_3_15:
-        if defl_max_span_1 > (beam_span_1/ 500):
-            st.write(f":red[NOT OK: Deflection exceeds limit of SPAN / 500.]")
-        else:
-            st.write(f":green[OK: Deflections are below acceptable limits.]")
-        if beam_span_2 != 0:
-            if defl_max_span_1 > (beam_span_2/ 500):
-                st.write(f":red[NOT OK: Deflection exceeds limit of SPAN / 500.]")
-            else:
-                st.write(f":green[OK: Deflections are below acceptable limits.]")
-        if cant_span_R != 0:
-            if defl_max_cant > (cant_span_R / 300):
-                st.write(f":red[NOT OK: Deflection exceeds limit of SPAN / 300.]")
+    st.write("Deflections are the maximum absolute SLS deflections in each segment from any hoist position.")
+    for segment in mba_mod.design_segments(inputs):
+        name = segment["Name"]
+        defl_lim = segment["Deflection Limit"]
+        defl_ratio = 300 if segment["Cantilever"] else 500
+        defl_max_seg = mba_mod.envelope_peak(env_results['SLS'], 'D', segment["Start"], segment["End"]) * 1000
+
+        col_3_13, col_3_14, col_3_15 = st.columns([3,1,3])
+        with col_3_13:
+            st.write(f"Maximum Deflection in {name} =")
+            st.write(f"{name} Deflection Limit, d.lim =")
+        with col_3_14:
+            st.write(f"{utils.round_up(defl_max_seg, 2)} mm")
+            st.write(f"{defl_lim} mm")
+        with col_3_15:
+            st.write(".")
+            if defl_max_seg > defl_lim:
+                st.write(f":red[NOT OK: Deflection exceeds limit of SPAN / {defl_ratio}.]")
             else:
                 st.write(f":green[OK: Deflections are below acceptable limits.]")
+    st.markdown("""<hr style="height:10px;border:none;color:#333;background-color:#333;" /> """, unsafe_allow_html=True)
+
+    tab3_expander_1 = st.expander(label="# Utilisation Diagram", expanded=False)
+    with tab3_expander_1:
+        fig_util = go.Figure()
+        for check, values in utilisation_results["Utilisation"].items():
+            fig_util.add_trace(go.Scatter(x=utilisation_results["x_dist"], y=values, name=check))
+        fig_util.layout.width = 650
+        fig_util.layout.height = 400
+        fig_util.layout.title.text = "Utilisation Diagram"
+        fig_util.layout.xaxis.title = "Distance, x (m)"
+        fig_util.layout.yaxis.title = "Utilisation"
+        fig_util
+
+    st.markdown("#### Section Optimisation")
+    st.write("Searches every section size and steel grade for the lightest section that passes the global " +
+             "bending, shear, local flange/web thickness and deflection checks using the analysed design actions.")
+    if st.button("Find Lightest Section"):
+        lightest = mba_mod.lightest_section(inputs, cf_bf=cf_bf, K_L=utils.str_to_float(K_L))
+        if lightest is None:
+            st.write(f":red[No section size and steel grade passes all of the checks.]")
+        else:
+            st.write(f"Lightest Section: {lightest['Section Size']} (Grade {lightest['Steel Grade']}), {lightest['Mass']} kg/m")
+            for check, ratio in lightest["Utilisation"].items():
+                st.write(f"{check} Utilisation = {utils.round_up(ratio, 2)}")
 
 # Checks for input and structured_data dictionaries
 # st.write(inputs)
@@ -1,8 +1,19 @@
+import numpy as np
 import pandas as pd
 import math
+import sys
+from dataclasses import fields
+from functools import lru_cache
 from pathlib import Path
 from handcalcs.decorator import handcalc
-from monorail_beam import beam_design, monorail_design, sections_db, beam_analysis
+from monorail_beam import beam_design, monorail_design, sections_db, beam_solver, disk_cache, pipeline, tracing
+from monorail_beam import influence_lines, material_prop, utils
+from monorail_beam.utils import code_sha256
+
+
+# The modules holding the design rules and analysis the checks depend on (see
+# 'check_rules_sha256')
+DESIGN_RULE_MODULES = (beam_design, beam_solver, influence_lines, material_prop, monorail_design, sections_db, utils)
 
 
 def section_list(beam_type: str):
@@ -10,10 +21,7 @@ def section_list(beam_type: str):
     Create a dynamic drop-down list for available section sizes based
     on the user selection for the residual stress category.
     """
-    df_sections = sections_db.import_sections_db()
-    # mask = df_sections['Designation'] == beam_type
-    filt_df = sections_db.sections_filter(df_sections, operator='ge', Designation=beam_type)
-    section_list = list(filt_df['Designation'])
+    section_list = sections_db.sections_catalog().section_list(beam_type)
     return section_list
 
 
@@ -35,17 +43,16 @@ def calc_min_element_thickness(
     T_W = monorail_design.min_web_thickness(N_W, f_y, D, C_F, B_F)
     return T_F, T_W
 
-def monorail_design_loads(
-        input_loads: dict,
+def monorail_load_combos(
         hoist_drive_class: str, 
         hoisting_class: str, 
         max_steady_hoist_speed: float,
         steady_hoist_creep_speed: float
 ) -> dict:
     """
-    Returns a dictionary containing the factored monorail dead and live
-    load, keyed with the load cases 'SLS' (Serviceability Limit State),
-    'DLS' (Dynamic Limit State), and 'ULS' (Ultimate Limit State).
+    Returns a dictionary containing the monorail dead and live load factors,
+    keyed with the load cases 'SLS' (Serviceability Limit State), 'DLS'
+    (Dynamic Limit State), and 'ULS' (Ultimate Limit State).
     """
     phi_2 = monorail_design.hoisted_load_dyn_factor(
         HC_class=hoisting_class,
@@ -53,8 +60,29 @@ def monorail_design_loads(
         v_hmax=max_steady_hoist_speed, 
         v_hcs=steady_hoist_creep_speed
     )
-    print(f"phi_2 = {phi_2}")
+    tracing.record("phi_2", phi_2)
     load_combos = monorail_design.load_combos(phi_1=1.1, phi_2=phi_2)
+    return load_combos
+
+
+def monorail_design_loads(
+        input_loads: dict,
+        hoist_drive_class: str, 
+        hoisting_class: str, 
+        max_steady_hoist_speed: float,
+        steady_hoist_creep_speed: float
+) -> dict:
+    """
+    Returns a dictionary containing the factored monorail dead and live
+    load, keyed with the load cases 'SLS' (Serviceability Limit State),
+    'DLS' (Dynamic Limit State), and 'ULS' (Ultimate Limit State).
+    """
+    load_combos = monorail_load_combos(
+        hoist_drive_class,
+        hoisting_class,
+        max_steady_hoist_speed,
+        steady_hoist_creep_speed
+    )
     design_loads = monorail_design.factored_load(input_loads, load_combos)
     return design_loads
 
@@ -62,7 +90,8 @@ def monorail_design_loads(
 def run_analysis(app_inputs: dict) -> dict:
     """
     Returns two separate dictionaries containing beam analysis results
-    from PyCBA based on user provided inputs from the monorail_beam_app.
+    from the closed-form beam solver based on user provided inputs from the
+    monorail_beam_app.
 
     The static_results dictionary is keyed in the following format:
         {
@@ -92,123 +121,235 @@ def run_analysis(app_inputs: dict) -> dict:
             "Critical Values": 
         }
     """
-    # Creates SteelBeam dataclass from user selected beam size, steel grade
-    df_sections = sections_db.import_sections_db()
+    # Each stage is memoized on only the inputs it depends on, so moving the
+    # hoist only re-runs the static analysis and changing the steel grade
+    # reuses the analyses (the beam mass and I_x do not change). The cached
+    # results are shared and must not be modified.
     section_size = app_inputs['Steel Data']['Section Size']
     steel_grade = app_inputs['Steel Data']['Steel Grade']
-    beam_name = app_inputs['Project Details']['Beam Name']
-    section_series = sections_db.sections_filter(df_sections, operator='ge', Designation=section_size).squeeze()
-    sb_data = beam_design.create_steelbeam(section_series, steel_grade, beam_name)
-     
+    with tracing.stage("section build"):
+        sb_data = _section_stage(section_size, steel_grade)
+
     # Extracts the load data and creates a dictionary of factored monorail loads
-    input_loads = app_inputs['Loads']
-    hoist_drive_class = app_inputs['Hoist Data']['HD_Class']
-    hoisting_class = app_inputs['Hoist Data']['HC_Class']
-    max_steady_hoist_speed = app_inputs['Hoist Data']['Max Steady Hoist Speed']
-    steady_hoist_creep_speed = app_inputs['Hoist Data']['Steady Hoist Creep Speed']
     Q_load_pos = app_inputs['Load Position'] * 1e-3
+    load_combos, monorail_loads = _design_loads(app_inputs)
+    tracing.record("monorail_loads", monorail_loads)
+
+    # Creates structured data to be used in PyCBA
+    str_beam_data = create_PyCBA_data(sb_data, app_inputs, load_combos)
+
+    # Solves the unfactored self-weight and a unit hoist load once, and
+    # combines them for each of the load cases. The critical values are exact,
+    # so the sampled results are only used for the diagrams and the sampling
+    # per span is reduced for long runways.
+    with tracing.stage("analysis"):
+        env_results = _envelope_stage(*_analysis_keys(str_beam_data, load_combos, monorail_loads))
+        static_results = _static_stage(*_analysis_keys(str_beam_data, load_combos, monorail_loads), Q_load_pos)
+    return static_results, env_results, sb_data
+
+
+def analysis_cache_info() -> dict:
+    """
+    Returns a dict of the cache statistics (hits, misses, maxsize and
+    currsize) of each of the memoized stages of 'run_analysis', keyed with
+    'section build', 'load factoring', 'envelope' and 'static'.
+    """
+    return {stage_name: stage.cache_info() for stage_name, stage in _ANALYSIS_STAGES.items()}
+
+
+def clear_analysis_cache() -> None:
+    """
+    Clears the memoized stages of 'run_analysis'.
+    """
+    for stage in _ANALYSIS_STAGES.values():
+        stage.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def check_rules_sha256() -> str:
+    """
+    Returns the SHA-256 hash of the code of the DESIGN_RULE_MODULES and of
+    the whole of this module, used to detect results calculated with
+    different design rules. Any change to the code of this module changes the
+    hash, even where it does not affect the checks. Changes to comments and
+    docstrings do not change the hash (see 'utils.code_sha256').
+    """
+    return code_sha256(*DESIGN_RULE_MODULES, sys.modules[__name__])
+
+
+def _analysis_keys(str_beam_data: dict, load_combos: dict, monorail_loads: dict) -> tuple:
+    """
+    Returns the hashable (beam_key, load_cases_key, n_points) arguments of
+    the envelope and static stages.
+    """
+    beam_key = (
+        tuple(str_beam_data['L']),
+        str_beam_data['EI'],
+        tuple(str_beam_data['R']),
+        tuple(tuple(load) for load in str_beam_data['SW_load'])
+    )
+    load_cases_key = tuple(
+        (lc_name, lc_factors["G"], monorail_loads[lc_name]) for lc_name, lc_factors in load_combos.items()
+    )
+    return beam_key, load_cases_key, analysis_points(str_beam_data['L'])
+
+
+def analysis_points(L: list) -> int:
+    """
+    Returns the number of stations per span of every analysis of the beam with
+    the spans 'L', so the results of the analyses share their stations. The
+    sampling per span is reduced for long runways.
+    """
+    return max(50, 600 // len(L))
+
+
+@lru_cache(maxsize=64)
+def _section_stage(section_size: str, steel_grade: str) -> beam_design.SteelBeam:
+    """
+    Returns the SteelBeam of the section 'section_size' in 'steel_grade'. The
+    beam is tagged with the section designation rather than the beam name, so
+    renaming the beam does not re-run the stages that depend on the section.
+    """
+    section_series = sections_db.sections_catalog().section(section_size)
+    return beam_design.create_steelbeam(section_series, steel_grade, section_size)
+
 
-    monorail_loads = monorail_design_loads(
-        input_loads,
+def _design_loads(app_inputs: dict) -> tuple[dict, dict]:
+    """
+    Returns the load combinations and the factored monorail loads of the loads
+    and hoist data of 'app_inputs' from the memoized '_load_stage'. The
+    results are shared and must not be modified.
+    """
+    hoist_data = app_inputs['Hoist Data']
+    return _load_stage(
+        tuple(sorted(app_inputs['Loads'].items())),
+        hoist_data['HD_Class'],
+        hoist_data['HC_Class'],
+        hoist_data['Max Steady Hoist Speed'],
+        hoist_data['Steady Hoist Creep Speed']
+    )
+
+
+@lru_cache(maxsize=32)
+def _load_stage(
+        input_loads: tuple,
+        hoist_drive_class: str,
+        hoisting_class: str,
+        max_steady_hoist_speed: float,
+        steady_hoist_creep_speed: float
+) -> tuple[dict, dict]:
+    """
+    Returns the load combinations and the factored monorail loads for the
+    (name, value) pairs of the input loads 'input_loads'.
+    """
+    load_combos = monorail_load_combos(
         hoist_drive_class,
         hoisting_class,
         max_steady_hoist_speed,
         steady_hoist_creep_speed
     )
-    print(f"Factored Monorail Loads {monorail_loads}")
+    monorail_loads = monorail_design.factored_load(dict(input_loads), load_combos)
+    return load_combos, monorail_loads
 
-    sb_data.Q_load_sls = monorail_loads['SLS']
-    sb_data.Q_load_dls = monorail_loads['DLS']
-    sb_data.Q_load_uls = monorail_loads['ULS']
-    sb_data.size = section_size
 
-    # Creates structured data to be used in PyCBA
-    str_beam_data = create_PyCBA_data(sb_data, app_inputs, monorail_loads)
-
-    # Creates a static load matrix for the hoist in a specified location
-    static_results = {}
-    for lc_name, Q_load in monorail_loads.items():
-        G_load = str_beam_data['G_load'][lc_name]
-        static_acc = beam_analysis.static_beam_model(str_beam_data, G_load, Q_load, Q_load_pos)
-        static_results.update({lc_name: static_acc})
-
-    # Creates the enveloped load matrixes
-    env_results = {}
-    for lc_name, Q_load in monorail_loads.items():
-        G_load = str_beam_data['G_load'][lc_name]
-        env_acc = beam_analysis.env_beam_model(str_beam_data, G_load, Q_load)
-        env_results.update({lc_name: env_acc})
-    return static_results, env_results, sb_data
+@lru_cache(maxsize=16)
+def _envelope_stage(beam_key: tuple, load_cases_key: tuple, n_points: int) -> dict:
+    """
+    Returns the enveloped results of every load case of 'load_cases_key' for
+    the beam 'beam_key' of (L, EI, R, SW_load).
+    """
+    beam_model_data, sw_load, load_cases = _stage_model(beam_key, load_cases_key)
+    _, env_results = beam_solver.combo_beam_models(
+        beam_model_data, sw_load, load_cases, None, n_points=n_points, exact=True
+    )
+    return env_results
+
+
+@lru_cache(maxsize=64)
+def _static_stage(beam_key: tuple, load_cases_key: tuple, n_points: int, Q_load_pos: float) -> dict:
+    """
+    Returns the static results of every load case of 'load_cases_key' with
+    the hoist at 'Q_load_pos' (m) for the beam 'beam_key' of (L, EI, R,
+    SW_load).
+    """
+    beam_model_data, sw_load, load_cases = _stage_model(beam_key, load_cases_key)
+    static_results, _ = beam_solver.combo_beam_models(
+        beam_model_data, sw_load, load_cases, Q_load_pos, n_points=n_points, exact=True, envelopes=False
+    )
+    return static_results
 
 
-def create_PyCBA_data(sb_data: beam_design.SteelBeam, app_inputs: dict, monorail_loads: dict) -> dict:
+def _stage_model(beam_key: tuple, load_cases_key: tuple) -> tuple:
     """
-    Returns a dictionary for an input list of beam data.
+    Returns the beam model data, self-weight load matrix and load cases of the
+    hashable stage keys.
+    """
+    L, EI, R, sw_load = beam_key
+    beam_model_data = {'L': list(L), 'EI': EI, 'R': list(R)}
+    load_cases = {lc_name: {"G": G, "Q": Q} for lc_name, G, Q in load_cases_key}
+    return beam_model_data, [list(load) for load in sw_load], load_cases
+
+
+_ANALYSIS_STAGES = {
+    "section build": _section_stage,
+    "load factoring": _load_stage,
+    "envelope": _envelope_stage,
+    "static": _static_stage,
+}
+
+
+def create_PyCBA_data(sb_data: beam_design.SteelBeam, app_inputs: dict, load_combos: dict) -> dict:
+    """
+    Returns a dictionary for an input list of beam data. The self-weight of
+    each load case in 'G_load' is factored by the dead load factor 'G' of
+    that load case in 'load_combos' (see 'monorail_load_combos').
     """
-    beam_name = sb_data.beam_tag
     beam_mass = sb_data.mass * 9.81e-3
     EI = sb_data.I_x * sb_data.E * 1e-9
 
+    # Segments are ordered from left to right. The first segment is a
+    # cantilever if 'Left Cantilever' is set and the last segment is a
+    # cantilever if 'Cantilever' is set. Segments of zero length are ignored.
+    segments = [segment['Span'] for segment in app_inputs["Geometry"].values()]
+    cant_left = app_inputs.get("Left Cantilever", False) and len(segments) > 1 and segments[0] != 0
+    cant_right = app_inputs["Cantilever"] and len(segments) > 1 and segments[-1] != 0
+
     spans = []
-    for idx, segment in enumerate(app_inputs["Geometry"].items()):
-        if segment[1]['Span'] == 0:
+    support_cond = []
+    for idx, length in enumerate(segments):
+        if length == 0:
             continue
+        spans.append(length / 1000)
+        # Sets restraints to node on LHS of the segment
+        if idx == 0 and cant_left:
+            support_cond.extend([0, 0])
         else:
-            spans.append(segment[1]['Span'] / 1000)
-    print(f"Spans: {spans}")
+            support_cond.extend([-1, 0])
+    # Sets restraints to node on RHS of the beam
+    if cant_right:
+        support_cond.extend([0, 0])
+    else:
+        support_cond.extend([-1, 0])
+    tracing.record("spans", spans)
     if len(spans) == 0:
         raise ValueError(f"No beam spans have been entered!")
 
-    G_load_data = {}
-    for lc_name in monorail_loads.keys():
-        if lc_name == 'SLS':
-            fact = 1.0
-        elif lc_name == 'DLS':
-            fact = 1.1
-        elif lc_name == 'ULS':
-            fact = 1.1 * 1.22
-        loads = []
-        count = 0
-        acc = []
-        for segment in app_inputs["Geometry"].items():
-            if segment[1]['Span'] == 0:
-                continue
-            else:
-                acc.append(1)
-            loads.append([len(acc), 1, fact * beam_mass, 0, 0])
-        G_load_data.update({lc_name: loads})
+    sw_loads = []
+    for idx in range(len(spans)):
+        sw_loads.append([idx + 1, 1, beam_mass, 0, 0])
 
-    support_cond = []
-    for span in spans:
-        # Sets restraints to node on LHS of beam
-        if span != 0:
-            support_cond.append(-1)
-            support_cond.append(0)
-        else:
-            continue
-
-    if len(spans) == 1:
-        support_cond.append(-1)
-        support_cond.append(0)
-    elif len(spans) == 2:
-        if app_inputs["Cantilever"] == True:
-            support_cond.append(0)
-            support_cond.append(0)
-        else:
-            support_cond.append(-1)
-            support_cond.append(0)
-    elif len(spans) == 3:
-            support_cond.append(0)
-            support_cond.append(0)
+    G_load_data = {}
+    for lc_name, lc_factors in load_combos.items():
+        G_load_data.update({lc_name: [[idx + 1, 1, lc_factors["G"] * beam_mass, 0, 0] for idx in range(len(spans))]})
 
-    print(f"Support Cond {support_cond}")
+    tracing.record("support_cond", support_cond)
 
     structured_beam_data = {}
-    structured_beam_data.update({'Name': beam_name})
     structured_beam_data.update({'L': spans})
     structured_beam_data.update({'EI': EI})
     structured_beam_data.update({'R': support_cond})
     structured_beam_data.update({'G_load':G_load_data})
+    structured_beam_data.update({'SW_load': sw_loads})
 
     return structured_beam_data
 
@@ -216,21 +357,42 @@ def create_PyCBA_data(sb_data: beam_design.SteelBeam, app_inputs: dict, monorail
 def beam_capacity(app_inputs: dict, sb: sections_db.SteelBeam) -> dict:
     """
     Returns a dict with the results of the primary beam capacity checks
-    undertaken in accordance with AS 4100:2020(+A1).
+    undertaken in accordance with AS 4100:2020(+A1): the section moment
+    capacity 'M_sx' (Nmm) and the effective length 'l_e' (mm) of each beam
+    segment, keyed by segment name. The member moment capacities depend on
+    the moment modification factor of each hoist position, so are found by
+    'bending_checks'.
     """
-    capacity_results = sb.A
+    # The results are shared through the on-disk cache, if it is enabled, and
+    # are keyed on the section properties rather than the beam name
+    section_key = [getattr(sb, fld.name) for fld in fields(sb) if fld.compare and fld.name != 'beam_tag']
+    code = disk_cache.code_version(beam_design, material_prop, _beam_capacity)
+    with tracing.stage("capacity checks"):
+        capacity_results = disk_cache.cached(
+            "beam_capacity",
+            (section_key, app_inputs["Geometry"], code),
+            lambda: _beam_capacity(app_inputs["Geometry"], sb)
+        )
+        tracing.record("M_sx", capacity_results["M_sx"])
+    return capacity_results
 
-    sect_moment_cap = sb.section_moment_capacity_x()
-    unfact_sect_moment_cap = sect_moment_cap / 0.9
-    print(sect_moment_cap)
 
+def _beam_capacity(geometry: dict, sb: sections_db.SteelBeam) -> dict:
+    """
+    Returns the results of 'beam_capacity' for the beam segments 'geometry'.
+    """
     capacity_results = {}
-    capacity_results.update({"M_sx": sect_moment_cap})
+    capacity_results.update({"M_sx": sb.section_moment_capacity_x()})
 
-    for span, values in app_inputs["Geometry"].items():
-        length = app_inputs['Geometry'][span]['Span']
-        restraint = app_inputs['Geometry'][span]['Restraint']
-        if length != 0:
+    # Runways often repeat the same span and restraint arrangement, so each
+    # arrangement is only checked once
+    span_checks = {}
+    for span, values in geometry.items():
+        length = values['Span']
+        restraint = values['Restraint']
+        if (length, restraint) in span_checks:
+            capacity_results.update({span: dict(span_checks[(length, restraint)])})
+        elif length != 0:
             l_e = beam_design.bending_eff_length(
                 l_seg=length,
                 d_1=sb.d - 2 * sb.t_f,
@@ -242,20 +404,714 @@ def beam_capacity(app_inputs: dict, sb: sections_db.SteelBeam) -> dict:
                 pos_of_load=True,
                 lat_rot_restraint="None"
             )
-            alpha_m = 1.0
-            memb_moment_cap = beam_design.member_moment_cap(
-                M_sx=unfact_sect_moment_cap, 
-                l_e=l_e, 
-                I_y=sb.I_y, 
-                I_w=sb.I_w, 
-                J=sb.J, 
-                E=sb.E, 
-                G=sb.G, 
-                alpha_m=alpha_m,
-                phi=0.9
+            span_checks.update({(length, restraint): {"l_e": l_e}})
+            capacity_results.update({span: dict(span_checks[(length, restraint)])})
+    return capacity_results
+
+
+def lightest_section(
+        app_inputs: dict,
+        beam_types: tuple=("UB", "UC", "WB", "WC"),
+        steel_grades: tuple=("250", "300", "350", "400"),
+        cf_bf: float=0.9,
+        K_L: float=1.3
+) -> dict:
+    """
+    Returns a dict describing the lightest section (by 'Mass') and steel grade
+    that passes the global bending, local flange/web thickness and deflection
+    checks for the hoist inputs and geometry in 'app_inputs'. The 'Steel Data'
+    in 'app_inputs' is not used. None is returned if no section passes.
+
+    Every section and steel grade is first screened with the design action
+    envelopes of a single analysis of the beam with a unit flexural rigidity,
+    scaled by the section mass and I_x. The flange, web and deflection checks
+    of the screening are those of the full analysis and the bending check is
+    made against the section moment capacity. Only the candidates that pass
+    the screening are analysed in full, lightest first.
+
+    The returned dict is keyed in the following format:
+        {
+            "Section Size": ,
+            "Steel Grade": ,
+            "Mass": ,
+            "Utilisation": {"Bending": , "Shear": , "Deflection": , "Flange": , "Web": },
+            "Evaluations": {"candidates": , "screened": , "analysed": }
+        }
+    """
+    E = 200000
+    beam_name = app_inputs['Project Details']['Beam Name']
+    hoist_data = app_inputs['Hoist Data']
+    load_combos, monorail_loads = _design_loads(app_inputs)
+    segments = design_segments(app_inputs)
+
+    with tracing.stage("screening"):
+        catalog = sections_db.sections_catalog()
+        designations = [name for beam_type in beam_types for name in catalog.section_list(beam_type)]
+        sections_df = catalog.df.iloc[[catalog.index[name] for name in designations]]
+        table = beam_design.catalog_capacities(sections_df, steel_grades)
+        table = table.merge(sections_df[['Designation', 'd', 'bf', 'tf', 'tw', 'Ix', 'Zx']], on='Designation', how='left')
+
+        # The moments of the beam do not depend on its flexural rigidity and the
+        # deflections are inversely proportional to it, so the hoist and unit
+        # self-weight effects of every section are scaled from a single beam
+        produced = table.loc[table['M_sx'].notna()]
+        if produced.empty:
+            return None
+        unit_row = produced.iloc[0]
+        sb_data = sections_db.create_steelbeam(
+            catalog.section(unit_row['Designation']), unit_row['Steel Grade'], beam_name
+        )
+        unit_beam_data = create_PyCBA_data(sb_data, app_inputs, load_combos)
+        unit_beam_data['EI'] = 1.0
+        n_points = analysis_points(unit_beam_data['L'])
+        sw_unit = [[span_idx, 1, 1.0, 0, 0] for span_idx in range(1, len(unit_beam_data['L']) + 1)]
+        hoist_env = beam_solver.env_beam_model(unit_beam_data, [], 1.0, n_points, exact=True)['Matrixes']
+        sw_static = beam_solver.static_beam_model(unit_beam_data, sw_unit, 0.0, 0.0, n_points, exact=True)['Matrixes']
+        sw_load = table['Mass'].to_numpy()[:, None] * 9.81e-3
+
+        # The self-weight does not move, so the envelope of each section at the
+        # stations of the full analysis is the factored self-weight effect plus
+        # the factored hoist envelope. The flange, web and deflection checks of
+        # the envelopes are therefore those of the full analysis, and the
+        # bending check is bounded by the section capacity (M_bx <= M_sx).
+        def peak_effect(lc_name: str, effect: str, sw_effect: str) -> np.ndarray:
+            sw_effects = load_combos[lc_name]['G'] * sw_load * sw_static[sw_effect]
+            return np.maximum.reduce([
+                sw_effects + monorail_loads[lc_name] * hoist_env[effect + 'max'],
+                -(sw_effects + monorail_loads[lc_name] * hoist_env[effect + 'min']),
+                np.zeros_like(sw_effects)
+            ])
+
+        x = hoist_env['x_dist']
+        defl_limit = np.full(len(x), np.inf)
+        for segment in segments:
+            in_range = (x >= segment['Start'] - 1e-9) & (x <= segment['End'] + 1e-9)
+            defl_limit[in_range] = np.minimum(defl_limit[in_range], segment['Deflection Limit'])
+        EI = E * table['Ix'].to_numpy()[:, None] * 1e-9
+        M_uls = peak_effect('ULS', 'M', 'Moment').max(axis=1)
+        M_dls = peak_effect('DLS', 'M', 'Moment').max(axis=1)
+        defl_util = (peak_effect('SLS', 'D', 'Deflections') * 1000 / EI / defl_limit).max(axis=1)
+        b_f = table['bf'].to_numpy()
+        with np.errstate(invalid='ignore'):
+            min_flg_thk, min_web_thk = calc_min_element_thickness(
+                N_W=hoist_data['Wheel Load Dist'] * monorail_loads['DLS'] * 1e-2,
+                f_y=table['f_y'].to_numpy(),
+                C_F=cf_bf * b_f * 0.5,
+                B_F=b_f * 0.5,
+                D=table['d'].to_numpy(),
+                f_b=M_dls * 1e6 / table['Zx'].to_numpy(),
+                K_L=K_L,
+                n_cycles=hoist_data['Peak Loading Cycles']
             )
-            capacity_results.update({span: {"l_e": l_e, "alpha_m": alpha_m, "M_bx": memb_moment_cap}})
-        else:
+        # Allows for the rounding of the full analysis
+        tol = 1 + 1e-9
+        screened = (
+            (M_uls <= table['M_sx'].to_numpy() * 1e-6 * tol)
+            & (defl_util <= tol)
+            & (min_flg_thk <= table['tf'].to_numpy() * tol)
+            & (min_web_thk <= table['tw'].to_numpy() * tol)
+        )
+
+    candidates = table.loc[screened].sort_values('Mass', kind='stable')
+    for analysed, (_, row) in enumerate(candidates.iterrows(), start=1):
+        steel_data = {"Steel Grade": row['Steel Grade'], "Section Size": row['Designation']}
+        utilisation = section_utilisation(dict(app_inputs, **{"Steel Data": steel_data}), cf_bf, K_L)
+        if all(val <= 1.0 for val in utilisation.values()):
+            return {
+                "Section Size": row['Designation'],
+                "Steel Grade": row['Steel Grade'],
+                "Mass": row['Mass'],
+                "Utilisation": utilisation,
+                "Evaluations": {"candidates": len(table), "screened": len(candidates), "analysed": analysed}
+            }
+    return None
+
+
+def section_utilisation(app_inputs: dict, cf_bf: float=0.9, K_L: float=1.3) -> dict:
+    """
+    Returns a dict of the maximum utilisation ratios of the section selected in
+    'app_inputs' for the global bending, shear, local flange/web thickness and
+    deflection checks along the beam (see 'utilisation_envelope'). A ratio
+    greater than 1.0 fails the check.
+
+    The dict is keyed in the following format:
+        {"Bending": , "Shear": , "Deflection": , "Flange": , "Web": }
+    """
+    static_results, env_results, sb_data = run_analysis(app_inputs)
+    envelope = utilisation_envelope(app_inputs, sb_data, env_results, cf_bf, K_L)
+    utilisation = {check: governing['val'] for check, governing in envelope['Governing'].items()}
+    return utilisation
+
+
+def design_segments(app_inputs: dict) -> list[dict]:
+    """
+    Returns a list of the non-zero length beam segments in 'app_inputs',
+    ordered from left to right. Each segment is a dict keyed with 'Name',
+    'Span' (mm), 'Restraint', 'Cantilever', 'Start' and 'End' (m) and
+    'Deflection Limit' (mm) of SPAN / 300 for cantilevers and SPAN / 500
+    otherwise.
+    """
+    geometry = app_inputs["Geometry"]
+    names = list(geometry)
+    cant_names = []
+    if len(names) > 1 and app_inputs.get("Left Cantilever", False):
+        cant_names.append(names[0])
+    if len(names) > 1 and app_inputs["Cantilever"]:
+        cant_names.append(names[-1])
+
+    segments = []
+    start = 0.0
+    for name, segment in geometry.items():
+        if segment['Span'] == 0:
             continue
+        end = start + segment['Span'] / 1000
+        defl_ratio = 300 if name in cant_names else 500
+        segments.append({
+            "Name": name,
+            "Span": segment['Span'],
+            "Restraint": segment['Restraint'],
+            "Cantilever": name in cant_names,
+            "Start": start,
+            "End": end,
+            "Deflection Limit": segment['Span'] / defl_ratio
+        })
+        start = end
+    return segments
+
+
+def envelope_peak(env_results: dict, effect: str, start: float, end: float) -> float:
+    """
+    Returns the maximum absolute value of the enveloped 'effect' ('M', 'V' or
+    'D') between 'start' and 'end' (m), including the exact critical values
+    that fall within that range.
+    """
+    matrixes = env_results['Matrixes']
+    crit_values = env_results['Critical Values']
+    x = matrixes['x_dist']
+    in_range = (x >= start - 1e-9) & (x <= end + 1e-9)
+    peak = max(matrixes[effect + 'max'][in_range].max(), -matrixes[effect + 'min'][in_range].min())
+    for crit_name in (effect + 'max', effect + 'min'):
+        if start - 1e-9 <= crit_values[crit_name]['at'] <= end + 1e-9:
+            peak = max(peak, abs(crit_values[crit_name]['val']))
+    return peak
+
+
+def bending_checks(app_inputs: dict, sb_data: beam_design.SteelBeam) -> dict:
+    """
+    Returns a dict of the global bending checks of each beam segment, with the
+    ULS moments taken from the analysis with the hoist at every position along
+    the beam. The moment modification factor 'alpha_m' is calculated from the
+    moments of each hoist position in accordance with AS 4100:2020(+A1)
+    Clause 5.6.1.1(iii), apart from segments unrestrained at one end (e.g.
+    cantilevers) which conservatively adopt 1.0. The results are reported for
+    the governing hoist position of each segment.
+
+    The dict is keyed by segment name in the following format:
+        {
+            "Span 1": {
+                "l_e": ,
+                "alpha_m": ,
+                "M_bx": ,
+                "M*": ,
+                "Utilisation": ,
+                "Hoist Position": 
+            }
+        }
+    Moments are in kNm, 'l_e' is in mm and the hoist position is in m.
+    """
+    batch, segment_results = bending_per_position(app_inputs, sb_data)
+    return bending_summary(batch, segment_results)
+
+
+def bending_summary(batch: dict, segment_results: list) -> dict:
+    """
+    Returns the dict of 'bending_checks' for the governing hoist position of
+    each segment in 'segment_results' (see 'segment_bending').
+    """
+    load_pos = batch['Matrixes']['Load Position']
+    bending_results = {}
+    for result in segment_results:
+        utilisation = result['M*'] / result['M_bx']
+        pos_idx = int(np.argmax(utilisation))
+        bending_results.update({
+            result['Name']: {
+                "l_e": result['l_e'],
+                "alpha_m": float(result['alpha_m'][pos_idx]),
+                "M_bx": float(result['M_bx'][pos_idx]),
+                "M*": float(result['M*'][pos_idx]),
+                "Utilisation": float(utilisation[pos_idx]),
+                "Hoist Position": float(load_pos[pos_idx])
+            }
+        })
+    return bending_results
+
+
+def bending_per_position(app_inputs: dict, sb_data: beam_design.SteelBeam) -> tuple[dict, list]:
+    """
+    Returns the batched ULS analysis results with the hoist at every position
+    along the beam (see 'beam_solver.batch_static_beam_model') and a list with
+    a dict for each beam segment, keyed with 'Name', 'Start', 'End', 'l_e' and
+    the arrays 'M*', 'alpha_m' and 'M_bx' (kNm) with one value per hoist
+    position. See 'bending_checks'.
+    """
+    load_combos, monorail_loads = _design_loads(app_inputs)
+    str_beam_data = create_PyCBA_data(sb_data, app_inputs, load_combos)
+    batch = uls_batch_analysis(str_beam_data, monorail_loads)
+    capacity_results = beam_capacity(app_inputs, sb_data)
+    segment_results = segment_bending(batch, design_segments(app_inputs), capacity_results, sb_data)
+    return batch, segment_results
+
+
+def uls_batch_analysis(str_beam_data: dict, monorail_loads: dict) -> dict:
+    """
+    Returns the batched ULS analysis results of the beam 'str_beam_data' (see
+    'create_PyCBA_data') with the hoist at every position along the beam.
+    """
+    with tracing.stage("analysis"):
+        batch = beam_solver.batch_static_beam_model(
+            str_beam_data,
+            str_beam_data['G_load']['ULS'],
+            monorail_loads['ULS'],
+            n_points=analysis_points(str_beam_data['L'])
+        )
+    return batch
 
-    return capacity_results
\ No newline at end of file
+
+def segment_bending(
+        batch: dict,
+        segments: list,
+        capacity_results: dict,
+        sb_data: beam_design.SteelBeam
+) -> list[dict]:
+    """
+    Returns the list of the segment dicts of 'bending_per_position' for the
+    batched ULS results 'batch', the 'segments' of 'design_segments' and the
+    effective lengths of 'beam_capacity'.
+    """
+    with tracing.stage("bending checks"):
+        M = batch['Matrixes']['Moment']
+        x = batch['Matrixes']['x_dist']
+        segment_results = []
+        for segment in segments:
+            M_m, M_2, M_3, M_4 = segment_moments(M, x, segment['Start'], segment['End'])
+            if "U" in segment['Restraint']:
+                alpha_m = np.ones_like(M_m)
+            else:
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    alpha_m = beam_design.moment_mod_factor(M_m, M_2, M_3, M_4)
+                # No moment in the segment for this hoist position
+                alpha_m = np.where(np.isnan(alpha_m), 1.0, alpha_m)
+            l_e = capacity_results[segment['Name']]['l_e']
+            segment_results.append({
+                "Name": segment['Name'],
+                "Start": segment['Start'],
+                "End": segment['End'],
+                "l_e": l_e,
+                "M*": M_m,
+                "alpha_m": alpha_m,
+                "M_bx": sb_data.member_moment_capacity_x(l_e, alpha_m) * 1e-6
+            })
+    return segment_results
+
+
+def local_checks(
+        app_inputs: dict,
+        sb_data: beam_design.SteelBeam,
+        cf_bf: float=0.9,
+        K_L: float=1.3
+) -> dict:
+    """
+    Returns the minimum flange and web thicknesses required for the wheel
+    loads at every hoist position along the beam, with the bending stress
+    taken from the DLS moment directly under the hoist for that position.
+
+    The dict is keyed in the following format:
+        {
+            "Load Position": np.array (n_positions),
+            "f_b": np.array (n_positions),
+            "tf_min": np.array (n_positions),
+            "tw_min": np.array (n_positions),
+            "Governing": {
+                "Flange": {"val": , "at": },
+                "Web": {"val": , "at": }
+            }
+        }
+    Stresses are in MPa, thicknesses in mm and positions in m. The required
+    flange thickness is infinite where the bending stress exceeds the
+    allowable stress of the flange.
+    """
+    hoist_data = app_inputs['Hoist Data']
+    load_combos, monorail_loads = _design_loads(app_inputs)
+    str_beam_data = create_PyCBA_data(sb_data, app_inputs, load_combos)
+    load_pos, M_dls = wheel_moments(str_beam_data, monorail_loads)
+    return wheel_local_checks(load_pos, M_dls, sb_data, monorail_loads, hoist_data, cf_bf, K_L)
+
+
+def wheel_moments(str_beam_data: dict, monorail_loads: dict) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the hoist positions (m) and the DLS moment (kNm) directly under
+    the hoist at each position for the beam 'str_beam_data' (see
+    'create_PyCBA_data').
+    """
+    with tracing.stage("analysis"):
+        load_pos, M_dls = beam_solver.hoist_moments(
+            str_beam_data,
+            str_beam_data['G_load']['DLS'],
+            monorail_loads['DLS'],
+            n_points=analysis_points(str_beam_data['L'])
+        )
+    return load_pos, M_dls
+
+
+def wheel_local_checks(
+        load_pos: np.ndarray,
+        M_dls: np.ndarray,
+        sb_data: beam_design.SteelBeam,
+        monorail_loads: dict,
+        hoist_data: dict,
+        cf_bf: float=0.9,
+        K_L: float=1.3
+) -> dict:
+    """
+    Returns the dict of 'local_checks' for the DLS moments 'M_dls' under the
+    hoist at the positions 'load_pos' (see 'wheel_moments').
+    """
+    with tracing.stage("local checks"):
+        f_b = np.abs(M_dls) * 1e6 / sb_data.Z_x
+        with np.errstate(invalid='ignore'):
+            min_flg_thk, min_web_thk = calc_min_element_thickness(
+                N_W=hoist_data['Wheel Load Dist'] * monorail_loads['DLS'] * 1e-2,
+                f_y=min(sb_data.yield_stress_flg(), sb_data.yield_stress_web()),
+                D=sb_data.d,
+                f_b=f_b,
+                K_L=K_L,
+                C_F=cf_bf * sb_data.b_f * 0.5,
+                B_F=sb_data.b_f * 0.5,
+                n_cycles=hoist_data['Peak Loading Cycles']
+            )
+        min_flg_thk = np.where(np.isnan(min_flg_thk), np.inf, min_flg_thk)
+        min_web_thk = np.full(len(load_pos), min_web_thk)
+        flg_idx = int(np.argmax(min_flg_thk))
+        web_idx = int(np.argmax(min_web_thk))
+    local_results = {
+        "Load Position": load_pos,
+        "f_b": f_b,
+        "tf_min": min_flg_thk,
+        "tw_min": min_web_thk,
+        "Governing": {
+            "Flange": {"val": float(min_flg_thk[flg_idx]), "at": float(load_pos[flg_idx])},
+            "Web": {"val": float(min_web_thk[web_idx]), "at": float(load_pos[web_idx])}
+        }
+    }
+    return local_results
+
+
+def envelope_local_checks(
+        env_results: dict,
+        sb_data: beam_design.SteelBeam,
+        monorail_loads: dict,
+        hoist_data: dict,
+        cf_bf: float=0.9,
+        K_L: float=1.3
+) -> dict:
+    """
+    Returns a dict of the minimum flange and web thicknesses 'tf_min' and
+    'tw_min' (mm) required for the wheel loads at every station along the
+    beam, with the maximum DLS bending stress at each station from any hoist
+    position. The required flange thickness is infinite where the bending
+    stress exceeds the allowable stress of the flange.
+    """
+    dls = env_results['DLS']['Matrixes']
+    f_b = np.maximum(dls['Mmax'], -dls['Mmin']) * 1e6 / sb_data.Z_x
+    with np.errstate(invalid='ignore'):
+        min_flg_thk, min_web_thk = calc_min_element_thickness(
+            N_W=hoist_data['Wheel Load Dist'] * monorail_loads['DLS'] * 1e-2,
+            f_y=min(sb_data.yield_stress_flg(), sb_data.yield_stress_web()),
+            D=sb_data.d,
+            f_b=f_b,
+            K_L=K_L,
+            C_F=cf_bf * sb_data.b_f * 0.5,
+            B_F=sb_data.b_f * 0.5,
+            n_cycles=hoist_data['Peak Loading Cycles']
+        )
+    return {
+        "tf_min": np.where(np.isnan(min_flg_thk), np.inf, min_flg_thk),
+        "tw_min": np.full(len(f_b), min_web_thk)
+    }
+
+
+def utilisation_envelope(
+        app_inputs: dict,
+        sb_data: beam_design.SteelBeam,
+        env_results: dict,
+        cf_bf: float=0.9,
+        K_L: float=1.3,
+        wheel_stress: bool=False
+) -> dict:
+    """
+    Returns the utilisation of the bending, shear, deflection and local
+    flange/web thickness checks at every station along the beam, with the
+    governing value and location of each. A utilisation greater than 1.0 fails
+    the check.
+
+    Args:
+        app_inputs: Dict of the app inputs.
+        sb_data: The SteelBeam being checked.
+        env_results: Enveloped results of each load case for 'sb_data', as
+            returned by 'run_analysis'.
+        cf_bf: Ratio of C_F / B_F of the wheel loading on the flange.
+        K_L: Load position factor.
+        wheel_stress: If True, the local checks adopt the DLS bending stress
+            under the wheels for each hoist position (see 'local_checks').
+
+    Returns:
+        A dict keyed in the following format:
+        {
+            "x_dist": np.array (n_points),
+            "Utilisation": {
+                "Bending": , "Shear": , "Deflection": , "Flange": , "Web": 
+            },
+            "Governing": {
+                "Bending": {"val": , "at": }, ...
+            }
+        }
+
+    Notes:
+      * Bending is the ULS moment with the hoist at every position over the
+        member moment capacity of the segment for that hoist position.
+      * Shear and deflection are the ULS shear and SLS deflection envelopes
+        over the web shear capacity and the deflection limit of the segment.
+      * The local checks adopt the maximum DLS bending stress at each station
+        from any hoist position, unless 'wheel_stress' is True. The governing
+        local checks are then those of the hoist positions and the station
+        values are interpolated between the hoist positions.
+    """
+    batch, segment_results = bending_per_position(app_inputs, sb_data)
+    if wheel_stress:
+        local_results = local_checks(app_inputs, sb_data, cf_bf, K_L)
+    else:
+        _, monorail_loads = _design_loads(app_inputs)
+        local_results = envelope_local_checks(
+            env_results, sb_data, monorail_loads, app_inputs['Hoist Data'], cf_bf, K_L
+        )
+    global_results = global_utilisation(env_results, batch, segment_results, design_segments(app_inputs), sb_data)
+    return combine_utilisation(global_results, local_results, sb_data)
+
+
+def global_utilisation(
+        env_results: dict,
+        batch: dict,
+        segment_results: list,
+        segments: list,
+        sb_data: beam_design.SteelBeam
+) -> dict:
+    """
+    Returns a dict of the stations 'x_dist' (m) along the beam and the
+    'Bending', 'Shear' and 'Deflection' utilisation arrays at each station.
+    See 'utilisation_envelope'.
+    """
+    with tracing.stage("utilisation envelope"):
+        x = env_results['ULS']['Matrixes']['x_dist']
+        x_batch = batch['Matrixes']['x_dist']
+        M = np.abs(batch['Matrixes']['Moment'])
+        bending = np.zeros(len(x_batch))
+        deflection = np.zeros(len(x))
+        D_env = np.maximum(env_results['SLS']['Matrixes']['Dmax'], -env_results['SLS']['Matrixes']['Dmin']) * 1000
+        for segment, result in zip(segments, segment_results):
+            # Stations at a support are shared by the adjacent segments
+            in_batch = np.flatnonzero((x_batch >= segment['Start'] - 1e-9) & (x_batch <= segment['End'] + 1e-9))
+            bending[in_batch] = np.maximum(
+                bending[in_batch], (M[:, in_batch] / result['M_bx'][:, None]).max(axis=0)
+            )
+            in_range = np.flatnonzero((x >= segment['Start'] - 1e-9) & (x <= segment['End'] + 1e-9))
+            deflection[in_range] = np.maximum(
+                deflection[in_range], D_env[in_range] / segment['Deflection Limit']
+            )
+        # The analyses share their stations (see 'analysis_points'), unless the
+        # batched results were sampled separately
+        if not np.array_equal(x_batch, x):
+            bending = np.interp(x, x_batch, bending)
+
+        uls = env_results['ULS']['Matrixes']
+        shear = np.maximum(uls['Vmax'], -uls['Vmin']) / (sb_data.shear_capacity() * 1e-3)
+    return {"x_dist": x, "Bending": bending, "Shear": shear, "Deflection": deflection}
+
+
+def combine_utilisation(global_results: dict, local_results: dict, sb_data: beam_design.SteelBeam) -> dict:
+    """
+    Returns the dict of 'utilisation_envelope' from the results of
+    'global_utilisation' and of either 'envelope_local_checks' or, for the
+    bending stress under the wheels, 'wheel_local_checks'.
+    """
+    x = global_results['x_dist']
+    if "Load Position" in local_results:
+        load_pos = local_results['Load Position']
+        with np.errstate(invalid='ignore'):
+            flange = np.interp(x, load_pos, local_results['tf_min'] / sb_data.t_f)
+        flange = np.where(np.isnan(flange), np.inf, flange)
+        web = np.interp(x, load_pos, local_results['tw_min'] / sb_data.t_w)
+    else:
+        # The flange can not resist the wheel load where the bending stress
+        # exceeds the allowable stress
+        flange = local_results['tf_min'] / sb_data.t_f
+        web = local_results['tw_min'] / sb_data.t_w
+
+    utilisation = {
+        "Bending": global_results['Bending'],
+        "Shear": global_results['Shear'],
+        "Deflection": global_results['Deflection'],
+        "Flange": flange,
+        "Web": web
+    }
+    governing = {}
+    for check, values in utilisation.items():
+        idx = int(np.argmax(values))
+        governing.update({check: {"val": float(values[idx]), "at": float(x[idx])}})
+    if "Load Position" in local_results:
+        for check, thk, min_thk in (("Flange", sb_data.t_f, "tf_min"), ("Web", sb_data.t_w, "tw_min")):
+            idx = int(np.argmax(local_results[min_thk]))
+            governing.update({check: {"val": float(local_results[min_thk][idx] / thk), "at": float(load_pos[idx])}})
+    return {"x_dist": x, "Utilisation": utilisation, "Governing": governing}
+
+
+def segment_moments(M: np.ndarray, x: np.ndarray, start: float, end: float) -> tuple:
+    """
+    Returns the moments (M_m, M_2, M_3, M_4) of the segment between 'start'
+    and 'end' (m) for each row of the moment array 'M' with stations 'x'.
+    M_m is the maximum absolute moment in the segment, M_3 is the moment at
+    the midpoint and M_2 and M_4 are the moments at the quarter points. The
+    quarter point moments are interpolated between the adjacent stations.
+    """
+    in_range = np.flatnonzero((x >= start - 1e-9) & (x <= end + 1e-9))
+    x_seg = x[in_range]
+    M_seg = M[:, in_range]
+    M_m = np.abs(M_seg).max(axis=1)
+
+    x_quarter = start + (end - start) * np.array([0.25, 0.5, 0.75])
+    hi = np.searchsorted(x_seg, x_quarter, side='right')
+    lo = hi - 1
+    weight = (x_quarter - x_seg[lo]) / (x_seg[hi] - x_seg[lo])
+    M_2, M_3, M_4 = (M_seg[:, lo] * (1 - weight) + M_seg[:, hi] * weight).T
+    return M_m, M_2, M_3, M_4
+
+
+def design_pipeline() -> pipeline.Pipeline:
+    """
+    Returns a Pipeline of the design calculations of the app, from the section
+    and loads to the analyses, capacity checks and local checks. Each stage
+    declares the inputs it depends on, so a repeated run only recalculates the
+    stages affected by the inputs that changed. For example, changing 'cf_bf'
+    only re-runs the 'local checks' and 'utilisation' stages, and changing the
+    steel grade re-runs the capacity and local checks but not the analyses,
+    as the beam mass and I_x do not change.
+
+    The pipeline inputs are created from the app inputs by 'pipeline_inputs'.
+    The results of the stages are:
+        'section': the SteelBeam
+        'load combos', 'design loads': see 'monorail_load_combos' and
+            'monorail_design_loads'
+        'segments': see 'design_segments'
+        'beam model': see 'create_PyCBA_data'
+        'envelopes', 'static': the env_results and static_results of
+            'run_analysis'
+        'capacity': see 'beam_capacity'
+        'uls batch', 'segment bending', 'bending checks': see
+            'bending_per_position' and 'bending_checks'
+        'global utilisation', 'wheel moments', 'local checks',
+            'utilisation': see 'utilisation_envelope' and 'local_checks'
+
+    The hits and misses of each stage are returned by 'stage_stats'.
+    """
+    geometry = ("Geometry", "Cantilever", "Left Cantilever")
+    Stage = pipeline.Stage
+    return pipeline.Pipeline([
+        Stage("section", _section_stage, ("Section Size", "Steel Grade")),
+        Stage("load combos", _pipeline_load_combos, ("Hoist Data",)),
+        Stage("design loads", monorail_design.factored_load, ("Loads", "load combos")),
+        Stage("segments", _pipeline_segments, geometry),
+        Stage("beam model", _pipeline_beam_model, ("section", *geometry, "load combos")),
+        Stage("envelopes", _pipeline_envelopes, ("beam model", "load combos", "design loads")),
+        Stage("static", _pipeline_static, ("beam model", "load combos", "design loads", "Load Position")),
+        Stage("capacity", _pipeline_capacity, ("section", "Geometry")),
+        Stage("uls batch", uls_batch_analysis, ("beam model", "design loads")),
+        Stage("segment bending", segment_bending, ("uls batch", "segments", "capacity", "section")),
+        Stage("bending checks", bending_summary, ("uls batch", "segment bending")),
+        Stage("global utilisation", global_utilisation,
+              ("envelopes", "uls batch", "segment bending", "segments", "section")),
+        Stage("wheel moments", wheel_moments, ("beam model", "design loads")),
+        Stage("local checks", _pipeline_local_checks,
+              ("envelopes", "wheel moments", "section", "design loads", "Hoist Data", "cf_bf", "K_L", "wheel_stress")),
+        Stage("utilisation", combine_utilisation, ("global utilisation", "local checks", "section")),
+    ])
+
+
+def pipeline_inputs(app_inputs: dict, cf_bf: float=0.9, K_L: float=1.3, wheel_stress: bool=False) -> dict:
+    """
+    Returns the dict of the inputs of 'design_pipeline' from the app inputs.
+    The 'Load Position' is converted to m. The project details do not affect
+    the design calculations and are not pipeline inputs.
+    """
+    return {
+        "Section Size": app_inputs['Steel Data']['Section Size'],
+        "Steel Grade": app_inputs['Steel Data']['Steel Grade'],
+        "Loads": app_inputs['Loads'],
+        "Hoist Data": app_inputs['Hoist Data'],
+        "Geometry": app_inputs['Geometry'],
+        "Cantilever": app_inputs['Cantilever'],
+        "Left Cantilever": app_inputs.get('Left Cantilever', False),
+        "Load Position": app_inputs['Load Position'] * 1e-3,
+        "cf_bf": cf_bf,
+        "K_L": K_L,
+        "wheel_stress": wheel_stress
+    }
+
+
+def _pipeline_load_combos(hoist_data: dict) -> dict:
+    return monorail_load_combos(
+        hoist_data['HD_Class'],
+        hoist_data['HC_Class'],
+        hoist_data['Max Steady Hoist Speed'],
+        hoist_data['Steady Hoist Creep Speed']
+    )
+
+
+def _pipeline_segments(geometry: dict, cantilever: bool, left_cantilever: bool) -> list[dict]:
+    return design_segments({"Geometry": geometry, "Cantilever": cantilever, "Left Cantilever": left_cantilever})
+
+
+def _pipeline_beam_model(
+        sb_data: beam_design.SteelBeam,
+        geometry: dict,
+        cantilever: bool,
+        left_cantilever: bool,
+        load_combos: dict
+) -> dict:
+    geometry_inputs = {"Geometry": geometry, "Cantilever": cantilever, "Left Cantilever": left_cantilever}
+    return create_PyCBA_data(sb_data, geometry_inputs, load_combos)
+
+
+def _pipeline_envelopes(str_beam_data: dict, load_combos: dict, monorail_loads: dict) -> dict:
+    return _envelope_stage(*_analysis_keys(str_beam_data, load_combos, monorail_loads))
+
+
+def _pipeline_static(str_beam_data: dict, load_combos: dict, monorail_loads: dict, Q_load_pos: float) -> dict:
+    return _static_stage(*_analysis_keys(str_beam_data, load_combos, monorail_loads), Q_load_pos)
+
+
+def _pipeline_capacity(sb_data: beam_design.SteelBeam, geometry: dict) -> dict:
+    return beam_capacity({"Geometry": geometry}, sb_data)
+
+
+def _pipeline_local_checks(
+        env_results: dict,
+        hoist_moments: tuple,
+        sb_data: beam_design.SteelBeam,
+        monorail_loads: dict,
+        hoist_data: dict,
+        cf_bf: float,
+        K_L: float,
+        wheel_stress: bool
+) -> dict:
+    if wheel_stress:
+        return wheel_local_checks(*hoist_moments, sb_data, monorail_loads, hoist_data, cf_bf, K_L)
+    return envelope_local_checks(env_results, sb_data, monorail_loads, hoist_data, cf_bf, K_L)
@@ -0,0 +1,312 @@
+import argparse
+import math
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Iterator
+import pandas as pd
+import monorail_beam_app_module as mba_mod
+from monorail_beam import beam_design, lookup_tables, sections_db
+
+
+# Hoist and project inputs shared by every span table case. The self-weight of
+# the hoist 'G_load' (kN) is taken as 300 kg.
+DEFAULT_INPUTS = {
+    "Project Details": {"Project No": "", "Project Name": "", "Beam Name": "Span Table"},
+    "Loads": {"G_load": 300 * 9.81e-3, "Q_load": 0.0},
+    "Load Position": 0.0,
+    "Hoist Data": {
+        "HD_Class": "HD1",
+        "HC_Class": "HC2",
+        "Max Steady Hoist Speed": 20 / 60,
+        "Steady Hoist Creep Speed": 2 / 60,
+        "Wheel Load Dist": 45,
+        "Peak Loading Cycles": 1000
+    },
+    "Supports": {},
+}
+
+SPAN_TABLE_COLUMNS = [
+    "Designation", "Steel Grade", "Mass", "Hoisting Class", "MRC", "Arrangement",
+    "Span", "Cantilever", "Governing", "Evaluations"
+]
+
+
+def span_table(
+        output_path: str,
+        sections: tuple=None,
+        steel_grades: tuple=("250", "300", "350", "400"),
+        hoisting_classes: tuple=("HC1", "HC2", "HC3", "HC4"),
+        capacities: tuple=(0.5, 1.0, 2.0, 3.0, 5.0),
+        arrangement: str="span",
+        backspan_ratio: float=2.5,
+        length_range: tuple=(500, 20000),
+        resolution: float=10,
+        base_inputs: dict=None,
+        cf_bf: float=0.9,
+        K_L: float=1.3,
+        max_workers: int=None
+) -> Path:
+    """
+    Writes a span table of the maximum permissible length of every section,
+    steel grade, hoisting class and maximum rated capacity (MRC) to
+    'output_path' and returns the path. The table is written as Parquet if
+    'output_path' ends with '.parquet' (requires pyarrow), otherwise as CSV.
+
+    The sections are searched in parallel in a process pool and the rows of
+    each section are written as soon as its search is complete, so the rows are
+    grouped by section in the order the searches finish.
+
+    Args:
+        output_path: The file the span table is written to.
+        sections: The section designations to tabulate. Defaults to the whole
+            sections catalog.
+        steel_grades: The steel grades to tabulate. Grades that are not
+            produced for a section are skipped.
+        hoisting_classes: The AS 1418.18 hoisting classes to tabulate.
+        capacities: The MRCs (t) to tabulate.
+        arrangement: 'span' for a single simply supported span, or
+            'cantilever' for a cantilever with a backspan of 'backspan_ratio'
+            times the cantilever length.
+        backspan_ratio: The backspan to cantilever length ratio for the
+            'cantilever' arrangement.
+        length_range: The (min, max) span or cantilever lengths searched (mm).
+        resolution: The lengths are rounded down to a multiple of this (mm).
+        base_inputs: The app inputs for the project details, hoist self-weight
+            and hoist data. Defaults to DEFAULT_INPUTS.
+        cf_bf: The ratio of C_F to B_F for the local checks.
+        K_L: The load position factor for the local checks.
+        max_workers: The number of worker processes. Defaults to the number of
+            processors.
+
+    The table has one row per case with the columns:
+        'Designation', 'Steel Grade', 'Mass', 'Hoisting Class', 'MRC',
+        'Arrangement', 'Span' and 'Cantilever' (mm, the maximum permissible
+        lengths, NaN if no length within 'length_range' passes), 'Governing'
+        (the check that limits the length, None if the maximum length of
+        'length_range' passes) and 'Evaluations' (the number of analyses run).
+
+    """
+    if arrangement not in ("span", "cantilever"):
+        raise ValueError(f"The arrangement '{arrangement}' must be 'span' or 'cantilever'.")
+    base_inputs = DEFAULT_INPUTS if base_inputs is None else base_inputs
+    catalog = sections_db.sections_catalog()
+    if sections is None:
+        sections = [name for names in catalog.families.values() for name in names]
+    sections_df = catalog.df.iloc[[catalog.index[name] for name in sections]]
+    grades_df = beam_design.catalog_capacities(sections_df, steel_grades)
+    grades_df = grades_df.loc[grades_df['f_y'].notna()]
+    search_options = {
+        "hoisting_classes": tuple(hoisting_classes),
+        "capacities": tuple(sorted(capacities)),
+        "arrangement": arrangement,
+        "backspan_ratio": backspan_ratio,
+        "length_range": length_range,
+        "resolution": resolution,
+        "base_inputs": base_inputs,
+        "cf_bf": cf_bf,
+        "K_L": K_L
+    }
+
+    output_path = Path(output_path)
+    with _table_writer(output_path) as write_rows:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(section_spans, designation, tuple(group['Steel Grade']), **search_options)
+                for designation, group in grades_df.groupby('Designation', sort=False)
+            ]
+            for future in as_completed(futures):
+                write_rows(future.result())
+    return output_path
+
+
+def section_spans(
+        designation: str,
+        steel_grades: tuple,
+        hoisting_classes: tuple,
+        capacities: tuple,
+        arrangement: str,
+        backspan_ratio: float,
+        length_range: tuple,
+        resolution: float,
+        base_inputs: dict,
+        cf_bf: float,
+        K_L: float
+) -> list[dict]:
+    """
+    Returns a list of the span table rows of the section 'designation' for each
+    of the 'steel_grades', 'hoisting_classes' and 'capacities'. See
+    'span_table' for the arguments and the keys of the rows.
+
+    The utilisation is assumed to increase with the length and the MRC. The
+    MRCs are searched in ascending order, so the first failing length of each
+    MRC is the upper bound of the search of the next.
+    """
+    catalog = sections_db.sections_catalog()
+    mass = catalog.section(designation)['Mass']
+    rows = []
+    for steel_grade in steel_grades:
+        for hoisting_class in hoisting_classes:
+            max_length = length_range[1]
+            for mrc in capacities:
+                app_inputs = dict(base_inputs)
+                app_inputs["Loads"] = dict(base_inputs["Loads"], Q_load=mrc * 9.81)
+                app_inputs["Hoist Data"] = dict(base_inputs["Hoist Data"], HC_Class=hoisting_class)
+                app_inputs["Steel Data"] = {"Steel Grade": steel_grade, "Section Size": designation}
+                length, governing, evaluations = max_permissible_length(
+                    app_inputs, arrangement, backspan_ratio, (length_range[0], max_length), resolution, cf_bf, K_L
+                )
+                # A length that fails for this MRC fails for the heavier ones
+                if length is not None:
+                    max_length = min(length + resolution, length_range[1])
+                span, cantilever = _arrangement_lengths(arrangement, length, backspan_ratio)
+                rows.append({
+                    "Designation": designation,
+                    "Steel Grade": steel_grade,
+                    "Mass": mass,
+                    "Hoisting Class": hoisting_class,
+                    "MRC": mrc,
+                    "Arrangement": arrangement,
+                    "Span": span,
+                    "Cantilever": cantilever,
+                    "Governing": governing,
+                    "Evaluations": evaluations
+                })
+    return rows
+
+
+def max_permissible_length(
+        app_inputs: dict,
+        arrangement: str,
+        backspan_ratio: float,
+        length_range: tuple,
+        resolution: float,
+        cf_bf: float=0.9,
+        K_L: float=1.3
+) -> tuple:
+    """
+    Returns the maximum span or cantilever length (mm) within 'length_range'
+    that passes all of the checks of 'mba_mod.section_utilisation' for the
+    section, steel grade and loads in 'app_inputs'. The length is found by
+    bisection and rounded down to a multiple of 'resolution'.
+
+    Returns:
+        tuple(length, governing, evaluations) of the maximum length (None if the
+        minimum length fails), the name of the check that fails beyond it
+        (None if the maximum length passes) and the number of analyses run.
+
+    """
+    evaluations = 0
+
+    def governing_check(step: int) -> str:
+        nonlocal evaluations
+        evaluations += 1
+        span, cantilever = _arrangement_lengths(arrangement, step * resolution, backspan_ratio)
+        if arrangement == "span":
+            geometry = {"Span 1": {"Span": span, "Restraint": "FF"}}
+        else:
+            geometry = {"Span 1": {"Span": span, "Restraint": "FF"}, "Span 2": {"Span": cantilever, "Restraint": "FU"}}
+        case_inputs = dict(app_inputs, **{"Geometry": geometry, "Cantilever": arrangement == "cantilever"})
+        utilisation = mba_mod.section_utilisation(case_inputs, cf_bf, K_L)
+        check, val = max(utilisation.items(), key=lambda item: item[1])
+        return None if val <= 1.0 else check
+
+    # The search is made over integer multiples of 'resolution'. 'lo' always
+    # passes and 'hi' always fails.
+    lo = math.ceil(length_range[0] / resolution)
+    hi = math.floor(length_range[1] / resolution)
+    governing = governing_check(lo)
+    if governing is not None:
+        return None, governing, evaluations
+    governing = governing_check(hi) if hi > lo else None
+    if governing is None:
+        return hi * resolution, None, evaluations
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        mid_governing = governing_check(mid)
+        if mid_governing is None:
+            lo = mid
+        else:
+            hi, governing = mid, mid_governing
+    return lo * resolution, governing, evaluations
+
+
+def _arrangement_lengths(arrangement: str, length: float, backspan_ratio: float) -> tuple:
+    """
+    Returns the (span, cantilever) lengths (mm) of the 'arrangement' for the
+    searched 'length'. NaN lengths are returned if 'length' is None.
+    """
+    if length is None:
+        return math.nan, math.nan
+    if arrangement == "span":
+        return length, 0.0
+    return backspan_ratio * length, length
+
+
+@contextmanager
+def _table_writer(output_path: Path) -> Iterator[Callable]:
+    """
+    Context manager yielding a function that appends a list of span table rows
+    to the CSV or Parquet file at 'output_path'.
+    """
+    if output_path.suffix != ".parquet":
+        output_path.write_text("")
+        header = True
+
+        def write_csv(rows: list[dict]) -> None:
+            nonlocal header
+            if len(rows) != 0:
+                pd.DataFrame(rows, columns=SPAN_TABLE_COLUMNS).to_csv(output_path, mode="a", header=header, index=False)
+                header = False
+
+        yield write_csv
+        return
+
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("Writing Parquet span tables requires 'pyarrow'. Use a '.csv' file instead.")
+    types = {"Mass": pyarrow.float64(), "MRC": pyarrow.float64(), "Span": pyarrow.float64(),
+             "Cantilever": pyarrow.float64(), "Evaluations": pyarrow.int64()}
+    schema = pyarrow.schema([(column, types.get(column, pyarrow.string())) for column in SPAN_TABLE_COLUMNS])
+
+    def write_parquet(rows: list[dict]) -> None:
+        if len(rows) != 0:
+            df = pd.DataFrame(rows, columns=SPAN_TABLE_COLUMNS)
+            writer.write_table(pyarrow.Table.from_pandas(df, schema=schema, preserve_index=False))
+
+    with pyarrow.parquet.ParquetWriter(output_path, schema) as writer:
+        yield write_parquet
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generates monorail beam span tables for the sections catalog.")
+    parser.add_argument("output_path", help="The '.csv' or '.parquet' file the span table is written to.")
+    parser.add_argument("--sections", nargs="+", help="Section designations. Defaults to the whole catalog.")
+    parser.add_argument("--grades", nargs="+", default=["250", "300", "350", "400"])
+    parser.add_argument("--hoisting-classes", nargs="+", default=["HC1", "HC2", "HC3", "HC4"])
+    parser.add_argument("--capacities", nargs="+", type=float, default=[0.5, 1.0, 2.0, 3.0, 5.0], help="MRCs (t)")
+    parser.add_argument("--arrangement", choices=["span", "cantilever"], default="span")
+    parser.add_argument("--backspan-ratio", type=float, default=2.5)
+    parser.add_argument("--length-range", nargs=2, type=float, default=[500, 20000], help="Min and max lengths (mm)")
+    parser.add_argument("--resolution", type=float, default=10, help="Length resolution (mm)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--lookup", help="Also writes the lookup tables with these span limits to this '.npz' file.")
+    args = parser.parse_args()
+    output_path = span_table(
+        args.output_path,
+        sections=args.sections,
+        steel_grades=tuple(args.grades),
+        hoisting_classes=tuple(args.hoisting_classes),
+        capacities=tuple(args.capacities),
+        arrangement=args.arrangement,
+        backspan_ratio=args.backspan_ratio,
+        length_range=tuple(args.length_range),
+        resolution=args.resolution,
+        max_workers=args.workers
+    )
+    if args.lookup:
+        span_inputs = dict(DEFAULT_INPUTS, length_range=args.length_range, resolution=args.resolution)
+        table = pd.read_csv(output_path, dtype={"Steel Grade": str})
+        lookup_tables.build_lookup_tables(args.lookup, span_table=table, span_inputs=span_inputs)
@@ -2,4 +2,34 @@ import os
 import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from monorail_beam import beam_design, monorail_design, material_prop, sections_db, utils
\ No newline at end of file
+from monorail_beam import beam_design, monorail_design, material_prop, sections_db, utils
+from monorail_beam import beam_analysis, beam_solver, disk_cache, influence_lines, lookup_tables, pipeline, tracing
+import monorail_batch
+import monorail_beam_app_module as mba_mod
+import monorail_span_tables
+
+
+BEAM_MODEL_DATA = {'L': [4.0, 4.0, 2.0], 'EI': 37561.0, 'R': [-1, 0, -1, 0, -1, 0, 0, 0]}
+G_LOAD = [[1, 1, 0.5, 0, 0], [2, 1, 0.5, 0, 0], [3, 1, 0.5, 0, 0]]
+
+
+def monorail_inputs(beam_name="MB1", section_size="410 UB 53.7", spans=(4000, 4000), cantilever=2000, steel_grade="300"):
+    geometry = {f"Span {idx + 1}": {"Span": span, "Restraint": "FF"} for idx, span in enumerate(spans)}
+    if cantilever:
+        geometry.update({"Cantilever": {"Span": cantilever, "Restraint": "FU"}})
+    return {
+        "Project Details": {"Project No": "P001", "Project Name": "Site", "Beam Name": beam_name},
+        "Loads": {"G_load": 300 * 9.81e-3, "Q_load": 1.0 * 9.81},
+        "Load Position": 3000,
+        "Hoist Data": {
+            "HD_Class": "HD1",
+            "HC_Class": "HC2",
+            "Max Steady Hoist Speed": 20 / 60,
+            "Steady Hoist Creep Speed": 2 / 60,
+            "Wheel Load Dist": 45,
+            "Peak Loading Cycles": 1000
+        },
+        "Geometry": geometry,
+        "Cantilever": bool(cantilever),
+        "Steel Data": {"Steel Grade": steel_grade, "Section Size": section_size}
+    }
@@ -1,7 +1,9 @@
+import dataclasses
 import math
+import numpy as np
 import pytest
 # from monorail_beam import beam_design
-from .context import beam_design
+from .context import beam_design, sections_db
 
 
 def test_element_slenderness():
@@ -87,4 +89,64 @@ def test_member_moment_cap():
         alpha_m = 1.0,
         phi = 0.9
     )
-    assert math.isclose(test_1, 168900000, rel_tol=1e-5, abs_tol=1e-6)
\ No newline at end of file
+    assert math.isclose(test_1, 168900000, rel_tol=1e-5, abs_tol=1e-6)
+
+
+def test_catalog_capacities():
+    sections_df = sections_db.import_sections_db()
+    table = beam_design.catalog_capacities(sections_df, ("300", "350"), l_e=(4000,))
+    assert len(table) == 2 * len(sections_df)
+
+    row = table.loc[(table['Designation'] == "410 UB 53.7") & (table['Steel Grade'] == "300")].iloc[0]
+    sb = sections_db.create_steelbeam(
+        sections_db.sections_catalog().section("410 UB 53.7"), "300", "B1"
+    )
+    M_sx = sb.section_moment_capacity_x()
+    M_bx = beam_design.member_moment_cap(M_sx / 0.9, 4000, sb.I_y, sb.I_w, sb.J, sb.E, sb.G)
+    assert math.isclose(row['M_sx'], M_sx, rel_tol=1e-9)
+    assert math.isclose(row['M_sy'], sb.section_moment_capacity_y(), rel_tol=1e-9)
+    assert math.isclose(row['M_bx_4000'], M_bx, rel_tol=1e-9)
+
+    # Grade 350 is not produced as a welded section
+    welded_350 = table.loc[(table['Class'] == "HW") & (table['Steel Grade'] == "350")]
+    assert welded_350['M_sx'].isna().all()
+
+
+def test_steelbeam_cached_properties():
+    sb = sections_db.create_steelbeam(
+        sections_db.sections_catalog().section("410 UB 53.7"), "300", "B1"
+    )
+    M_sx = sb.section_moment_capacity_x()
+    assert sb.section_moment_capacity_x() is M_sx
+    assert math.isclose(
+        sb.member_moment_capacity_x(4000.0),
+        beam_design.member_moment_cap(M_sx / 0.9, 4000.0, sb.I_y, sb.I_w, sb.J, sb.E, sb.G),
+        rel_tol=1e-12
+    )
+    # Only the properties that do not depend on the effective length are cached
+    cache_size = len(sb._cache)
+    sb.member_moment_capacity_x(np.linspace(1000.0, 9000.0, 5))
+    sb.member_moment_capacity_x(5000.0)
+    assert len(sb._cache) == cache_size
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        sb.steel_grade = "350"
+
+
+def test_moment_mod_factor():
+    alpha_m = beam_design.moment_mod_factor(
+        M_m=np.array([100.0, 100.0]),
+        M_2=np.array([100.0, 10.0]),
+        M_3=np.array([100.0, 0.0]),
+        M_4=np.array([100.0, 10.0])
+    )
+    assert np.allclose(alpha_m, [1.7 / math.sqrt(3), 2.5])
+
+
+def test_web_shear_cap():
+    # Shear yield governs
+    V_v1 = beam_design.web_shear_cap(d_p=380.8, t_w=7.6, f_y=320.0, A_w=402.6 * 7.6)
+    assert math.isclose(V_v1, 0.9 * 0.6 * 320.0 * 402.6 * 7.6, rel_tol=1e-9)
+    # Shear buckling governs
+    V_v2 = beam_design.web_shear_cap(d_p=1120.0, t_w=10.0, f_y=300.0, A_w=1120.0 * 10.0)
+    alpha_v = (82 / (112.0 * math.sqrt(300.0 / 250))) ** 2
+    assert math.isclose(V_v2, 0.9 * alpha_v * 0.6 * 300.0 * 1120.0 * 10.0, rel_tol=1e-9)
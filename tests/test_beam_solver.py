@@ -0,0 +1,119 @@
+import math
+import numpy as np
+from .context import BEAM_MODEL_DATA, G_LOAD, beam_analysis, beam_solver, influence_lines
+
+
+def test_static_beam_model():
+    for load_pos in [0.0, 3.0, 4.0, 9.5]:
+        pycba_res = beam_analysis.static_beam_model(BEAM_MODEL_DATA, G_LOAD, 20.0, load_pos, n_points=100)
+        solver_res = beam_solver.static_beam_model(BEAM_MODEL_DATA, G_LOAD, 20.0, load_pos, n_points=100)
+        assert np.allclose(pycba_res["Matrixes"]["Moment"], solver_res["Matrixes"]["Moment"])
+        assert np.allclose(pycba_res["Matrixes"]["Shear"], solver_res["Matrixes"]["Shear"])
+        assert np.allclose(pycba_res["Critical Values"]["Reactions"], solver_res["Critical Values"]["Reactions"])
+
+
+def test_env_beam_model():
+    pycba_res = beam_analysis.env_beam_model(BEAM_MODEL_DATA, G_LOAD, 20.0, n_points=100)
+    solver_res = beam_solver.env_beam_model(BEAM_MODEL_DATA, G_LOAD, 20.0, n_points=100)
+    for key in ["Mmax", "Mmin", "Vmax", "Vmin"]:
+        assert np.allclose(pycba_res["Matrixes"][key], solver_res["Matrixes"][key])
+    assert math.isclose(solver_res["Critical Values"]["Mmin"]["val"], -41.0, rel_tol=1e-9)
+    assert math.isclose(solver_res["Critical Values"]["Rmax2"]["val"], 34.5625, rel_tol=1e-9)
+
+
+def test_cantilever_tip_deflection():
+    # Point load at the tip of a cantilever with a pinned backspan
+    L_b, L_c, EI, P = 4.0, 2.0, 1000.0, 10.0
+    solver_res = beam_solver.static_beam_model(
+        {'L': [L_b, L_c], 'EI': EI, 'R': [-1, 0, -1, 0, 0, 0]}, [], P, L_b + L_c, n_points=50
+    )
+    D_tip = -P * L_c ** 2 * (L_b + L_c) / (3 * EI)
+    assert math.isclose(solver_res["Matrixes"]["Deflections"][-1], D_tip, rel_tol=1e-9)
+
+
+def test_combo_beam_models():
+    G_unit = [[1, 1, 1.0, 0, 0], [2, 1, 1.0, 0, 0], [3, 1, 1.0, 0, 0]]
+    load_cases = {"LC1": {"G": 0.5, "Q": 20.0}, "LC2": {"G": 1.2, "Q": 35.0}}
+    static_res, env_res = beam_solver.combo_beam_models(BEAM_MODEL_DATA, G_unit, load_cases, 3.0, n_points=100)
+    for lc_name, factors in load_cases.items():
+        G_load = [[span, 1, factors["G"], 0, 0] for span in [1, 2, 3]]
+        static_acc = beam_solver.static_beam_model(BEAM_MODEL_DATA, G_load, factors["Q"], 3.0, n_points=100)
+        env_acc = beam_solver.env_beam_model(BEAM_MODEL_DATA, G_load, factors["Q"], n_points=100)
+        assert np.allclose(static_res[lc_name]["Matrixes"]["Moment"], static_acc["Matrixes"]["Moment"])
+        assert np.allclose(env_res[lc_name]["Matrixes"]["Mmax"], env_acc["Matrixes"]["Mmax"])
+        assert math.isclose(
+            env_res[lc_name]["Critical Values"]["Vmin"]["val"],
+            env_acc["Critical Values"]["Vmin"]["val"]
+        )
+
+
+def test_batch_static_beam_model():
+    load_pos = np.array([0.5, 3.0, 7.25, 9.0])
+    batch_res = beam_solver.batch_static_beam_model(BEAM_MODEL_DATA, G_LOAD, 20.0, load_pos, n_points=100)
+    assert batch_res["Matrixes"]["Moment"].shape == (4, 3 * 103)
+    for pos_idx, pos in enumerate(load_pos):
+        static_res = beam_solver.static_beam_model(BEAM_MODEL_DATA, G_LOAD, 20.0, pos, n_points=100)
+        selected = beam_solver.select_static_results(batch_res, pos)
+        assert np.allclose(batch_res["Matrixes"]["Deflections"][pos_idx], static_res["Matrixes"]["Deflections"])
+        assert np.allclose(selected["Matrixes"]["Shear"], static_res["Matrixes"]["Shear"])
+        assert np.allclose(selected["Critical Values"]["Moment"], static_res["Critical Values"]["Moment"])
+
+
+def test_adaptive_env_beam_model():
+    uniform_res = beam_solver.env_beam_model(BEAM_MODEL_DATA, G_LOAD, 20.0, n_points=100)
+    adaptive_res = beam_solver.adaptive_env_beam_model(BEAM_MODEL_DATA, G_LOAD, 20.0, n_points=100)
+    for key in ["Mmax", "Mmin", "Vmax", "Vmin", "Dmax", "Dmin", "Rmax1", "Rmax2"]:
+        assert math.isclose(
+            adaptive_res["Critical Values"][key]["val"],
+            uniform_res["Critical Values"][key]["val"],
+            rel_tol=1e-4
+        )
+    assert adaptive_res["Evaluations"]["positions"] < 201 / 2
+
+
+def test_exact_critical_values():
+    beam_model_data = {'L': [6.3], 'EI': 37561.0, 'R': [-1, 0, -1, 0]}
+    G_load = [[1, 1, 0.5, 0, 0]]
+    static_res = beam_solver.static_beam_model(beam_model_data, G_load, 20.0, 3.15, n_points=7, exact=True)
+    M_max = 20.0 * 6.3 / 4 + 0.5 * 6.3 ** 2 / 8
+    D_min = -(20.0 * 6.3 ** 3 / 48 + 5 * 0.5 * 6.3 ** 4 / 384) / 37561.0 * 1000
+    assert math.isclose(static_res["Critical Values"]["Moment"][0], M_max, rel_tol=1e-9)
+    assert math.isclose(static_res["Critical Values"]["Deflections"][1], D_min, rel_tol=1e-9)
+    env_res = beam_solver.env_beam_model(beam_model_data, G_load, 20.0, n_points=7, exact=True)
+    assert math.isclose(env_res["Critical Values"]["Mmax"]["val"], M_max, rel_tol=1e-9)
+    assert math.isclose(env_res["Critical Values"]["Mmax"]["at"], 3.15, rel_tol=1e-9)
+
+
+def test_analysis_session():
+    session = beam_solver.analysis_session(BEAM_MODEL_DATA, n_points=100)
+    assert beam_solver.analysis_session(dict(BEAM_MODEL_DATA), n_points=100) is session
+    fresh_res = beam_solver.env_beam_model(
+        BEAM_MODEL_DATA, G_LOAD, 20.0, il=beam_solver.create_influence_lines(BEAM_MODEL_DATA, n_points=100)
+    )
+    session_res = beam_solver.env_beam_model(BEAM_MODEL_DATA, G_LOAD, 20.0, n_points=100)
+    assert np.allclose(fresh_res["Matrixes"]["Mmax"], session_res["Matrixes"]["Mmax"])
+
+
+def test_many_spans_with_cantilevers():
+    L = [1.5] + [6.0] * 12 + [1.2]
+    R = [0, 0] + [-1, 0] * 13 + [0, 0]
+    closed_form = beam_solver.ClosedFormInfluenceLines(L, 37561.0, R, n_points=20, step=0.25)
+    stiffness = influence_lines.InfluenceLines(L, 37561.0, R, n_points=20, step=0.25)
+    for cf_res, st_res in zip(
+            (closed_form.M, closed_form.V, closed_form.D, closed_form.Rxn),
+            (stiffness.M, stiffness.V, stiffness.D, stiffness.Rxn)
+    ):
+        assert np.allclose(cf_res, st_res, atol=1e-12)
+    assert closed_form.Rxn.shape[1] == 13
+
+
+def test_hoist_moments():
+    load_pos, M = beam_solver.hoist_moments(BEAM_MODEL_DATA, G_LOAD, 20.0, n_points=100)
+    assert M.shape == load_pos.shape
+    for pos_idx in [0, 30, len(load_pos) // 2, len(load_pos) - 1]:
+        pos = load_pos[pos_idx]
+        static_res = beam_solver.static_beam_model(BEAM_MODEL_DATA, G_LOAD, 20.0, pos, n_points=100)
+        x_dist = np.asarray(static_res["Matrixes"]["x_dist"])
+        moment = np.asarray(static_res["Matrixes"]["Moment"])
+        at_pos = np.isclose(x_dist, pos)
+        assert np.allclose(moment[at_pos], M[pos_idx], atol=1e-9)
@@ -0,0 +1,51 @@
+import numpy as np
+from .context import BEAM_MODEL_DATA, G_LOAD, beam_solver, disk_cache
+
+
+def test_cache_round_trip(tmp_path):
+    cache = disk_cache.DiskCache(tmp_path)
+    results = {"Matrixes": {"M": np.arange(3.0)}, "Critical Values": {"val": np.float64(2.5), "pos": [1.0], "n": 3}}
+    cache.put("key", (results, {}))
+    cached_results, empty = cache.get("key")
+    assert empty == {}
+    assert np.array_equal(cached_results["Matrixes"]["M"], results["Matrixes"]["M"])
+    assert cached_results["Critical Values"] == {"val": 2.5, "pos": [1.0], "n": 3}
+    assert cache.get("missing") is None
+    assert disk_cache.cache_key("f", ([1.0, 2.0], 3)) == disk_cache.cache_key("f", (np.array([1.0, 2.0]), 3))
+
+
+def test_cache_eviction(tmp_path):
+    cache = disk_cache.DiskCache(tmp_path, max_bytes=20000)
+    for idx in range(10):
+        cache.put(f"key{idx}", np.random.default_rng(idx).random(500))
+    sizes = [path.stat().st_size for path in tmp_path.glob("*.npz")]
+    assert sum(sizes) <= 20000
+    assert cache.get("key9") is not None
+    assert cache.get("key0") is None
+
+
+def test_cached_solver_results(tmp_path):
+    uncached = beam_solver.env_beam_model(BEAM_MODEL_DATA, G_LOAD, 20.0, n_points=100, exact=True)
+    cache = disk_cache.configure(tmp_path)
+    try:
+        for _ in range(2):
+            cached = beam_solver.env_beam_model(BEAM_MODEL_DATA, G_LOAD, 20.0, n_points=100, exact=True)
+            assert np.allclose(cached["Matrixes"]["Mmax"], uncached["Matrixes"]["Mmax"])
+            assert cached["Critical Values"]["Mmin"]["val"] == uncached["Critical Values"]["Mmin"]["val"]
+    finally:
+        disk_cache.configure(None)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cached_results_code_version(tmp_path, monkeypatch):
+    assert disk_cache.code_version(beam_solver) == disk_cache.code_version(beam_solver)
+    cache = disk_cache.configure(tmp_path)
+    try:
+        beam_solver.env_beam_model(BEAM_MODEL_DATA, G_LOAD, 20.0, n_points=100, exact=True)
+        # A change to the code of the solver recalculates the cached results
+        monkeypatch.setattr(disk_cache, "code_version", lambda *modules: "0" * 64)
+        beam_solver.env_beam_model(BEAM_MODEL_DATA, G_LOAD, 20.0, n_points=100, exact=True)
+        beam_solver.env_beam_model(BEAM_MODEL_DATA, G_LOAD, 20.0, n_points=100, exact=True)
+    finally:
+        disk_cache.configure(None)
+    assert (cache.hits, cache.misses) == (1, 2)
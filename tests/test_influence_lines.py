@@ -0,0 +1,49 @@
+import math
+import numpy as np
+from .context import beam_analysis, influence_lines
+
+
+def test_influence_lines_simple_span():
+    il = influence_lines.InfluenceLines(L=[4.0], EI=1000.0, R=[-1, 0, -1, 0], n_points=100, step=0.5)
+    mid_pos = np.flatnonzero(np.isclose(il.pos, 2.0))[0]
+    assert math.isclose(il.M[mid_pos].max(), 1.0, rel_tol=1e-6) # PL/4
+    assert math.isclose(il.D[mid_pos].min(), -4.0 ** 3 / (48 * 1000.0), rel_tol=1e-6) # PL^3/48EI
+    assert np.allclose(il.Rxn.sum(axis=1), 1.0)
+
+
+def test_il_env_beam_model():
+    beam_model_data = {'L': [4.0, 3.0], 'EI': 37561.0, 'R': [-1, 0, -1, 0, 0, 0]}
+    G_load = [[1, 1, 0.5, 0, 0], [2, 1, 0.5, 0, 0]]
+    env_pycba = beam_analysis.env_beam_model(beam_model_data, G_load, 20.0, n_points=100)
+    env_il = beam_analysis.il_env_beam_model(beam_model_data, G_load, 20.0, n_points=100)
+    for key in ["Mmax", "Mmin", "Vmax", "Vmin"]:
+        assert np.allclose(env_pycba["Matrixes"][key], env_il["Matrixes"][key])
+        assert math.isclose(
+            env_pycba["Critical Values"][key]["val"], 
+            env_il["Critical Values"][key]["val"],
+            rel_tol=1e-9
+        )
+
+
+def test_locate_load_pos():
+    ends = influence_lines.span_ends([4.0, 4.0, 2.0])
+    span_idx, a_dist = influence_lines.locate_load_pos(np.array([0.0, 3.0, 4.0, 4.001, 9.5, 10.0]), ends)
+    assert list(span_idx) == [1, 1, 1, 2, 3, 3]
+    assert np.allclose(a_dist, [0.0, 3.0, 4.0, 0.001, 1.5, 2.0])
+    span_idx, a_dist = influence_lines.locate_load_pos(4.0, ends, side='right')
+    assert span_idx == 2 and a_dist == 0.0
+    assert beam_analysis.find_load_pos_for_PyCBA(8.0, [4.0, 4.0, 2.0]) == 2
+
+
+def test_piecewise_polynomials():
+    il = influence_lines.InfluenceLines(L=[4.0, 3.0], EI=1000.0, R=[-1, 0, -1, 0, 0, 0], n_points=50, step=None)
+    span_idx, a_dist = il.locate(np.array([1.3, 5.5]))
+    args = (np.full((2, 2), 0.5), np.array([20.0, 20.0]), span_idx - 1, a_dist)
+    M, V, D, _ = il.solve(*args)
+    M_poly, V_poly, D_poly = il.polynomials(*args)
+    cols = np.arange(1, 52) # First member, excluding the padding stations
+    assert np.allclose(M_poly(il.x[cols]), M[:, cols])
+    assert np.allclose(D_poly(il.x[cols]), D[:, cols])
+    max_val, max_at, _, _ = M_poly.extrema()
+    assert np.all(max_val >= M.max(axis=1) - 1e-9)
+    assert math.isclose(max_at[0], 1.3)
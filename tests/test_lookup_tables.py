@@ -0,0 +1,57 @@
+import math
+import numpy as np
+import pytest
+from .context import lookup_tables, sections_db
+
+
+def test_lookup_member_moment_capacity():
+    tables = lookup_tables.lookup_tables()
+    sb = sections_db.create_steelbeam(sections_db.sections_catalog().section("410 UB 53.7"), "300", "MB1")
+    for l_e in [200.0, 1234.0, 5000.0, 17500.0]:
+        M_bx = tables.member_moment_capacity_x("410 UB 53.7", "300", l_e)
+        assert math.isclose(M_bx, sb.member_moment_capacity_x(l_e), rel_tol=2e-3)
+    assert math.isclose(tables.section_moment_capacity_x("410 UB 53.7", "300"), sb.section_moment_capacity_x())
+    assert np.all(np.diff(tables.member_moment_capacity_x("410 UB 53.7", "300", np.geomspace(250, 30000, 200))) <= 0)
+    assert math.isnan(tables.member_moment_capacity_x("700 WB 115", "350", 4000.0))
+    assert math.isnan(tables.member_moment_capacity_x("700 WB 115", "300", 40000.0))
+
+
+def test_lookup_max_simple_span():
+    tables = lookup_tables.lookup_tables()
+    row = list(tables.designations).index("250 UC 72.9"), list(tables.steel_grades).index("300")
+    spans = tables.max_span[row][list(tables.hoisting_classes).index("HC2")]
+    assert tables.max_simple_span("250 UC 72.9", "300", "HC2", tables.capacities[0]) == spans[0]
+    mid_span = tables.max_simple_span("250 UC 72.9", "300", "HC2", tables.capacities[:2].mean())
+    assert spans[1] <= mid_span <= spans[0]
+    assert math.isnan(tables.max_simple_span("250 UC 72.9", "300", "HC2", 100.0))
+
+
+def test_lookup_tables_version(tmp_path):
+    path = lookup_tables.build_lookup_tables(tmp_path / "lookup.npz", steel_grades=("300",), l_e=[500.0, 5000.0])
+    assert lookup_tables.lookup_tables(path).M_bx.shape[1:] == (1, 2)
+    with np.load(path) as data:
+        tables = dict(data)
+    np.savez(path, **dict(tables, version=lookup_tables.LOOKUP_VERSION + 1))
+    lookup_tables.lookup_tables.cache_clear()
+    with pytest.raises(ValueError):
+        lookup_tables.lookup_tables(path)
+    np.savez(path, **dict(tables, capacity_rules_sha256="0" * 64))
+    lookup_tables.lookup_tables.cache_clear()
+    with pytest.raises(ValueError, match="capacity rules"):
+        lookup_tables.lookup_tables(path)
+
+
+def test_lookup_span_rules(tmp_path):
+    path = tmp_path / "lookup.npz"
+    with np.load(lookup_tables.LOOKUP_PATH) as data:
+        tables = dict(data)
+    assert str(tables["span_rules_sha256"]) == lookup_tables.span_rules_sha256()
+
+    # Span limits found with different checks are dropped, the capacities are kept
+    np.savez(path, **dict(tables, span_rules_sha256="0" * 64))
+    stale = lookup_tables.lookup_tables(path)
+    assert stale.max_span.size == 0
+    with pytest.raises(KeyError):
+        stale.max_simple_span("250 UC 72.9", "300", "HC2", 1.0)
+    assert stale.section_moment_capacity_x("410 UB 53.7", "300") == \
+        lookup_tables.lookup_tables().section_moment_capacity_x("410 UB 53.7", "300")
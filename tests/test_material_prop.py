@@ -1,4 +1,5 @@
 import math
+import numpy as np
 import pytest
 from .context import material_prop
 
@@ -22,4 +23,21 @@ def test_plate_tensile_strength():
 
     f_y_2 = '250'
     resi_stress_cat_2 = 'HW'
-    assert math.isclose(material_prop.plate_tensile_strength(f_y_2, resi_stress_cat_2), 410.0)
\ No newline at end of file
+    assert math.isclose(material_prop.plate_tensile_strength(f_y_2, resi_stress_cat_2), 410.0)
+
+
+def test_plate_yield_stress_table():
+    # Thickness limits of 'less than' and 'less than or equal to'
+    assert material_prop.plate_yield_stress('250', 40.0, 'HR') == 230.0
+    assert material_prop.plate_yield_stress('300', 11.0, 'HR') == 300.0
+    assert material_prop.plate_yield_stress('250', 8.0, 'HW') == 280.0
+
+    f_y = material_prop.plate_yield_stress(
+        np.array(['300', '300', '400', '350']),
+        np.array([10.0, 18.0, 16.0, 10.0]),
+        np.array(['HR', 'LW', 'HW', 'HW'])
+    )
+    np.testing.assert_array_equal(f_y[:3], [320.0, 300.0, 380.0])
+    assert np.isnan(f_y[3])
+    assert math.isnan(material_prop.plate_yield_stress('300', 90.0, 'HW'))
+    assert math.isnan(material_prop.plate_tensile_strength('400', 'HR'))
@@ -0,0 +1,108 @@
+import json
+import pandas as pd
+import pytest
+from .context import monorail_batch, monorail_inputs
+
+
+def single_span(beam_name, section_size, span=4000):
+    return monorail_inputs(beam_name, section_size, spans=(span,), cantilever=0)
+
+
+REGISTER = [
+    single_span("MB1", "250 UC 72.9"),
+    single_span("MB2", "200 UC 46.2"),
+    single_span("MB3", "999 UB 1.0"),
+]
+
+
+def write_csv_register(register, path):
+    def flatten(inputs, prefix=""):
+        for key, val in inputs.items():
+            if isinstance(val, dict):
+                yield from flatten(val, f"{prefix}{key}.")
+            else:
+                yield f"{prefix}{key}", val
+
+    pd.DataFrame([dict(flatten(app_inputs)) for app_inputs in register]).to_csv(path, index=False)
+
+
+@pytest.mark.parametrize("suffix", [".json", ".csv"])
+def test_verify_register(tmp_path, suffix):
+    register_path = tmp_path / f"register{suffix}"
+    if suffix == ".json":
+        register_path.write_text(json.dumps(REGISTER))
+    else:
+        write_csv_register(REGISTER, register_path)
+    register = monorail_batch.read_register(register_path)
+    assert register == REGISTER
+
+    results = monorail_batch.verify_register(register, max_workers=2)
+    assert list(results['Beam Name']) == ["MB1", "MB2", "MB3"]
+    assert list(results['Status']) == ["PASS", "FAIL", "ERROR"]
+    assert results.loc[0, 'Max Utilisation'] <= 1.0 < results.loc[1, 'Max Utilisation']
+    assert results.loc[1, 'Governing'] in monorail_batch.CHECKS
+    assert "999 UB 1.0" in results.loc[2, 'Error']
+    assert results['Error'][:2].isna().all()
+
+    # The results round trip through the results file
+    results_path = monorail_batch.write_results(results, tmp_path / f"results{suffix}")
+    if suffix == ".json":
+        read_back = pd.read_json(results_path, orient="records", dtype={"Steel Grade": str})
+    else:
+        read_back = pd.read_csv(results_path, dtype={"Steel Grade": str})
+    assert list(read_back.columns) == monorail_batch.RESULTS_COLUMNS
+    assert list(read_back['Status']) == list(results['Status'])
+    assert list(read_back['Steel Grade']) == ["300"] * 3
+    assert read_back['Max Utilisation'][:2].tolist() == pytest.approx(results['Max Utilisation'][:2].tolist())
+
+
+def test_verify_monorail_grade_not_produced():
+    app_inputs = single_span("MB4", "700 WB 115")
+    app_inputs["Steel Data"]["Steel Grade"] = "350"
+    result = monorail_batch.verify_monorail(app_inputs)
+    assert result['Status'] == "ERROR"
+    assert "not produced" in result['Error']
+
+
+def test_monorail_fingerprint():
+    app_inputs = single_span("MB1", "250 UC 72.9")
+    fingerprint = monorail_batch.monorail_fingerprint(app_inputs)
+    assert monorail_batch.monorail_fingerprint(json.loads(json.dumps(app_inputs))) == fingerprint
+
+    # The project details and hoist position do not affect the checks
+    renamed = dict(app_inputs, **{"Project Details": {"Beam Name": "MB9"}, "Load Position": 2000})
+    assert monorail_batch.monorail_fingerprint(renamed) == fingerprint
+
+    heavier = dict(app_inputs, Loads=dict(app_inputs["Loads"], Q_load=2.0 * 9.81))
+    assert monorail_batch.monorail_fingerprint(heavier) != fingerprint
+    assert monorail_batch.monorail_fingerprint(app_inputs, cf_bf=0.8) != fingerprint
+    assert monorail_batch.monorail_fingerprint(single_span("MB1", "250 UC 89.5")) != fingerprint
+
+
+def test_verify_register_reuses_unchanged_results(tmp_path):
+    previous = monorail_batch.verify_register(REGISTER, max_workers=1)
+    # Marks the previous results, so reused rows can be told apart
+    previous['Max Utilisation'] = [0.5, 2.0, None]
+
+    register = [
+        dict(REGISTER[0], **{"Project Details": {"Beam Name": "MB1A"}}),
+        single_span("MB2", "200 UC 46.2", span=3000),
+        REGISTER[2],
+    ]
+    results = monorail_batch.verify_register(register, max_workers=1, previous=previous)
+    # The renamed monorail is reused with its new name
+    assert results.loc[0, 'Max Utilisation'] == 0.5
+    assert results.loc[0, 'Beam Name'] == "MB1A"
+    assert results.loc[0, 'Fingerprint'] == previous.loc[0, 'Fingerprint']
+    # The changed monorail and the previous error are verified again
+    assert results.loc[1, 'Max Utilisation'] != 2.0
+    assert results.loc[1, 'Fingerprint'] != previous.loc[1, 'Fingerprint']
+    assert results.loc[2, 'Status'] == "ERROR"
+
+    # Results are reused from a results file
+    for suffix in (".csv", ".json"):
+        results_path = monorail_batch.write_results(previous, tmp_path / f"results{suffix}")
+        reread = monorail_batch.read_results(results_path)
+        assert list(reread['Fingerprint']) == list(previous['Fingerprint'])
+        results = monorail_batch.verify_register(REGISTER[:2], max_workers=1, previous=reread)
+        assert list(results['Max Utilisation']) == [0.5, 2.0]
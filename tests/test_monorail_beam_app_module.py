@@ -0,0 +1,131 @@
+import math
+import numpy as np
+from .context import beam_solver, mba_mod, monorail_inputs, sections_db
+
+
+def test_lightest_section():
+    app_inputs = monorail_inputs(spans=(6000,), cantilever=0)
+    result = mba_mod.lightest_section(app_inputs, beam_types=("UB", "UC"))
+    steel_data = {"Steel Grade": result['Steel Grade'], "Section Size": result['Section Size']}
+    utilisation = mba_mod.section_utilisation(dict(app_inputs, **{"Steel Data": steel_data}))
+    assert max(utilisation.values()) <= 1.0
+    assert utilisation == result['Utilisation']
+    assert result['Evaluations']['analysed'] < result['Evaluations']['screened'] < result['Evaluations']['candidates']
+
+    # The next lighter section of the same family fails
+    catalog = sections_db.sections_catalog()
+    family = next(names for names in catalog.families.values() if result['Section Size'] in names)
+    lighter = [name for name in family if catalog.section(name)['Mass'] < result['Mass']]
+    next_lighter = max(lighter, key=lambda name: catalog.section(name)['Mass'])
+    steel_data = {"Steel Grade": result['Steel Grade'], "Section Size": next_lighter}
+    utilisation = mba_mod.section_utilisation(dict(app_inputs, **{"Steel Data": steel_data}))
+    assert max(utilisation.values()) > 1.0
+
+
+def test_segment_moments_alpha_m():
+    # Simply supported span of 6 m with a central point load of 10 kN:
+    # M_m = M_3 = PL/4 = 15 kNm and M_2 = M_4 = PL/8 = 7.5 kNm
+    x = np.linspace(0.0, 6.0, 601)
+    M = np.where(x <= 3.0, 5.0 * x, 5.0 * (6.0 - x))[None, :]
+    M_m, M_2, M_3, M_4 = mba_mod.segment_moments(M, x, 0.0, 6.0)
+    assert np.allclose([M_m[0], M_2[0], M_3[0], M_4[0]], [15.0, 7.5, 15.0, 7.5])
+    alpha_m = mba_mod.beam_design.moment_mod_factor(M_m, M_2, M_3, M_4)
+    assert math.isclose(alpha_m[0], 1.7 * 15.0 / math.sqrt(7.5 ** 2 + 15.0 ** 2 + 7.5 ** 2))
+
+
+def test_bending_checks_alpha_m():
+    app_inputs = monorail_inputs(spans=(6000,), cantilever=0)
+    static_results, env_results, sb_data = mba_mod.run_analysis(app_inputs)
+    result = mba_mod.bending_checks(app_inputs, sb_data)["Span 1"]
+
+    # ULS moments of the self-weight UDL and the hoist point load at the
+    # governing hoist position 'a', at the quarter points of the span
+    hoist_data = app_inputs['Hoist Data']
+    load_combos = mba_mod.monorail_load_combos(
+        hoist_data['HD_Class'], hoist_data['HC_Class'],
+        hoist_data['Max Steady Hoist Speed'], hoist_data['Steady Hoist Creep Speed']
+    )
+    L, a = 6.0, result['Hoist Position']
+    w = load_combos['ULS']['G'] * sb_data.mass * 9.81e-3
+    P = mba_mod.monorail_design.factored_load(app_inputs['Loads'], load_combos)['ULS']
+
+    def moment(x):
+        return w * x * (L - x) / 2 + (P * (L - a) * x / L if x <= a else P * a * (L - x) / L)
+
+    M_m = max(moment(x) for x in np.linspace(0.0, L, 6001))
+    M_2, M_3, M_4 = (moment(L * frac) for frac in (0.25, 0.5, 0.75))
+    alpha_m = min(1.7 * M_m / math.sqrt(M_2 ** 2 + M_3 ** 2 + M_4 ** 2), 2.5)
+    assert math.isclose(result['M*'], M_m, rel_tol=1e-3)
+    assert math.isclose(result['alpha_m'], alpha_m, rel_tol=1e-3)
+    assert math.isclose(result['M_bx'], sb_data.member_moment_capacity_x(result['l_e'], alpha_m) * 1e-6, rel_tol=1e-3)
+    assert set(mba_mod.beam_capacity(app_inputs, sb_data)["Span 1"]) == {"l_e"}
+
+
+def test_run_analysis_hoist_position_cache():
+    mba_mod.clear_analysis_cache()
+    app_inputs = monorail_inputs()
+    static_results, env_results, sb_data = mba_mod.run_analysis(app_inputs)
+    before = mba_mod.analysis_cache_info()
+
+    # Moving the hoist only re-runs the static analysis
+    moved_static, moved_env, moved_sb = mba_mod.run_analysis(dict(app_inputs, **{"Load Position": 5000}))
+    after = mba_mod.analysis_cache_info()
+    for stage in ("section build", "load factoring", "envelope"):
+        assert after[stage].hits == before[stage].hits + 1
+        assert after[stage].misses == before[stage].misses
+    assert after["static"].misses == before["static"].misses + 1
+    assert moved_env is env_results and moved_sb is sb_data
+    assert not np.array_equal(
+        moved_static['SLS']['Matrixes']['Deflections'], static_results['SLS']['Matrixes']['Deflections']
+    )
+
+
+def test_design_pipeline_reruns():
+    design_pipeline = mba_mod.design_pipeline()
+    app_inputs = monorail_inputs()
+    design_pipeline.run(mba_mod.pipeline_inputs(app_inputs))
+
+    def rerun(app_inputs, **options):
+        before = design_pipeline.stage_stats()
+        design_pipeline.run(mba_mod.pipeline_inputs(app_inputs, **options))
+        after = design_pipeline.stage_stats()
+        return {name for name in after if after[name]["misses"] > before[name]["misses"]}
+
+    renamed = dict(app_inputs, **{"Project Details": dict(app_inputs["Project Details"], **{"Beam Name": "MB2"})})
+    assert rerun(renamed) == set()
+    assert rerun(app_inputs, cf_bf=0.8) == {"local checks", "utilisation"}
+    moved = dict(app_inputs, **{"Load Position": 5000})
+    assert rerun(moved, cf_bf=0.8) == {"static"}
+
+    # Another steel grade of the section does not change the analyses
+    regraded = rerun(dict(moved, **{"Steel Data": dict(moved["Steel Data"], **{"Steel Grade": "350"})}), cf_bf=0.8)
+    assert {"section", "beam model"} <= regraded
+    assert regraded.isdisjoint({"envelopes", "static", "uls batch", "wheel moments"})
+
+    # Inputs changed in place are detected
+    bending = design_pipeline.run(mba_mod.pipeline_inputs(app_inputs))["bending checks"]
+    app_inputs['Geometry']['Span 1']['Span'] = 8000
+    assert "uls batch" in rerun(app_inputs)
+    assert design_pipeline.run(mba_mod.pipeline_inputs(app_inputs))["bending checks"] != bending
+
+
+def test_global_utilisation_stations():
+    app_inputs = monorail_inputs()
+    static_results, env_results, sb_data = mba_mod.run_analysis(app_inputs)
+    segments = mba_mod.design_segments(app_inputs)
+    batch, segment_results = mba_mod.bending_per_position(app_inputs, sb_data)
+    x = env_results['ULS']['Matrixes']['x_dist']
+    assert np.array_equal(batch['Matrixes']['x_dist'], x)
+    bending = mba_mod.global_utilisation(env_results, batch, segment_results, segments, sb_data)['Bending']
+
+    # A batch sampled at other stations is mapped onto the envelope stations
+    load_combos, monorail_loads = mba_mod._design_loads(app_inputs)
+    str_beam_data = mba_mod.create_PyCBA_data(sb_data, app_inputs, load_combos)
+    coarse = beam_solver.batch_static_beam_model(
+        str_beam_data, str_beam_data['G_load']['ULS'], monorail_loads['ULS'], n_points=100
+    )
+    capacity_results = mba_mod.beam_capacity(app_inputs, sb_data)
+    coarse_results = mba_mod.segment_bending(coarse, segments, capacity_results, sb_data)
+    coarse_bending = mba_mod.global_utilisation(env_results, coarse, coarse_results, segments, sb_data)['Bending']
+    assert coarse_bending.shape == x.shape
+    assert math.isclose(coarse_bending.max(), bending.max(), rel_tol=0.02)
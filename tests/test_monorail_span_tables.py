@@ -0,0 +1,57 @@
+import pandas as pd
+import pytest
+from .context import mba_mod, monorail_span_tables
+
+
+def span_inputs(designation="250 UC 72.9", steel_grade="300", hoisting_class="HC2", mrc=1.0):
+    base_inputs = monorail_span_tables.DEFAULT_INPUTS
+    return dict(base_inputs, **{
+        "Loads": dict(base_inputs["Loads"], Q_load=mrc * 9.81),
+        "Hoist Data": dict(base_inputs["Hoist Data"], HC_Class=hoisting_class),
+        "Steel Data": {"Steel Grade": steel_grade, "Section Size": designation},
+        "Cantilever": False
+    })
+
+
+def test_max_permissible_length():
+    app_inputs = span_inputs()
+    length, governing, evaluations = monorail_span_tables.max_permissible_length(
+        app_inputs, "span", 2.5, (500, 20000), 10
+    )
+    assert length == pytest.approx(8440, abs=100)
+    assert governing in ("Bending", "Shear", "Deflection", "Flange", "Web")
+    assert evaluations < 20
+
+    # The length passes and the next length of the resolution fails the check
+    # that governs
+    for span, passes in ((length, True), (length + 10, False)):
+        geometry = {"Span 1": {"Span": span, "Restraint": "FF"}}
+        utilisation = mba_mod.section_utilisation(dict(app_inputs, Geometry=geometry))
+        assert (max(utilisation.values()) <= 1.0) == passes
+        if not passes:
+            assert max(utilisation, key=utilisation.get) == governing
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_span_table(tmp_path, suffix):
+    if suffix == ".parquet":
+        pytest.importorskip("pyarrow")
+    sections = ("250 UC 72.9", "200 UC 46.2")
+    output_path = monorail_span_tables.span_table(
+        tmp_path / f"span_table{suffix}",
+        sections=sections,
+        steel_grades=("300",),
+        hoisting_classes=("HC2",),
+        capacities=(0.5, 1.0),
+        max_workers=2
+    )
+    table = pd.read_csv(output_path) if suffix == ".csv" else pd.read_parquet(output_path)
+    # The rows of each section are written as its search completes
+    assert list(table.columns) == monorail_span_tables.SPAN_TABLE_COLUMNS
+    assert len(table) == 4
+    assert set(table['Designation']) == set(sections)
+    spans = table.set_index(['Designation', 'MRC'])['Span']
+    assert spans[("250 UC 72.9", 1.0)] == pytest.approx(8440, abs=100)
+    assert spans[("250 UC 72.9", 0.5)] >= spans[("250 UC 72.9", 1.0)]
+    # Cases without a permissible length report the check that fails
+    assert table.loc[table['Span'].isna(), 'Governing'].notna().all()
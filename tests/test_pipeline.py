@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+from .context import pipeline
+
+
+def make_pipeline(calls):
+    def record(name, func):
+        def stage_func(*args):
+            calls.append(name)
+            return func(*args)
+        return stage_func
+
+    return pipeline.Pipeline([
+        pipeline.Stage("total", record("total", lambda a, b: a + b), ("stiffness", "b")),
+        pipeline.Stage("stiffness", record("stiffness", lambda a: abs(a)), ("a",)),
+        pipeline.Stage("array", record("array", lambda total: np.arange(total)), ("total",)),
+        pipeline.Stage("sum", record("sum", lambda array, c: array.sum() * c), ("array", "c")),
+    ])
+
+
+def test_pipeline_recalculates_changed_stages():
+    calls = []
+    dag = make_pipeline(calls)
+    assert dag.run({"a": 2, "b": 3, "c": 1.0})["sum"] == 10.0
+    assert calls == ["stiffness", "total", "array", "sum"]
+
+    # Only the last stage depends on 'c'
+    calls.clear()
+    assert dag.run({"a": 2, "b": 3, "c": 2.0})["sum"] == 20.0
+    assert calls == ["sum"]
+
+    # 'stiffness' is recalculated but gives the same result
+    calls.clear()
+    dag.run({"a": -2, "b": 3, "c": 2.0})
+    assert calls == ["stiffness"]
+    assert dag.stage_stats()["array"] == {"hits": 2, "misses": 1}
+
+    # Only the stages the targets depend on are run
+    calls.clear()
+    assert dag.run({"a": 4, "b": 3}, targets=("total",)) == {"total": 7}
+    assert calls == ["stiffness", "total"]
+
+
+def test_pipeline_inputs_changed_in_place():
+    calls = []
+    dag = pipeline.Pipeline([
+        pipeline.Stage("length", lambda geometry: calls.append("length") or sum(geometry["spans"]), ("geometry",)),
+    ])
+    geometry = {"spans": [4.0, 4.0]}
+    assert dag.run({"geometry": geometry})["length"] == 8.0
+    assert dag.run({"geometry": geometry})["length"] == 8.0
+    assert calls == ["length"]
+
+    # The pipeline keeps a copy of its inputs, so changes made in place are detected
+    geometry["spans"][0] = 6.0
+    assert dag.run({"geometry": geometry})["length"] == 10.0
+    assert calls == ["length", "length"]
+
+
+def test_pipeline_errors():
+    with pytest.raises(ValueError):
+        pipeline.Pipeline([pipeline.Stage("x", abs, ("y",)), pipeline.Stage("y", abs, ("x",))])
+    dag = make_pipeline([])
+    with pytest.raises(KeyError):
+        dag.run({"a": 1, "b": 2})
+    with pytest.raises(KeyError):
+        dag.run({"a": 1, "b": 2}, targets=("missing",))
@@ -1,4 +1,5 @@
 import pandas as pd
+import pytest
 from .context import beam_design, sections_db
 # from .context import monorail_beam as mb
 
@@ -70,8 +71,25 @@ def test_create_steelbeam():
         r_1=11.4, 
         mass=53.7, 
         steel_grade='300', 
-        phi=(0.9,), 
+        phi=0.9, 
         resi_stress_cat='HR', 
         E=200000, 
         G=80000
-    )
\ No newline at end of file
+    )
+
+    # Welded sections are not produced in grade 350
+    with pytest.raises(ValueError, match="not produced"):
+        sections_db.create_steelbeam(sections_db.sections_catalog().section('700 WB 115'), '350', beam_name)
+
+
+def test_sections_catalog():
+    catalog = sections_db.sections_catalog()
+    assert sections_db.sections_catalog() is catalog
+    assert catalog.section('410 UB 53.7')['Ix'] == 187807278.0
+    assert catalog.section_list('UC')[0] == '310 UC 158'
+    assert len(catalog.section_list('UB')) == 28
+
+    # The DataFrame of import_sections_db is a copy of the catalog
+    df_test = sections_db.import_sections_db()
+    df_test.loc[df_test.index[0], 'Mass'] = -1
+    assert catalog.section(df_test['Designation'].iloc[0])['Mass'] == 125.0
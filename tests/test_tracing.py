@@ -0,0 +1,32 @@
+import math
+from .context import BEAM_MODEL_DATA, beam_design, beam_solver, tracing
+
+
+G_UNIT = [[1, 1, 1.0, 0, 0], [2, 1, 1.0, 0, 0], [3, 1, 1.0, 0, 0]]
+
+
+def test_tracing_values():
+    hooked = []
+    with tracing.tracing(hook=lambda stage, name, value: hooked.append(name)) as trace:
+        with tracing.stage("slenderness"):
+            beam_design.section_slenderness(144.0, 20.0, 300.0, 860.0, 12.0, 310.0, "HR", "x")
+    assert len(trace.get("lambda_e")) == 2
+    assert math.isclose(trace.get("web_ratio", stage="slenderness")[0], 79.8046 / 115, rel_tol=1e-5)
+    assert hooked == [record["name"] for record in trace.values]
+
+    # Nothing is recorded once tracing is off
+    beam_design.element_slenderness(300.0, 10.0, 320.0)
+    assert len(trace.get("lambda_e")) == 2
+    assert not tracing.tracing_active()
+
+
+def test_tracing_stages():
+    load_cases = {"SLS": {"G": 1.0, "Q": 20.0}, "ULS": {"G": 1.34, "Q": 35.0}}
+    with tracing.tracing() as trace:
+        with tracing.stage("analysis"):
+            beam_solver.combo_beam_models(BEAM_MODEL_DATA, G_UNIT, load_cases, 3.0, n_points=100)
+    summary = trace.summary()
+    assert summary["analysis"]["calls"] == 1
+    assert "analysis/SLS/envelope" in summary
+    assert "analysis/ULS/static" in summary
+    assert summary["analysis/ULS"]["total"] <= summary["analysis"]["total"]
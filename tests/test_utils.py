@@ -1,3 +1,4 @@
+import importlib.util
 import math
 from .context import utils
 
@@ -31,4 +32,20 @@ def test_round_down():
 
 def test_round_up():
     test_1 = utils.round_up(decimals=1, n=3.142)
-    assert math.isclose(test_1, 3.2, rel_tol=1e-6, abs_tol=1e-6)
\ No newline at end of file
+    assert math.isclose(test_1, 3.2, rel_tol=1e-6, abs_tol=1e-6)
+
+
+def test_code_sha256(tmp_path):
+    def load_module(name, source):
+        path = tmp_path / f"{name}.py"
+        path.write_text(source)
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    rule = load_module("rule", 'def f(x):\n    """Doubles x."""\n    return 2 * x\n')
+    documented = load_module("documented", '"""Rules."""\n\n\ndef f(x):\n    """Returns 2x."""\n    # Comment\n    return 2*x\n')
+    changed = load_module("changed", 'def f(x):\n    """Doubles x."""\n    return 3 * x\n')
+    assert utils.code_sha256(rule) == utils.code_sha256(documented)
+    assert utils.code_sha256(rule) != utils.code_sha256(changed)